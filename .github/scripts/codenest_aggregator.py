@@ -2,109 +2,822 @@
 """
 CodeNest Audit Aggregator
 Consolidates security findings from 84 repositories before output
+
+Repo caches are parsed in a worker pool with an incremental JSON reader
+(ijson when installed, otherwise a raw_decode scanner), and findings are
+streamed into the report instead of being collected in one list.
+
+Runs are incremental: ``.codenest-state/`` (``CODENEST_STATE_DIR``) keeps a
+manifest of each cache's size, mtime and sha256 with its partial summary,
+next to the repo's normalized findings, so only changed caches are parsed.
+Findings are deduplicated by hash, and ``findings.sqlite`` in the same
+directory tracks every hash across runs to tag findings new, recurring or
+resolved.
+
+Reports go through a selectable sink (``--format json|ndjson|columnar``,
+``--compress none|gzip|zstd``). ``iter_report`` streams findings back from
+any of them.
 """
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import os
+import re
 import json
+import gzip
 import hashlib
+import io
+import sqlite3
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+try:
+    import ijson  # optional: C-accelerated incremental JSON parsing
+except ImportError:
+    ijson = None
+
+try:
+    import zstandard  # optional: zstd-compressed reports
+except ImportError:
+    zstandard = None
+
+SEVERITIES = ("critical", "high", "medium", "low")
+FINDING_TYPES = (
+    "secret_scanning", "large_files", "merge_conflicts", "yaml_errors", "type_errors", "lint_errors"
+)
+READ_CHUNK_CHARS = 1 << 20
+COPY_CHUNK_BYTES = 1 << 20
+# Bump when the normalized finding layout changes so stale partials are rebuilt
+MANIFEST_VERSION = 2
+# Partial lines are json.dumps of a dict whose first key is "hash": {"hash": "<16 hex>", ...
+_LINE_HASH = slice(10, 26)
+INDEX_CACHE_KIB = 64 * 1024
+INDEX_BATCH = 4096
+
+# Report sinks: layout -> file suffix, compression -> extra suffix
+REPORT_FORMATS = {"json": ".json", "ndjson": ".ndjson", "columnar": ".columnar.json"}
+COMPRESSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+COLUMNS = ("hash", "repo", "type", "severity", "file", "status", "details")
+DICTIONARY_COLUMNS = ("repo", "type", "severity", "file", "status")
+_COLUMN_MARKERS = (b', "repo": ', b', "type": ', b', "severity": ', b', "file": ', b', "details": ')
+_STATUS_MARKER = b', "status": '
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+
+def finding_hash(repo: str, finding: Dict[str, Any]) -> str:
+    """Deterministic 16-hex-char hash used for deduplication"""
+    hash_input = f"{repo}:{finding.get('type')}:{finding.get('file')}"
+    return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+
+
+def empty_summary() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "duplicates": 0,
+        "by_severity": {severity: 0 for severity in SEVERITIES},
+        "by_type": {finding_type: 0 for finding_type in FINDING_TYPES}
+    }
+
+
+def merge_summary(into: Dict[str, Any], partial: Dict[str, Any]):
+    """Fold one repo's partial summary into the running totals"""
+    into["total"] += partial["total"]
+    into["duplicates"] += partial["duplicates"]
+    for section in ("by_severity", "by_type"):
+        for key, count in partial[section].items():
+            into[section][key] += count
+
+
+class _ChunkedJSON:
+    """Pull scanner over a text stream: decodes one JSON value at a time with
+    ``JSONDecoder.raw_decode``, refilling its buffer as values span chunks"""
+
+    def __init__(self, handle, chunk_size: int = READ_CHUNK_CHARS):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        # Read at least as much as is already pending so a value spanning
+        # many chunks is re-decoded O(log n) times, not O(n)
+        chunk = self.handle.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at end of input"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number cut at the buffer edge ("12" of "123", "1" of "1e5")
+                # still decodes; only accept it once the next character ends it
+                if self.eof or (end < len(self.buffer) and self.buffer[end] not in _NUMBER_CONTINUATION):
+                    self.pos = end
+                    return value
+            self._fill()
+
+
+def _scan_findings(handle) -> Iterator[Dict[str, Any]]:
+    scanner = _ChunkedJSON(handle)
+    scanner.expect("{")
+    if scanner.peek() == "}":
+        return
+    while True:
+        key = scanner.value()
+        scanner.expect(":")
+        if key == "findings":
+            scanner.expect("[")
+            if scanner.peek() == "]":
+                scanner.pos += 1
+            else:
+                while True:
+                    yield scanner.value()
+                    if scanner.peek() != ",":
+                        break
+                    scanner.pos += 1
+                scanner.expect("]")
+        else:
+            scanner.value()
+        if scanner.peek() != ",":
+            break
+        scanner.pos += 1
+    scanner.expect("}")
+
+
+def iter_findings(cache_file: str) -> Iterator[Dict[str, Any]]:
+    """Stream the ``findings`` array of one audit cache file without loading it whole"""
+    if ijson is not None:
+        with open(cache_file, "rb") as f:
+            yield from ijson.items(f, "findings.item", use_float=True)
+    else:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            yield from _scan_findings(f)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(COPY_CHUNK_BYTES)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def ingest_repo(repo: str, cache_file: str, partial_file: str,
+                known_sha256: Optional[str] = None) -> Dict[str, Any]:
+    """Parse one repo's audit cache into an NDJSON findings partial and a partial summary.
+
+    Runs in a pool worker; only the manifest entry travels back to the
+    parent. When the cache content still hashes to ``known_sha256`` the
+    existing partial is kept and the entry comes back with ``parsed``
+    False and no summary.
+
+    Findings sharing a hash (same repo, type and file) are kept once and
+    counted under ``duplicates``. Seen hashes go to a private temporary
+    SQLite table, which spills to disk, so a huge repo cannot blow up the
+    worker's memory.
+    """
+    stat = os.stat(cache_file)
+    entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(cache_file)}
+    if entry["sha256"] == known_sha256:
+        entry["parsed"] = False
+        return entry
+
+    summary = empty_summary()
+    spool_file = f"{partial_file}.{os.getpid()}.tmp"
+    seen = sqlite3.connect("")
+    seen.execute("CREATE TABLE seen (hash TEXT PRIMARY KEY) WITHOUT ROWID")
+    try:
+        with open(spool_file, "w", encoding="utf-8") as out:
+            for finding in iter_findings(cache_file):
+                hash_value = finding_hash(repo, finding)
+                if not seen.execute("INSERT OR IGNORE INTO seen VALUES (?)", (hash_value,)).rowcount:
+                    summary["duplicates"] += 1
+                    continue
+                severity = finding.get("severity", "low")
+                finding_type = finding.get("type", "unknown")
+                out.write(json.dumps({
+                    "hash": hash_value,
+                    "repo": repo,
+                    "type": finding.get("type"),
+                    "severity": severity,
+                    "file": finding.get("file"),
+                    "details": finding.get("details")
+                }) + "\n")
+
+                summary["total"] += 1
+                if severity in summary["by_severity"]:
+                    summary["by_severity"][severity] += 1
+                if finding_type in summary["by_type"]:
+                    summary["by_type"][finding_type] += 1
+        os.replace(spool_file, partial_file)
+    except BaseException:
+        if os.path.exists(spool_file):
+            os.unlink(spool_file)
+        raise
+    finally:
+        seen.close()
+    entry.update(parsed=True, summary=summary)
+    return entry
+
+
+class FindingIndex:
+    """On-disk history of every finding hash, for cross-run classification.
+
+    One SQLite row per distinct finding, so history is bounded by disk
+    rather than memory (the page cache is capped at INDEX_CACHE_KIB). A
+    finding is ``recurring`` when the previous run reported it and ``new``
+    otherwise, which includes findings that come back after being
+    resolved. Findings from the previous run that this run does not report
+    are ``resolved``.
+
+    Each finding row remembers the run whose parse of its repo last found
+    it, and ``repos`` records when each repo was last parsed and last
+    reported. Carrying an unchanged repo forward is one row update however
+    many findings it has. A run is one write transaction, and nothing is
+    recorded unless ``finish`` commits.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS findings (
+            hash TEXT PRIMARY KEY,
+            repo TEXT NOT NULL,
+            type TEXT,
+            severity TEXT,
+            file TEXT,
+            first_seen TEXT NOT NULL,
+            run INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS findings_repo_run ON findings (repo, run);
+        CREATE TABLE IF NOT EXISTS repos (
+            repo TEXT PRIMARY KEY,
+            parsed_run INTEGER NOT NULL,
+            reported_run INTEGER NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            report TEXT,
+            new INTEGER,
+            recurring INTEGER,
+            resolved INTEGER
+        );
+    """
+    
+    def __init__(self, path: Path):
+        self.db = sqlite3.connect(str(path), isolation_level=None)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.execute(f"PRAGMA cache_size = -{INDEX_CACHE_KIB}")
+        self.db.executescript(self.SCHEMA)
+        self.run = self.previous = 0
+        self.timestamp = None
+        self._repos: Dict[str, tuple] = {}
+        self._parsed: List[str] = []
+    
+    def begin(self, timestamp: str):
+        self.db.execute("BEGIN IMMEDIATE")
+        self.previous = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM runs").fetchone()[0]
+        self.run = self.previous + 1
+        self.timestamp = timestamp
+        self._repos = {row[0]: row[1:] for row in self.db.execute(
+            "SELECT repo, parsed_run, reported_run FROM repos"
+        )}
+        self._parsed = []
+    
+    def _open_run(self, repo: str) -> Optional[int]:
+        """Run whose findings for ``repo`` the previous report carried, if any"""
+        parsed_run, reported_run = self._repos.get(repo, (None, None))
+        return parsed_run if reported_run == self.previous else None
+    
+    def carry_over(self, repo: str, expected: int) -> bool:
+        """Mark every finding the previous run reported for ``repo`` as seen again.
+
+        Used for repos whose partial is unchanged since that run. Returns
+        False without changing anything unless the index holds exactly
+        ``expected`` findings for the repo (the index and the manifest have
+        drifted apart), and the caller then classifies line by line.
+        """
+        open_run = self._open_run(repo)
+        if open_run is None:
+            return False
+        held = self.db.execute(
+            "SELECT COUNT(*) FROM findings WHERE repo = ? AND run = ?", (repo, open_run)
+        ).fetchone()[0]
+        if held != expected:
+            return False
+        self.db.execute("UPDATE repos SET reported_run = ? WHERE repo = ?", (self.run, repo))
+        return True
+    
+    def classify(self, repo: str, lines: Iterable[bytes]) -> Iterator[tuple]:
+        """Record a freshly parsed repo's partial lines, yielding (line, status)"""
+        open_run = self._open_run(repo)
+        inserts = []
+        for line in lines:
+            hash_value = line[_LINE_HASH].decode()
+            if open_run is not None and self.db.execute(
+                "UPDATE findings SET run = ? WHERE hash = ? AND run = ?", (self.run, hash_value, open_run)
+            ).rowcount:
+                yield line, "recurring"
+                continue
+            finding = json.loads(line)
+            inserts.append((hash_value, repo, finding["type"], finding["severity"], finding["file"],
+                            self.timestamp, self.run))
+            if len(inserts) >= INDEX_BATCH:
+                self._insert(inserts)
+            yield line, "new"
+        self._insert(inserts)
+        self._parsed.append(repo)
+    
+    def _insert(self, rows: List[tuple]):
+        self.db.executemany(
+            "INSERT INTO findings (hash, repo, type, severity, file, first_seen, run) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (hash) DO UPDATE SET "
+            "severity = excluded.severity, run = excluded.run",
+            rows
+        )
+        rows.clear()
+    
+    def resolved(self) -> Iterator[Dict[str, Any]]:
+        """Findings the previous run reported that this run has not (call after classifying)"""
+        cursor = self.db.execute(
+            "SELECT f.hash, f.repo, f.type, f.severity, f.file, f.first_seen "
+            "FROM repos r JOIN findings f ON f.repo = r.repo AND f.run = r.parsed_run "
+            "WHERE r.reported_run = ?",
+            (self.previous,)
+        )
+        columns = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(columns, row))
+    
+    def finish(self, report_file: Path, changes: Dict[str, int]):
+        self.db.executemany(
+            "INSERT INTO repos (repo, parsed_run, reported_run) VALUES (?, ?, ?) ON CONFLICT (repo) DO UPDATE SET "
+            "parsed_run = excluded.parsed_run, reported_run = excluded.reported_run",
+            [(repo, self.run, self.run) for repo in self._parsed]
+        )
+        self.db.execute(
+            "INSERT INTO runs (id, timestamp, report, new, recurring, resolved) VALUES (?, ?, ?, ?, ?, ?)",
+            (self.run, self.timestamp, str(report_file), changes["new"], changes["recurring"], changes["resolved"])
+        )
+        self.db.execute("COMMIT")
+    
+    def close(self):
+        if self.db.in_transaction:
+            self.db.execute("ROLLBACK")
+        self.db.close()
+
+
+def open_report(path, mode: str = "rb", compress: Optional[str] = None):
+    """Open a report file, (de)compressing by ``compress`` or, when None, by suffix"""
+    path = str(path)
+    if compress is None:
+        compress = next((name for name, suffix in COMPRESSIONS.items() if suffix and path.endswith(suffix)), "none")
+    if compress == "gzip":
+        return gzip.open(path, mode, compresslevel=6)
+    if compress == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd reports need the zstandard package (pip install zstandard)")
+        return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=3) if "w" in mode else None)
+    return open(path, mode)
+
+
+def report_format(path) -> str:
+    name = str(path)
+    for suffix in COMPRESSIONS.values():
+        if suffix and name.endswith(suffix):
+            name = name[:-len(suffix)]
+    if name.endswith(REPORT_FORMATS["columnar"]):
+        return "columnar"
+    return "ndjson" if name.endswith(REPORT_FORMATS["ndjson"]) else "json"
+
+
+class JSONReportSink:
+    """The original single JSON document, one finding per line.
+
+    Keys: timestamp, repos_scanned, findings, resolved_findings, changes,
+    summary. Separators go before elements rather than after them, so
+    nothing is ever rewritten and the output can be a compressed stream.
+    """
+    
+    def __init__(self, out):
+        self.out = out
+        self._array = None
+        self._empty = True
+    
+    def _array_open(self, name: str):
+        if self._array != name:
+            if self._array:
+                self.out.write(b"\n]")
+            self.out.write(b', "' + name.encode() + b'": [')
+            self._array, self._empty = name, True
+    
+    def begin(self, header: Dict[str, Any]):
+        self.out.write(json.dumps(header)[:-1].encode())
+        self._array_open("findings")
+    
+    def add_findings(self, lines: bytes):
+        """Append complete NDJSON finding lines"""
+        if lines:
+            self.out.write((b"\n" if self._empty else b",\n") + lines[:-1].replace(b"\n", b",\n"))
+            self._empty = False
+    
+    def add_resolved(self, finding: Dict[str, Any]):
+        self._array_open("resolved_findings")
+        self.out.write((b"\n" if self._empty else b",\n") + json.dumps(finding).encode())
+        self._empty = False
+    
+    def finish(self, trailer: Dict[str, Any]):
+        self._array_open("resolved_findings")
+        self.out.write(b"\n]")
+        for key, value in trailer.items():
+            self.out.write(b', "' + key.encode() + b'": ' + json.dumps(value, indent=2 if key == "summary" else None).encode())
+        self.out.write(b"}\n")
+
+
+class NDJSONReportSink:
+    """One JSON object per line, readable as a stream.
+
+    The first line is ``{"record": "header", ...}`` and the last is
+    ``{"record": "summary", "changes": ..., "summary": ...}``. Every line
+    in between is a finding, and resolved findings carry
+    ``"status": "resolved"``.
+    """
+    
+    def __init__(self, out):
+        self.out = out
+    
+    def begin(self, header: Dict[str, Any]):
+        self.out.write(json.dumps({"record": "header", **header}).encode() + b"\n")
+    
+    def add_findings(self, lines: bytes):
+        self.out.write(lines)
+    
+    def add_resolved(self, finding: Dict[str, Any]):
+        self.out.write(json.dumps({**finding, "status": "resolved"}).encode() + b"\n")
+    
+    def finish(self, trailer: Dict[str, Any]):
+        self.out.write(json.dumps({"record": "summary", **trailer}).encode() + b"\n")
+
+
+class ColumnarReportSink:
+    """One JSON document holding findings column by column.
+
+    ``columns`` maps each of COLUMNS to an array with one entry per finding.
+    repo, type, severity, file and status hold integer codes into
+    ``dictionaries``. Columns are spooled to ``spool_dir`` while findings
+    stream in and are stitched together in ``finish``, so memory holds
+    only the dictionaries (distinct values, not findings).
+    """
+    
+    def __init__(self, out, spool_dir: str):
+        self.out = out
+        self.header: Dict[str, Any] = {}
+        self.count = 0
+        self.dictionaries = {column: {} for column in DICTIONARY_COLUMNS}
+        self.spools = {column: open(os.path.join(spool_dir, f"{column}.col"), "w+b") for column in COLUMNS}
+        self.resolved = open(os.path.join(spool_dir, "resolved.ndjson"), "w+b")
+    
+    def begin(self, header: Dict[str, Any]):
+        self.header = {**header, "format": "columnar"}
+    
+    def add_findings(self, lines: bytes):
+        if not lines:
+            return
+        values = {column: [] for column in COLUMNS}
+        hashes, details_column = values["hash"], values["details"]
+        dictionary_columns = [(self.dictionaries[column], values[column]) for column in DICTIONARY_COLUMNS]
+        for line in lines.splitlines():
+            # Lines are ingest_repo's layout plus a trailing status. No earlier
+            # value can contain an unescaped '", "<key>": ', so every column
+            # is sliced out as a raw JSON token without decoding the line
+            bounds, position = [], 0
+            for marker in _COLUMN_MARKERS:
+                position = line.index(marker, position)
+                bounds.append(position)
+            bounds.append(line.rindex(_STATUS_MARKER))
+            tokens = [line[at + len(marker):end] for at, marker, end in zip(bounds, _COLUMN_MARKERS, bounds[1:])]
+            tokens.append(line[bounds[-1] + len(_STATUS_MARKER):-1])
+            details_column.append(tokens.pop(4))
+            for (codes, column), token in zip(dictionary_columns, tokens):
+                code = codes.get(token)
+                if code is None:
+                    code = codes[token] = str(len(codes)).encode()
+                column.append(code)
+            hashes.append(b'"' + line[_LINE_HASH] + b'"')
+        separator = b"," if self.count else b""
+        for column, column_values in values.items():
+            self.spools[column].write(separator + b",".join(column_values))
+        self.count += len(hashes)
+    
+    def add_resolved(self, finding: Dict[str, Any]):
+        self.resolved.write(json.dumps(finding).encode() + b"\n")
+    
+    def finish(self, trailer: Dict[str, Any]):
+        out = self.out
+        out.write(json.dumps({**self.header, "count": self.count})[:-1].encode() + b', "dictionaries": {')
+        for position, (column, codes) in enumerate(self.dictionaries.items()):
+            # Keys are already JSON tokens, in code order
+            out.write((b", " if position else b"") + b'"' + column.encode() + b'": [' + b", ".join(codes) + b"]")
+        out.write(b'}, "columns": {')
+        for position, column in enumerate(COLUMNS):
+            out.write((b", " if position else b"") + b'"' + column.encode() + b'": [')
+            self._copy(self.spools[column], out)
+            out.write(b"]")
+        out.write(b'}, "resolved_findings": [')
+        self.resolved.seek(0)
+        for position, line in enumerate(self.resolved):
+            out.write((b",\n" if position else b"\n") + line[:-1])
+        out.write(b"]")
+        for key, value in trailer.items():
+            out.write(b', "' + key.encode() + b'": ' + json.dumps(value).encode())
+        out.write(b"}\n")
+        for spool in (*self.spools.values(), self.resolved):
+            spool.close()
+    
+    @staticmethod
+    def _copy(spool, out):
+        spool.seek(0)
+        while True:
+            block = spool.read(COPY_CHUNK_BYTES)
+            if not block:
+                break
+            out.write(block)
+
+
+def iter_report(path) -> Iterator[Dict[str, Any]]:
+    """Stream the current findings (not the resolved ones) of a report in any sink format"""
+    layout = report_format(path)
+    with open_report(path) as f:
+        if layout == "ndjson":
+            for line in f:
+                finding = json.loads(line)
+                if "record" not in finding and finding.get("status") != "resolved":
+                    yield finding
+        elif layout == "columnar":
+            report = json.load(f)
+            columns, dictionaries = report["columns"], report["dictionaries"]
+            decoded = [
+                [dictionaries[column][code] for code in columns[column]] if column in dictionaries else columns[column]
+                for column in COLUMNS
+            ]
+            for row in zip(*decoded):
+                yield dict(zip(COLUMNS, row))
+        elif ijson is not None:
+            yield from ijson.items(f, "findings.item", use_float=True)
+        else:
+            yield from _scan_findings(io.TextIOWrapper(f, encoding="utf-8"))
+
 
 class CodeNestAggregator:
-    def __init__(self, repos: List[str], codenest_api_url: str = None):
+    def __init__(self, repos: List[str], codenest_api_url: str = None,
+                 workers: Optional[int] = None, executor: str = "process",
+                 report_format: str = "json", compress: str = "none"):
         self.repos = repos
         self.codenest_api_url = codenest_api_url or os.getenv("CODENEST_API_URL")
         self.audit_cache_dir = Path(".audit-cache")
-        self.reports_dir = Path(".codenest-reports")
-        self.reports_dir.mkdir(exist_ok=True)
+        self.reports_dir = Path(os.getenv("CODENEST_REPORTS_DIR", ".codenest-reports"))
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.state_dir = Path(os.getenv("CODENEST_STATE_DIR", ".codenest-state"))
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.report_format = report_format
+        self.compress = compress
     
     def generate_finding_hash(self, repo: str, finding: Dict[str, Any]) -> str:
         """Generate deterministic hash for deduplication"""
-        hash_input = f"{repo}:{finding.get('type')}:{finding.get('file')}"
-        return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+        return finding_hash(repo, finding)
+    
+    def cache_file(self, repo: str) -> Path:
+        return self.audit_cache_dir / f"{repo.replace('/', '_')}.json"
     
-    def collect_audits(self) -> Dict[str, Any]:
-        """Collect all audit results from .audit-cache/"""
+    def partial_file(self, repo: str) -> Path:
+        name = hashlib.sha256(repo.encode()).hexdigest()[:16]
+        return self.state_dir / "partials" / f"{name}.ndjson"
+    
+    @property
+    def manifest_file(self) -> Path:
+        return self.state_dir / "manifest.json"
+    
+    def load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Per-repo cache fingerprints and partial summaries from the last run"""
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            print(f"⚠️  Ignoring unreadable manifest {self.manifest_file}: {e}")
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("repos", {})
+    
+    def save_manifest(self, repos: Dict[str, Dict[str, Any]]):
+        tmp_file = self.manifest_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "repos": repos}, f)
+        os.replace(tmp_file, self.manifest_file)
+        
+        # Drop partials of repos that left the list or whose cache disappeared
+        keep = {self.partial_file(repo).name for repo in repos}
+        for partial in (self.state_dir / "partials").glob("*.ndjson"):
+            if partial.name not in keep:
+                partial.unlink()
+    
+    def _pool(self) -> Executor:
+        if self.executor == "thread" or self.workers == 1:
+            return ThreadPoolExecutor(max_workers=self.workers)
+        return ProcessPoolExecutor(max_workers=self.workers)
+    
+    def collect_audits(self, report_file: Path, full: bool = False) -> Dict[str, Any]:
+        """Stream all audit results from .audit-cache/ into ``report_file``.
+
+        Each repo cache is normalized once into an NDJSON partial under
+        ``state_dir`` and fingerprinted in the manifest. A cache whose size
+        and mtime match the manifest is skipped outright; one whose stat
+        changed but whose sha256 did not is skipped after hashing. Only the
+        rest are re-parsed, in parallel. Totals are rebuilt from the cached
+        partial summaries and the partials are appended to the report in
+        repo order, so findings never accumulate in memory. ``full``
+        ignores the manifest. A cache that fails to parse contributes
+        nothing and is retried next run.
+
+        Findings are deduplicated by hash as they are parsed, and the
+        FindingIndex tags each one ``new`` or ``recurring`` against the
+        previous run. Findings that run reported and this one did not are
+        listed under ``resolved_findings``. Returns the report without its
+        findings and resolved list, plus ``files`` counts of
+        parsed/skipped/failed caches.
+        """
         aggregated = {
             "timestamp": datetime.utcnow().isoformat(),
             "repos_scanned": len(self.repos),
-            "findings": [],
-            "summary": {
-                "total": 0,
-                "by_severity": {
-                    "critical": 0,
-                    "high": 0,
-                    "medium": 0,
-                    "low": 0
-                },
-                "by_type": {
-                    "secret_scanning": 0,
-                    "large_files": 0,
-                    "merge_conflicts": 0,
-                    "yaml_errors": 0,
-                    "type_errors": 0,
-                    "lint_errors": 0
-                }
-            }
+            "summary": empty_summary()
         }
+        files = {"parsed": 0, "skipped": 0, "failed": 0}
         
         # Check if audit cache directory exists
         if not self.audit_cache_dir.exists():
             print(f"⚠️  Audit cache directory not found: {self.audit_cache_dir}")
-            return aggregated
         
-        # Collect findings from each repository
-        for repo in self.repos:
-            repo_cache_file = self.audit_cache_dir / f"{repo.replace('/', '_')}.json"
+        (self.state_dir / "partials").mkdir(parents=True, exist_ok=True)
+        manifest = {} if full else self.load_manifest()
+        updated = {}
+        
+        changes = {"new": 0, "recurring": 0, "resolved": 0}
+        # Written under a dot-name and renamed into place, so readers never see half a report
+        partial_report = report_file.with_name(f".{report_file.name}.partial")
+        index = FindingIndex(self.state_dir / "findings.sqlite")
+        try:
+            index.begin(aggregated["timestamp"])
+            with open_report(partial_report, "wb", self.compress) as out, \
+                    tempfile.TemporaryDirectory(prefix=".spool-", dir=self.reports_dir) as spool_dir:
+                sink = self._sink(out, spool_dir)
+                sink.begin({
+                    "timestamp": aggregated["timestamp"],
+                    "repos_scanned": aggregated["repos_scanned"]
+                })
+                
+                with self._pool() as pool:
+                    jobs = []
+                    for repo in self.repos:
+                        repo_cache_file = self.cache_file(repo)
+                        try:
+                            stat = repo_cache_file.stat()
+                        except FileNotFoundError:
+                            continue
+                        known = manifest.get(repo)
+                        if known and not self.partial_file(repo).exists():
+                            known = None
+                        if known and (known["size"], known["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                            jobs.append((repo, repo_cache_file, known, None))
+                        else:
+                            jobs.append((repo, repo_cache_file, known, pool.submit(
+                                ingest_repo, repo, str(repo_cache_file), str(self.partial_file(repo)),
+                                known["sha256"] if known else None
+                            )))
+                    
+                    for repo, repo_cache_file, known, job in jobs:
+                        entry, parsed = known, False
+                        if job is not None:
+                            try:
+                                entry = job.result()
+                            except Exception as e:
+                                print(f"⚠️  Failed to process {repo_cache_file}: {e}")
+                                files["failed"] += 1
+                                continue
+                            parsed = entry.pop("parsed")
+                            if not parsed:
+                                entry["summary"] = known["summary"]
+                        files["parsed" if parsed else "skipped"] += 1
+                        updated[repo] = entry
+                        merge_summary(aggregated["summary"], entry["summary"])
+                        self._append_partial(sink, repo, entry, parsed, index, changes)
+                
+                for finding in index.resolved():
+                    sink.add_resolved(finding)
+                    changes["resolved"] += 1
+                sink.finish({"changes": changes, "summary": aggregated["summary"]})
             
-            if repo_cache_file.exists():
-                try:
-                    with open(repo_cache_file, 'r') as f:
-                        repo_findings = json.load(f)
-                        
-                        for finding in repo_findings.get("findings", []):
-                            finding_hash = self.generate_finding_hash(repo, finding)
-                            
-                            # Add finding with deduplication hash
-                            aggregated["findings"].append({
-                                "hash": finding_hash,
-                                "repo": repo,
-                                "type": finding.get("type"),
-                                "severity": finding.get("severity", "low"),
-                                "file": finding.get("file"),
-                                "details": finding.get("details")
-                            })
-                            
-                            # Update summary counters
-                            aggregated["summary"]["total"] += 1
-                            severity = finding.get("severity", "low")
-                            finding_type = finding.get("type", "unknown")
-                            
-                            if severity in aggregated["summary"]["by_severity"]:
-                                aggregated["summary"]["by_severity"][severity] += 1
-                            
-                            if finding_type in aggregated["summary"]["by_type"]:
-                                aggregated["summary"]["by_type"][finding_type] += 1
-                                
-                except Exception as e:
-                    print(f"⚠️  Failed to process {repo_cache_file}: {e}")
+            os.replace(partial_report, report_file)
+            self.save_manifest(updated)
+            index.finish(report_file, changes)
+        finally:
+            index.close()
+            if partial_report.exists():
+                partial_report.unlink()
         
+        aggregated["changes"] = changes
+        aggregated["files"] = files
         return aggregated
     
-    def upload_to_codenest(self, audit_data: Dict[str, Any]):
-        """Upload consolidated audit to CodeNest API"""
+    def _append_partial(self, sink, repo: str, entry: Dict[str, Any], parsed: bool,
+                        index: FindingIndex, changes: Dict[str, int]):
+        """Feed one repo's partial to the report sink, tagging each finding's status"""
+        with open(self.partial_file(repo), "rb") as partial:
+            if not parsed and index.carry_over(repo, entry["summary"]["total"]):
+                # Unchanged since the previous run: every finding recurs, so copy in bulk
+                changes["recurring"] += entry["summary"]["total"]
+                while True:
+                    block = partial.read(COPY_CHUNK_BYTES) + partial.readline()
+                    if not block:
+                        break
+                    sink.add_findings(block.replace(b"}\n", b', "status": "recurring"}\n'))
+                return
+            batch = []
+            for line, status in index.classify(repo, partial):
+                changes[status] += 1
+                batch.append(line[:-2] + b', "status": "' + status.encode() + b'"}\n')
+                if len(batch) >= INDEX_BATCH:
+                    sink.add_findings(b"".join(batch))
+                    batch.clear()
+            sink.add_findings(b"".join(batch))
+    
+    def _sink(self, out, spool_dir: str):
+        if self.report_format == "ndjson":
+            return NDJSONReportSink(out)
+        if self.report_format == "columnar":
+            return ColumnarReportSink(out, spool_dir)
+        return JSONReportSink(out)
+    
+    def report_path(self, timestamp: str) -> Path:
+        suffix = REPORT_FORMATS[self.report_format] + COMPRESSIONS[self.compress]
+        return self.reports_dir / f"audit-{timestamp}{suffix}"
+    
+    def upload_to_codenest(self, report_file: Path):
+        """Upload consolidated audit to CodeNest API (streamed from the saved report)"""
         if not self.codenest_api_url:
             print("⚠️  CodeNest API URL not configured, saving locally only")
             return
         
         try:
             import requests
-            response = requests.post(
-                f"{self.codenest_api_url}/api/audits/upload",
-                json=audit_data,
-                timeout=30
-            )
+            headers = {
+                "Content-Type": "application/x-ndjson" if report_format(report_file) == "ndjson" else "application/json"
+            }
+            if self.compress != "none":
+                headers["Content-Encoding"] = {"gzip": "gzip", "zstd": "zstd"}[self.compress]
+            with open(report_file, "rb") as body:
+                response = requests.post(
+                    f"{self.codenest_api_url}/api/audits/upload",
+                    data=body,
+                    headers=headers,
+                    timeout=30
+                )
             response.raise_for_status()
             print(f"✅ Audit uploaded to CodeNest: {response.status_code}")
         except ImportError:
@@ -112,29 +825,31 @@ class CodeNestAggregator:
         except Exception as e:
             print(f"⚠️  Failed to upload to CodeNest: {e}")
     
-    def run(self):
+    def run(self, full: bool = False):
         """Execute aggregation workflow"""
         print("🐝 Queen Bee Audit Aggregation Starting...")
         print(f"📊 Scanning {len(self.repos)} repositories...")
         
-        audit_data = self.collect_audits()
-        
-        # Save locally
+        # Findings stream straight into the local report
         timestamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
-        report_file = self.reports_dir / f"audit-{timestamp}.json"
-        
-        with open(report_file, 'w') as f:
-            json.dump(audit_data, f, indent=2)
+        report_file = self.report_path(timestamp)
+        audit_data = self.collect_audits(report_file, full=full)
         
+        files = audit_data["files"]
+        print(f"♻️  Cache files: {files['parsed']} parsed, {files['skipped']} unchanged and skipped"
+              + (f", {files['failed']} failed" if files["failed"] else ""))
         print(f"✅ Audit saved: {report_file}")
         print(f"📈 Total findings: {audit_data['summary']['total']}")
         print(f"   Critical: {audit_data['summary']['by_severity']['critical']}")
         print(f"   High: {audit_data['summary']['by_severity']['high']}")
         print(f"   Medium: {audit_data['summary']['by_severity']['medium']}")
         print(f"   Low: {audit_data['summary']['by_severity']['low']}")
+        changes = audit_data["changes"]
+        print(f"🔁 Since last run: {changes['new']} new, {changes['recurring']} recurring, "
+              f"{changes['resolved']} resolved ({audit_data['summary']['duplicates']} duplicates dropped)")
         
         # Upload to CodeNest
-        self.upload_to_codenest(audit_data)
+        self.upload_to_codenest(report_file)
         
         print("🐝 Queen Bee Audit Aggregation Complete!")
 
@@ -148,8 +863,38 @@ if __name__ == "__main__":
         "--config",
         help="Path to repository configuration file (JSON)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Parallel cache readers (default: CPU count)"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["process", "thread"],
+        default="process",
+        help="Worker pool type for parsing cache files"
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(REPORT_FORMATS),
+        default="json",
+        help="Report layout: one JSON document, streamable NDJSON, or dictionary-encoded columns"
+    )
+    parser.add_argument(
+        "--compress",
+        choices=list(COMPRESSIONS),
+        default="none",
+        help="Compress the report (zstd needs the zstandard package)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the incremental manifest and re-parse every cache file"
+    )
     
     args = parser.parse_args()
+    if args.compress == "zstd" and zstandard is None:
+        parser.error("--compress zstd needs the zstandard package (pip install zstandard)")
     
     # Load repository list
     if args.config:
@@ -166,5 +911,6 @@ if __name__ == "__main__":
         print("⚠️  Warning: Using placeholder repository list")
         repos = [f"org/repo-{i}" for i in range(1, 85)]
     
-    aggregator = CodeNestAggregator(repos)
-    aggregator.run()
+    aggregator = CodeNestAggregator(repos, workers=args.workers, executor=args.executor,
+                                    report_format=args.format, compress=args.compress)
+    aggregator.run(full=args.full)
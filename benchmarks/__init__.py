@@ -0,0 +1,18 @@
+"""
+FAA.zone™ Scroll Backend Benchmarks
+Run from the repository root, e.g. ``python -m benchmarks.crypto_pool``
+
+General suites (JSON results, ``--baseline`` regression checks):
+
+    benchmarks.load      every endpoint under configurable concurrency
+    benchmarks.micro     ScrollCrypto, license tokens and JSON paths
+    benchmarks.compare   results file vs. stored baseline, exit 1 on regression
+
+    benchmarks.canonical_compat   canonical JSON byte-identity and legacy
+                                  signature verification, exit 1 on mismatch
+
+The remaining modules are focused scenario benchmarks for individual
+subsystems (crypto pool, startup, DNS status, VaultMesh sync, pulse
+stream, license queries, CodeNest audit ingestion, report formats and
+Queen Bee audit queries).
+"""
@@ -0,0 +1,115 @@
+"""
+Machine-readable benchmark results and baseline regression checks
+
+Every suite writes one JSON document::
+
+    {"benchmark": "<suite>", "environment": {...}, "config": {...},
+     "results": {"<case>": {"<metric>": value, ...}, ...}}
+
+Metric names carry their direction: ``*_ms``, ``*_us`` and ``ns_per_op``
+are lower-is-better, ``rps`` and ``ops_per_sec`` higher-is-better, and
+``errors`` regresses as soon as it grows. Anything else is informational.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import os
+import platform
+import sys
+
+LOWER_IS_BETTER = ("_ms", "_us", "ns_per_op")
+HIGHER_IS_BETTER = ("rps", "ops_per_sec")
+DEFAULT_THRESHOLD = 0.15
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+def direction(metric: str) -> Optional[str]:
+    if metric == "errors":
+        return "errors"
+    if metric.endswith(LOWER_IS_BETTER):
+        return "lower"
+    if metric.endswith(HIGHER_IS_BETTER):
+        return "higher"
+    return None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Every tracked metric that moved the wrong way by more than ``threshold`` (a fraction)"""
+    regressions = []
+    for case, metrics in current.get("results", {}).items():
+        base_metrics = baseline.get("results", {}).get(case)
+        if not base_metrics:
+            continue
+        for metric, value in metrics.items():
+            base_value = base_metrics.get(metric)
+            kind = direction(metric)
+            if kind is None or not isinstance(value, (int, float)) or not isinstance(base_value, (int, float)):
+                continue
+            if kind == "errors":
+                regressed = value > base_value
+                change = None
+            elif base_value == 0:
+                continue
+            else:
+                change = (value - base_value) / base_value
+                regressed = change > threshold if kind == "lower" else change < -threshold
+            if regressed:
+                regressions.append({
+                    "case": case,
+                    "metric": metric,
+                    "baseline": base_value,
+                    "current": value,
+                    "change": None if change is None else round(change, 4)
+                })
+    return regressions
+
+
+def add_output_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a stored results JSON; exit 1 on regression")
+    parser.add_argument("--save-baseline", help="Also store these results as a baseline at this path")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative regression, e.g. 0.15 for 15%%")
+
+
+def print_regressions(regressions: List[Dict[str, Any]], threshold: float):
+    if not regressions:
+        print(f"✅ No regressions beyond {threshold:.0%}", file=sys.stderr)
+        return
+    print(f"❌ {len(regressions)} regression(s) beyond {threshold:.0%}:", file=sys.stderr)
+    for item in regressions:
+        change = "" if item["change"] is None else f" ({item['change']:+.1%})"
+        print(f"   {item['case']}.{item['metric']}: {item['baseline']} → {item['current']}{change}", file=sys.stderr)
+
+
+def emit(payload: Dict[str, Any], args: argparse.Namespace) -> int:
+    """Print/write results, optionally check them against a baseline; returns the exit code"""
+    document = json.dumps(payload, indent=2)
+    print(document)
+    for path in filter(None, (args.output, args.save_baseline)):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            f.write(document + "\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("benchmark") != payload.get("benchmark"):
+        print(f"❌ Baseline is for '{baseline.get('benchmark')}', not '{payload.get('benchmark')}'", file=sys.stderr)
+        return 2
+    regressions = compare(payload, baseline, args.threshold)
+    print_regressions(regressions, args.threshold)
+    return 1 if regressions else 0
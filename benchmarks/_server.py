@@ -0,0 +1,90 @@
+"""
+Local uvicorn launcher shared by the scroll backend benchmarks
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Optional
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ServerURL(str):
+    pid: int = 0
+
+
+def process_cpu_seconds(pid: int) -> float:
+    """User + system CPU time of a process, from /proc"""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def scratch_env(scratch: str) -> Dict[str, str]:
+    """Point every on-disk piece of server state into ``scratch``"""
+    return {
+        "SCROLL_KEY_DIR": os.path.join(scratch, "keys"),
+        "SCROLL_STORE_PATH": os.path.join(scratch, "store", "scrolls.db"),
+        "SCROLL_PDF_CACHE_DIR": os.path.join(scratch, "pdf-cache"),
+        "VAULTMESH_DEAD_LETTER_PATH": os.path.join(scratch, "deadletter.ndjson"),
+        "SCROLL_SHARED_DIR": os.path.join(scratch, "shared"),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def scroll_server(env: Optional[Dict[str, str]] = None, port: Optional[int] = None, timeout: float = 30.0,
+                  workers: int = 1):
+    """Start main:app in a uvicorn subprocess and yield its base URL.
+
+    The URL string carries the server process ID as ``.pid`` so benchmarks
+    can sample its CPU time. With ``workers`` > 1 that is the uvicorn
+    supervisor, not the workers.
+    """
+    port = port or free_port()
+    proc_env = dict(os.environ, **(env or {}))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=REPO_ROOT,
+        env=proc_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    base_url = ServerURL(f"http://127.0.0.1:{port}")
+    base_url.pid = proc.pid
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"{base_url}/health", timeout=1):
+                    break
+            except OSError:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("scroll backend failed to start")
+                time.sleep(0.1)
+        yield base_url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,191 @@
+"""
+CodeNest audit ingestion benchmark
+
+Generates a synthetic ``.audit-cache`` (``--repos`` repos, about
+``--size-mb`` in total, repo sizes skewed so a few secret-scan outputs
+dominate) and aggregates it two ways, each in a fresh interpreter:
+
+    legacy         the original loop: json.load per file, one findings list, json.dump(indent=2)
+    stream_wN      CodeNestAggregator.collect_audits with N parallel readers (full run)
+    incremental_wN the same after a primed run, with every cache touched and
+                   ``--changed-pct`` of them rewritten (CI checkouts reset mtimes)
+
+Reports wall time, throughput and peak RSS (largest of the parent and any
+pool worker). The cache is expensive to build, so ``--cache-dir`` keeps it
+between runs.
+
+    python -m benchmarks.audit_ingest --repos 1000 --size-mb 2048 --cache-dir /tmp/audit-cache
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+from ._results import add_output_arguments, emit, environment
+from ._server import REPO_ROOT
+
+SCRIPTS_DIR = os.path.join(REPO_ROOT, ".github", "scripts")
+SEVERITIES = ("critical", "high", "medium", "low")
+FINDING_TYPES = ("secret_scanning", "large_files", "merge_conflicts", "yaml_errors", "type_errors", "lint_errors")
+MARKER = ".benchmark-cache.json"
+
+PROBE = """
+import json, os, resource, sys, time
+from pathlib import Path
+sys.path.insert(0, {scripts_dir!r})
+import codenest_aggregator
+
+repos = json.load(open(os.path.join({cache_dir!r}, {marker!r})))["repos"]
+report = Path({report!r})
+files = None
+if {mode!r} != "legacy":
+    aggregator = codenest_aggregator.CodeNestAggregator(repos, workers={workers})
+    aggregator.audit_cache_dir = Path({cache_dir!r})
+    aggregator.reports_dir = report.parent
+    aggregator.state_dir = report.parent / "state"
+if {mode!r} == "incremental":
+    aggregator.collect_audits(report)
+    for index, repo in enumerate(repos):
+        cache_file = aggregator.cache_file(repo)
+        if index % 100 < {changed_pct}:
+            # Trailing whitespace: new bytes and hash, same findings
+            with open(cache_file, "a") as f:
+                f.write(" ")
+        os.utime(cache_file)
+started = time.perf_counter()
+if {mode!r} == "legacy":
+    aggregated = {{"findings": [], "summary": codenest_aggregator.empty_summary()}}
+    for repo in repos:
+        with open(os.path.join({cache_dir!r}, repo.replace("/", "_") + ".json")) as f:
+            for finding in json.load(f).get("findings", []):
+                aggregated["findings"].append({{
+                    "hash": codenest_aggregator.finding_hash(repo, finding), "repo": repo,
+                    "type": finding.get("type"), "severity": finding.get("severity", "low"),
+                    "file": finding.get("file"), "details": finding.get("details")
+                }})
+                summary = aggregated["summary"]
+                summary["total"] += 1
+                if finding.get("severity", "low") in summary["by_severity"]:
+                    summary["by_severity"][finding.get("severity", "low")] += 1
+                if finding.get("type", "unknown") in summary["by_type"]:
+                    summary["by_type"][finding.get("type", "unknown")] += 1
+    with open(report, "w") as f:
+        json.dump(aggregated, f, indent=2)
+    total = aggregated["summary"]["total"]
+else:
+    aggregated = aggregator.collect_audits(report)
+    total, files = aggregated["summary"]["total"], aggregated["files"]
+elapsed = time.perf_counter() - started
+peak_kb = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+              resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+print(json.dumps({{"elapsed": elapsed, "peak_kb": peak_kb, "findings": total, "files": files,
+                   "parser": "ijson" if codenest_aggregator.ijson else "raw_decode"}}))
+"""
+
+
+def _finding(rng: random.Random, index: int) -> dict:
+    finding_type = rng.choice(FINDING_TYPES)
+    details = {"line": rng.randint(1, 5000), "rule": f"{finding_type}-{rng.randint(1, 40)}"}
+    if finding_type == "secret_scanning":
+        # Secret-scan hits carry the surrounding context, which is what makes caches big
+        details["context"] = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789 =:\"") for _ in range(64)) * 24
+    return {
+        "type": finding_type,
+        "severity": rng.choice(SEVERITIES),
+        "file": f"src/module_{index % 997}/file_{index}.py",
+        "details": details
+    }
+
+
+def generate_cache(cache_dir: str, repos: int, size_mb: float, seed: int = 7) -> dict:
+    """Write a synthetic audit cache; reuses one built with the same parameters"""
+    config = {"repos": [f"org/repo-{i}" for i in range(repos)], "size_mb": size_mb, "seed": seed}
+    marker = os.path.join(cache_dir, MARKER)
+    if os.path.exists(marker):
+        with open(marker) as f:
+            if json.load(f) == config:
+                return config
+    os.makedirs(cache_dir, exist_ok=True)
+
+    rng = random.Random(seed)
+    weights = [rng.paretovariate(1.2) for _ in range(repos)]
+    budget = size_mb * 1024 * 1024
+    for repo, weight in zip(config["repos"], weights):
+        target = budget * weight / sum(weights)
+        with open(os.path.join(cache_dir, repo.replace("/", "_") + ".json"), "w") as f:
+            f.write(json.dumps({"repo": repo, "scanned_at": "2026-01-01T00:00:00"})[:-1] + ', "findings": [\n')
+            written, index = 0, 0
+            while written < target:
+                chunk = ",\n".join(json.dumps(_finding(rng, index + n), indent=2) for n in range(256))
+                f.write(("" if index == 0 else ",\n") + chunk)
+                written += len(chunk)
+                index += 256
+            f.write("\n]}\n")
+    with open(marker, "w") as f:
+        json.dump(config, f)
+    return config
+
+
+def run_mode(mode: str, cache_dir: str, workers: int = 1, changed_pct: int = 1) -> dict:
+    with tempfile.TemporaryDirectory() as report_dir:
+        report = os.path.join(report_dir, "audit.json")
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(
+                scripts_dir=SCRIPTS_DIR, cache_dir=cache_dir, marker=MARKER, report=report,
+                mode=mode, workers=workers, changed_pct=changed_pct
+            )],
+            cwd=report_dir, capture_output=True, text=True, check=True
+        ).stdout.splitlines()[-1]
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CodeNest audit ingestion benchmark")
+    parser.add_argument("--repos", type=int, default=1000)
+    parser.add_argument("--size-mb", type=float, default=2048, help="Approximate total cache size")
+    parser.add_argument("--workers", type=lambda value: [int(n) for n in value.split(",")],
+                        default=sorted({1, os.cpu_count() or 1}), help="Comma-separated reader counts")
+    parser.add_argument("--cache-dir", help="Build (or reuse) the synthetic cache here instead of a temp dir")
+    parser.add_argument("--skip-legacy", action="store_true", help="Legacy mode holds every finding in memory")
+    parser.add_argument("--changed-pct", type=int, default=1, help="Caches rewritten before the incremental run")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        cache_dir = args.cache_dir or os.path.join(scratch, "audit-cache")
+        generate_cache(cache_dir, args.repos, args.size_mb)
+        cache_bytes = sum(entry.stat().st_size for entry in os.scandir(cache_dir) if entry.name.endswith(".json"))
+
+        modes = [] if args.skip_legacy else [("legacy", 1)]
+        modes += [(f"stream_w{workers}", workers) for workers in args.workers]
+        modes += [(f"incremental_w{workers}", workers) for workers in args.workers]
+        results, parser_name = {}, None
+        for name, workers in modes:
+            sample = run_mode(name.split("_")[0], cache_dir, workers, args.changed_pct)
+            parser_name = sample["parser"] if name != "legacy" else parser_name
+            results[name] = {
+                "elapsed_ms": round(sample["elapsed"] * 1000, 1),
+                "mb_per_s": round(cache_bytes / 1024 / 1024 / sample["elapsed"], 1),
+                "peak_rss_mb": round(sample["peak_kb"] / 1024, 1),
+                "findings": sample["findings"]
+            }
+            if sample["files"]:
+                results[name].update(files_parsed=sample["files"]["parsed"], files_skipped=sample["files"]["skipped"])
+            print(f"  {name:<16} {results[name]['elapsed_ms']:>10} ms {results[name]['peak_rss_mb']:>9} MB peak",
+                  file=sys.stderr)
+
+    sys.exit(emit({
+        "benchmark": "audit_ingest",
+        "environment": environment(),
+        "config": {"repos": args.repos, "cache_mb": round(cache_bytes / 1024 / 1024, 1), "parser": parser_name,
+                   "changed_pct": args.changed_pct},
+        "results": results
+    }, args))
+
+
+if __name__ == "__main__":
+    main()
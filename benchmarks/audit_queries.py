@@ -0,0 +1,123 @@
+"""
+Queen Bee audit query benchmark
+
+Aggregates a synthetic ``.audit-cache`` (the audit_ingest generator) into
+one report per sink and compression, then measures the API's reader,
+``scroll_backend.audit_reports.AuditReport``, on each:
+
+    load_ms     parse and index the report (what a reload costs)
+    <filter>_us one filtered query (counts plus a page of ``--limit`` findings)
+
+The ``scan`` case answers the same queries the way a reader without the
+index would, streaming the report with ``iter_report`` for every request.
+
+    python -m benchmarks.audit_queries --repos 500 --size-mb 256 --cache-dir /tmp/audit-cache
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ._results import add_output_arguments, emit, environment
+from .audit_ingest import generate_cache
+from .report_formats import _aggregator_module
+from scroll_backend.audit_reports import AuditReport
+
+FILTERS = {
+    "all": {},
+    "severity": {"severity": "critical"},
+    "repo_severity": {"repo": "org/repo-1", "severity": "critical"},
+    "repo_type_status": {"repo": "org/repo-1", "type": "secret_scanning", "status": "recurring"},
+    "no_match": {"repo": "org/missing"}
+}
+
+
+def _best_us(call, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best * 1e6, 1)
+
+
+def _scan(report_file: Path, iter_report, limit: int, **filters) -> int:
+    matched, page = 0, []
+    for finding in iter_report(report_file):
+        if all(finding.get(column) == value for column, value in filters.items()):
+            matched += 1
+            if len(page) < limit:
+                page.append(finding)
+    return matched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Queen Bee audit query benchmark")
+    parser.add_argument("--repos", type=int, default=500)
+    parser.add_argument("--size-mb", type=float, default=256, help="Approximate total cache size")
+    parser.add_argument("--cache-dir", help="Build (or reuse) the synthetic cache here instead of a temp dir")
+    parser.add_argument("--limit", type=int, default=100, help="Findings returned per query")
+    parser.add_argument("--repeat", type=int, default=50, help="Best of N per query (loads: best of 3)")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    codenest_aggregator = _aggregator_module()
+    compressions = [name for name in codenest_aggregator.COMPRESSIONS
+                    if name != "zstd" or codenest_aggregator.zstandard is not None]
+
+    with tempfile.TemporaryDirectory() as scratch:
+        cache_dir = args.cache_dir or os.path.join(scratch, "audit-cache")
+        config = generate_cache(cache_dir, args.repos, args.size_mb)
+        spool_dir = Path(scratch) / "spool"
+
+        results, findings = {}, None
+        for report_format in codenest_aggregator.REPORT_FORMATS:
+            for compress in compressions:
+                name = report_format if compress == "none" else f"{report_format}_{compress}"
+                instance = codenest_aggregator.CodeNestAggregator(
+                    config["repos"], report_format=report_format, compress=compress
+                )
+                instance.audit_cache_dir = Path(cache_dir)
+                instance.reports_dir = Path(scratch)
+                instance.state_dir = Path(scratch) / "state"
+                report_file = instance.report_path(name)
+                instance.collect_audits(report_file)
+
+                load_s = []
+                for _ in range(3):
+                    started = time.perf_counter()
+                    report = AuditReport.load(report_file, spool_dir)
+                    load_s.append(time.perf_counter() - started)
+                    if len(load_s) < 3:
+                        report.close()
+                findings = len(report)
+                results[name] = {"load_ms": round(min(load_s) * 1000, 1)}
+                for case, filters in FILTERS.items():
+                    results[name][f"{case}_us"] = _best_us(lambda: report.query(0, args.limit, **filters), args.repeat)
+                report.close()
+                print(f"  {name:<16} {results[name]['load_ms']:>9} ms load "
+                      f"{results[name]['repo_severity_us']:>9} us repo+severity", file=sys.stderr)
+
+                if name == "json":
+                    results["scan"] = {
+                        f"{case}_us": _best_us(
+                            lambda: _scan(report_file, codenest_aggregator.iter_report, args.limit, **filters), 1
+                        )
+                        for case, filters in FILTERS.items()
+                    }
+                os.unlink(report_file)
+
+    sys.exit(emit({
+        "benchmark": "audit_queries",
+        "environment": environment(),
+        "config": {"repos": args.repos, "findings": findings, "limit": args.limit, "compressions": compressions},
+        "results": results
+    }, args))
+
+
+if __name__ == "__main__":
+    main()
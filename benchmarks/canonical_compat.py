@@ -0,0 +1,105 @@
+"""
+Canonical JSON compatibility check and timing
+
+Proves the canonical encoder is a drop-in for the original signing input:
+for a corpus of awkward scrolls (non-ASCII text, float edge cases, nested
+metadata, escapes) ``canonical_bytes`` must equal
+``json.dumps(data, sort_keys=True).encode()`` byte for byte, and scrolls
+signed the old way, in every envelope format, must still verify through
+ScrollCrypto. Exits 1 on any mismatch, then times both encoders.
+
+    python -m benchmarks.canonical_compat
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+
+from scroll_backend.canonical import canonical_bytes
+from scroll_backend.crypto import SIGNATURE_SEPARATOR, ScrollCrypto
+from scroll_backend.keystore import ScrollKeyStore
+from scroll_backend.signers import SIGNERS
+
+from ._results import add_output_arguments, emit, environment
+from .micro import SCROLL_DATA, measure
+
+CORPUS = [
+    SCROLL_DATA,
+    {},
+    {"app_concept": "Zürich ™ 火星 🚀", "funding_amount": 75000.5, "scroll_compliance": False},
+    {"floats": [0.1, 1e21, 1e-7, -0.0, 123456789.123456789, 5e-324], "ints": [0, -1, 2 ** 63, 10 ** 30]},
+    {"escapes": "quote \" backslash \\ newline \n tab \t nul \u0000 bell \u0007", "slash": "a/b"},
+    {"b": 1, "a": {"d": [3, {"z": None, "y": True}], "c": "x"}, "A": 0, "_": [], "10": "ten", "9": "nine"},
+    {"metadata": {"tags": ["vault", "mesh"], "nested": {"deep": {"deeper": [1, [2, [3]]]}}}, "treaty_position": 248},
+]
+
+
+def legacy_bytes(data) -> bytes:
+    """The original signing input, verbatim"""
+    return json.dumps(data, sort_keys=True).encode()
+
+
+def check_encoding() -> list:
+    return [index for index, data in enumerate(CORPUS) if canonical_bytes(data) != legacy_bytes(data)]
+
+
+def check_signatures(key_dir: str) -> list:
+    failures = []
+    for alg in SIGNERS:
+        crypto = ScrollCrypto(ScrollKeyStore(f"{key_dir}/{alg}"))
+        kid = crypto.key_store.rotate(alg)
+        signer = crypto.key_store.signer(kid)
+        for index, data in enumerate(CORPUS):
+            raw = signer.sign(crypto.key_store.private_key(kid), legacy_bytes(data)).hex()
+            envelopes = {"alg:kid:hex": SIGNATURE_SEPARATOR.join((alg, kid, raw))}
+            if alg == "rsa-pss":
+                envelopes["kid:hex"] = SIGNATURE_SEPARATOR.join((kid, raw))
+                envelopes["bare hex"] = raw
+            for form, signature in envelopes.items():
+                if not crypto.verify_scroll_signature(data, signature):
+                    failures.append({"alg": alg, "corpus_index": index, "envelope": form, "path": "verify_scroll_signature"})
+                if not crypto.verify_message(canonical_bytes(data), signature):
+                    failures.append({"alg": alg, "corpus_index": index, "envelope": form, "path": "verify_message"})
+            # And the other direction: new signatures verify against legacy bytes
+            if not crypto.verify_message(legacy_bytes(data), crypto.sign_scroll(data)):
+                failures.append({"alg": alg, "corpus_index": index, "envelope": "new", "path": "legacy_bytes"})
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canonical JSON compatibility check")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    encoding_mismatches = check_encoding()
+    with tempfile.TemporaryDirectory() as key_dir:
+        signature_failures = check_signatures(key_dir)
+
+    results = {
+        "json_dumps_sort_keys": measure(lambda: legacy_bytes(SCROLL_DATA), args.min_time, args.repeat),
+        "canonical_bytes": measure(lambda: canonical_bytes(SCROLL_DATA), args.min_time, args.repeat),
+    }
+    code = emit({
+        "benchmark": "canonical_compat",
+        "environment": environment(),
+        "config": {"corpus": len(CORPUS), "signers": list(SIGNERS)},
+        "compatibility": {
+            "encoding_mismatches": encoding_mismatches,
+            "signature_failures": signature_failures
+        },
+        "results": results
+    }, args)
+
+    if encoding_mismatches or signature_failures:
+        print(f"❌ Canonical JSON is not backward compatible: {len(encoding_mismatches)} encoding "
+              f"mismatch(es), {len(signature_failures)} signature failure(s)", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ {len(CORPUS)} scrolls byte-identical; legacy signatures verify for {', '.join(SIGNERS)}", file=sys.stderr)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare a benchmark results file against a stored baseline
+
+Exits 1 when any tracked metric regressed by more than ``--threshold``
+(see benchmarks._results for metric directions), so it can gate CI.
+
+    python -m benchmarks.compare results/micro.json baselines/micro.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+
+from ._results import DEFAULT_THRESHOLD, compare, print_regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    parser.add_argument("results")
+    parser.add_argument("baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative regression, e.g. 0.15 for 15%%")
+    parser.add_argument("--json", action="store_true", help="Print the regressions as JSON")
+    args = parser.parse_args()
+
+    with open(args.results) as f:
+        current = json.load(f)
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if current.get("benchmark") != baseline.get("benchmark"):
+        print(f"❌ Cannot compare '{current.get('benchmark')}' results to a "
+              f"'{baseline.get('benchmark')}' baseline", file=sys.stderr)
+        sys.exit(2)
+
+    regressions = compare(current, baseline, args.threshold)
+    if args.json:
+        print(json.dumps(regressions, indent=2))
+    print_regressions(regressions, args.threshold)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
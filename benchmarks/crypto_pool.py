@@ -0,0 +1,140 @@
+"""
+Mixed-traffic latency benchmark for the crypto executor
+
+Drives concurrent /api/treaty-sync/intake and /api/scroll/validate calls
+alongside /health polling, once per SCROLL_CRYPTO_POOL mode, and reports
+p50/p99 latency per route. ``inline`` is the pre-pool baseline where
+signing runs on the event loop.
+
+Validation posts a scroll signed with the server's own (scratch) key
+directory, and the verified-signature cache is disabled
+(``SCROLL_VERIFY_CACHE_TTL=0``), so every validate request runs a real
+signature verification. The run exits 1 unless those validations succeed.
+Results use the shared format (one
+``<mode>_<route>`` case each, see ``benchmarks._results``); the table goes
+to stderr.
+
+    python -m benchmarks.crypto_pool --duration 10 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+
+import aiohttp
+
+from scroll_backend.crypto import ScrollCrypto
+from scroll_backend.keystore import ScrollKeyStore
+
+from ._results import add_output_arguments, emit, environment
+from ._server import percentile, scratch_env, scroll_server
+
+INTAKE_BODY = {
+    "app_concept": "Benchmark Scroll",
+    "funding_declaration": "$75,000",
+    "scroll_compliance": True
+}
+VALIDATE_SCROLL = {"scroll_id": "scroll_faa_crypto_pool", "app_concept": "Benchmark Scroll", "treaty_position": 248}
+
+
+async def _drive(base_url: str, key_dir: str, duration: float, concurrency: int, health_pollers: int):
+    latencies = {"intake": [], "validate": [], "health": []}
+    errors = {route: 0 for route in latencies}
+    valid = 0
+    deadline = time.monotonic() + duration
+
+    # Signed with the server's key directory, so validation really succeeds
+    signature = ScrollCrypto(ScrollKeyStore(key_dir)).sign_scroll(VALIDATE_SCROLL)
+    validate_params = {"scroll_id": VALIDATE_SCROLL["scroll_id"], "signature": signature}
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)) as session:
+
+        async def crypto_worker(index: int):
+            nonlocal valid
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                if index % 2:
+                    route = "validate"
+                    request = session.post(f"{base_url}/api/scroll/validate",
+                                           params=validate_params, json=VALIDATE_SCROLL)
+                else:
+                    route = "intake"
+                    request = session.post(f"{base_url}/api/treaty-sync/intake", json=INTAKE_BODY)
+                async with request as resp:
+                    body = await resp.json()
+                    if resp.status != 200 or (route == "validate" and not body.get("signature_valid")):
+                        errors[route] += 1
+                    elif route == "validate":
+                        valid += 1
+                latencies[route].append(time.perf_counter() - started)
+
+        async def health_poller():
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                async with session.get(f"{base_url}/health") as resp:
+                    await resp.read()
+                    if resp.status != 200:
+                        errors["health"] += 1
+                latencies["health"].append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            *(crypto_worker(i) for i in range(concurrency)),
+            *(health_poller() for _ in range(health_pollers))
+        )
+
+    return {
+        route: {
+            "requests": len(samples),
+            "rps": round(len(samples) / duration, 1),
+            "p50_ms": round(percentile(samples, 50) * 1000, 2),
+            "p99_ms": round(percentile(samples, 99) * 1000, 2),
+            "errors": errors[route],
+            **({"valid": valid} if route == "validate" else {})
+        }
+        for route, samples in latencies.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crypto executor mixed-traffic benchmark")
+    parser.add_argument("--modes", default="inline,thread,process")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--health-pollers", type=int, default=4)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'mode':<8} {'route':<9} {'rps':>8} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}", file=sys.stderr)
+    for mode in args.modes.split(","):
+        # Fresh keys, store and spill files per mode, outside the repository
+        with tempfile.TemporaryDirectory() as scratch:
+            env = dict(scratch_env(scratch), SCROLL_CRYPTO_POOL=mode, SCROLL_VERIFY_CACHE_TTL="0")
+            with scroll_server(env) as base_url:
+                routes = asyncio.run(_drive(base_url, env["SCROLL_KEY_DIR"], args.duration, args.concurrency,
+                                            args.health_pollers))
+        for route in ("health", "intake", "validate"):
+            row = results[f"{mode}_{route}"] = routes[route]
+            print(f"{mode:<8} {route:<9} {row['rps']:>8} {row['p50_ms']:>9} {row['p99_ms']:>9} {row['errors']:>7}",
+                  file=sys.stderr)
+
+    code = emit({
+        "benchmark": "crypto_pool",
+        "environment": environment(),
+        "config": {"modes": args.modes.split(","), "duration": args.duration, "concurrency": args.concurrency,
+                   "health_pollers": args.health_pollers},
+        "results": results
+    }, args)
+
+    unverified = [mode for mode in args.modes.split(",")
+                  if not results[f"{mode}_validate"]["valid"] or results[f"{mode}_validate"]["errors"]]
+    if unverified:
+        print(f"❌ Validation did not verify signatures under load in: {', '.join(unverified)}", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(code)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+DNS status benchmark against a local stub resolver
+
+Starts a UDP stub nameserver on 127.0.0.1 that answers every A query after
+``--resolver-delay`` seconds, then compares:
+
+    blocking   the old synchronous dns.resolver lookup per status call
+    cached     DNSHealthMonitor.status() answered from memory
+    coalesced  N concurrent cold status() calls, counting stub queries
+
+Results use the shared format (``--output``/``--baseline``, see
+``benchmarks._results``); the summary goes to stderr.
+
+    python -m benchmarks.dns_status --resolver-delay 0.05
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+
+import dns.message
+import dns.rdatatype
+import dns.resolver
+import dns.rrset
+
+from scroll_backend.dns_monitor import DNSHealthMonitor
+
+from ._results import add_output_arguments, emit, environment
+from ._server import free_port, percentile
+
+
+class StubResolver(asyncio.DatagramProtocol):
+    def __init__(self, delay: float, ttl: int):
+        self.delay = delay
+        self.ttl = ttl
+        self.queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        asyncio.get_running_loop().call_later(self.delay, self._answer, data, addr)
+
+    def _answer(self, data, addr):
+        query = dns.message.from_wire(data)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        if question.rdtype == dns.rdatatype.A:
+            response.answer.append(
+                dns.rrset.from_text(question.name, self.ttl, "IN", "A", "127.0.0.1")
+            )
+        self.transport.sendto(response.to_wire(), addr)
+
+
+def start_stub(port: int, delay: float, ttl: int) -> StubResolver:
+    """Run the stub resolver on its own loop thread so blocking lookups can reach it"""
+    stub = StubResolver(delay, ttl)
+    ready = threading.Event()
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(
+            loop.create_datagram_endpoint(lambda: stub, local_addr=("127.0.0.1", port))
+        )
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return stub
+
+
+def blocking_lookup(port: int):
+    resolver = dns.resolver.Resolver(configure=False)
+    resolver.nameservers = ["127.0.0.1"]
+    resolver.port = port
+    resolver.timeout = 2
+    resolver.lifetime = 2
+    return resolver.resolve("faa.zone", "A")
+
+
+async def run(args):
+    port = free_port()
+    stub = start_stub(port, args.resolver_delay, args.ttl)
+    results = {}
+
+    samples = []
+    for _ in range(args.blocking_calls):
+        started = time.perf_counter()
+        blocking_lookup(port)
+        samples.append(time.perf_counter() - started)
+    results["blocking"] = {
+        "calls": len(samples),
+        "p50_us": round(percentile(samples, 50) * 1e6, 1),
+        "p99_us": round(percentile(samples, 99) * 1e6, 1)
+    }
+
+    monitor = DNSHealthMonitor(hostname="faa.zone", nameservers=["127.0.0.1"], port=port)
+    stub.queries = 0
+    await asyncio.gather(*(monitor.status() for _ in range(args.concurrency)))
+    results["coalesced"] = {"concurrent_calls": args.concurrency, "stub_queries": stub.queries}
+
+    samples = []
+    for _ in range(args.cached_calls):
+        started = time.perf_counter()
+        await monitor.status()
+        samples.append(time.perf_counter() - started)
+    results["cached"] = {
+        "calls": len(samples),
+        "p50_us": round(percentile(samples, 50) * 1e6, 2),
+        "p99_us": round(percentile(samples, 99) * 1e6, 2)
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DNS status benchmark with a local stub resolver")
+    parser.add_argument("--resolver-delay", type=float, default=0.05, help="Stub answer delay in seconds")
+    parser.add_argument("--ttl", type=int, default=60)
+    parser.add_argument("--blocking-calls", type=int, default=20)
+    parser.add_argument("--cached-calls", type=int, default=100000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"blocking  p50 {results['blocking']['p50_us']} µs  p99 {results['blocking']['p99_us']} µs", file=sys.stderr)
+    print(f"cached    p50 {results['cached']['p50_us']} µs  p99 {results['cached']['p99_us']} µs", file=sys.stderr)
+    print(f"coalesced {results['coalesced']['concurrent_calls']} concurrent cold calls → "
+          f"{results['coalesced']['stub_queries']} stub queries", file=sys.stderr)
+
+    sys.exit(emit({
+        "benchmark": "dns_status",
+        "environment": environment(),
+        "config": {"resolver_delay": args.resolver_delay, "ttl": args.ttl, "blocking_calls": args.blocking_calls,
+                   "cached_calls": args.cached_calls, "concurrency": args.concurrency},
+        "results": results
+    }, args))
+
+
+if __name__ == "__main__":
+    main()
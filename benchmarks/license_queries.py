@@ -0,0 +1,152 @@
+"""
+License query benchmark against a store holding a million ClaimRoot licenses
+
+Bulk-loads ``--licenses`` rows into a scratch ScrollStore, prints the query
+plan of each lookup (every one should be an index SEARCH, never a SCAN),
+then times the first page, a deep page reached by cursor, and a full walk
+of each result set.
+
+    python -m benchmarks.license_queries --licenses 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from scroll_backend.store import LICENSE_COLUMNS, ScrollStore
+
+LOAD_BATCH = 50000
+
+
+def _license_rows(count: int, licensees: int, apps: int, seed: int):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    for index in range(count):
+        generated_at = now - timedelta(seconds=rng.randrange(365 * 86400))
+        yield (
+            f"license_faa_bench_{index:08d}",
+            f"app_{rng.randrange(apps)}",
+            f"licensee_{rng.randrange(licensees)}",
+            248 + index,
+            1,
+            generated_at.isoformat(),
+            (generated_at + timedelta(days=365)).isoformat(),
+            f"/licenses/license_faa_bench_{index:08d}.pdf"
+        )
+
+
+async def _load(store: ScrollStore, args) -> float:
+    sql = (
+        f"INSERT INTO licenses ({', '.join(LICENSE_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(LICENSE_COLUMNS))})"
+    )
+    rows = _license_rows(args.licenses, args.licensees, args.apps, args.seed)
+    started = time.perf_counter()
+    while True:
+        batch = [row for _, row in zip(range(LOAD_BATCH), rows)]
+        if not batch:
+            break
+        await asyncio.wrap_future(store.submit(lambda conn, batch=batch: conn.executemany(sql, batch)))
+    return time.perf_counter() - started
+
+
+async def _time_query(store: ScrollStore, filters: dict, page_size: int, deep_pages: int) -> dict:
+    started = time.perf_counter()
+    first_page, cursor = await store.query_licenses(limit=page_size, **filters)
+    first_ms = (time.perf_counter() - started) * 1000
+
+    pages = 1
+    while cursor and pages < deep_pages:
+        _, cursor = await store.query_licenses(cursor=cursor, limit=page_size, **filters)
+        pages += 1
+    deep_ms = None
+    if cursor:
+        started = time.perf_counter()
+        await store.query_licenses(cursor=cursor, limit=page_size, **filters)
+        deep_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    started = time.perf_counter()
+    total = 0
+    async for page in store.iter_licenses(page_size=1000, **filters):
+        total += len(page)
+    walk_s = time.perf_counter() - started
+
+    return {
+        "first_page_ms": round(first_ms, 3),
+        f"page_{deep_pages + 1}_ms": deep_ms,
+        "matches": total,
+        "full_walk_s": round(walk_s, 3),
+        "rows_per_sec": round(total / walk_s) if walk_s else None,
+        "first_page_rows": len(first_page)
+    }
+
+
+def _query_plan(store: ScrollStore, filters: dict) -> list:
+    by_expiry = "expires_from" in filters
+    clauses = [f"{column} = ?" for column in ("licensee_id", "app_id") if column in filters]
+    if by_expiry:
+        clauses += ["expires_at >= ?", "expires_at < ?", "expires_at >= ?", "(expires_at, seq) > (?, ?)"]
+    else:
+        clauses.append("seq > ?")
+    sql = (
+        f"EXPLAIN QUERY PLAN SELECT * FROM licenses WHERE {' AND '.join(clauses)} "
+        f"ORDER BY {'expires_at, seq' if by_expiry else 'seq'} LIMIT 100"
+    )
+    params = [filters[column] for column in ("licensee_id", "app_id") if column in filters]
+    if by_expiry:
+        params += [filters["expires_from"], filters["expires_to"], filters["expires_from"], filters["expires_from"], 0]
+    else:
+        params.append(0)
+    return [row["detail"] for row in store._reader().execute(sql, params)]
+
+
+async def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as scratch:
+        store = ScrollStore(os.path.join(scratch, "scrolls.db"))
+        store.start()
+        load_s = await _load(store, args)
+
+        now = datetime.utcnow()
+        scenarios = {
+            "by_licensee": {"licensee_id": "licensee_42"},
+            "by_app": {"app_id": "app_7"},
+            "expiring_30_days": {
+                "expires_from": now.isoformat(),
+                "expires_to": (now + timedelta(days=30)).isoformat()
+            }
+        }
+        results = {
+            "licenses": args.licenses,
+            "load_s": round(load_s, 2),
+            "load_rows_per_sec": round(args.licenses / load_s),
+            "db_mb": round(os.path.getsize(store.path) / 1e6, 1)
+        }
+        for name, filters in scenarios.items():
+            results[name] = {
+                "plan": _query_plan(store, filters),
+                **await _time_query(store, filters, args.page_size, args.deep_pages)
+            }
+        store.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ClaimRoot license query benchmark")
+    parser.add_argument("--licenses", type=int, default=1000000)
+    parser.add_argument("--licensees", type=int, default=5000)
+    parser.add_argument("--apps", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--deep-pages", type=int, default=100, help="Pages to walk before timing a deep page")
+    parser.add_argument("--seed", type=int, default=247)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
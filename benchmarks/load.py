@@ -0,0 +1,210 @@
+"""
+Endpoint load driver for the scroll backend
+
+Runs each scenario (one endpoint and request shape) for ``--duration``
+seconds with ``--concurrency`` closed-loop clients, then reports
+throughput, p50/p95/p99 latency and unexpected statuses per scenario.
+
+``--target local`` (default) starts main:app under uvicorn in a
+subprocess, with ``--workers N`` for the multi-worker deployment mode;
+``--target inprocess`` drives the ASGI app directly over httpx's
+ASGITransport, so client and server share one event loop and numbers
+measure handler cost rather than the network stack; ``--url`` points at
+a server that is already running. Keys, store, PDF cache and
+dead letters live in a scratch directory for local and in-process runs.
+
+    python -m benchmarks.load --concurrency 16 --duration 5 --output results/load.json
+    python -m benchmarks.load --scenarios health,treaty_intake --baseline results/load.json
+"""
+
+from contextlib import asynccontextmanager, nullcontext
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+
+from ._results import add_output_arguments, emit, environment
+from ._server import percentile, scratch_env, scroll_server
+
+INTAKE_BODY = {
+    "app_concept": "Benchmark Scroll",
+    "funding_declaration": "$75,000",
+    "scroll_compliance": True
+}
+
+
+class Scenario:
+    def __init__(self, name: str, method: str, path: Callable[[dict], str],
+                 request: Optional[Callable[[dict], dict]] = None, expect: int = 200):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.request = request or (lambda ctx: {})
+        self.expect = expect
+
+
+def _validate_batch(ctx: dict) -> dict:
+    return {"json": {"scrolls": [
+        {"scroll_id": ctx["scroll_data"]["scroll_id"], "signature": ctx["signature"], "scroll_data": ctx["scroll_data"]}
+    ] * 64}}
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("health", "GET", lambda ctx: "/health"),
+    Scenario("treaty_intake", "POST", lambda ctx: "/api/treaty-sync/intake", lambda ctx: {"json": INTAKE_BODY}),
+    Scenario("treaty_intake_batch_100", "POST", lambda ctx: "/api/treaty-sync/intake/batch",
+             lambda ctx: {"json": [INTAKE_BODY] * 100}),
+    Scenario("treaty_intake_idempotent_replay", "POST", lambda ctx: "/api/treaty-sync/intake",
+             lambda ctx: {"json": INTAKE_BODY, "headers": {"Idempotency-Key": "bench-replay"}}),
+    Scenario("claimroot_generate", "POST", lambda ctx: "/api/claimroot/generate",
+             lambda ctx: {"params": {"app_id": "bench_app", "licensee_id": "bench_licensee"}}),
+    Scenario("claimroot_licenses_by_licensee", "GET", lambda ctx: "/api/claimroot/licenses",
+             lambda ctx: {"params": {"licensee_id": "bench_licensee", "limit": 100}}),
+    Scenario("claimroot_licenses_expiring", "GET", lambda ctx: "/api/claimroot/licenses/expiring",
+             lambda ctx: {"params": {"days": 400, "limit": 100}}),
+    Scenario("claimroot_license_verify", "GET", lambda ctx: "/api/claimroot/license/verify",
+             lambda ctx: {"headers": {"Authorization": f"Bearer {ctx['token']}"}}),
+    Scenario("claimroot_license_pdf", "GET", lambda ctx: ctx["pdf_url"]),
+    Scenario("scroll_validate", "POST", lambda ctx: "/api/scroll/validate",
+             lambda ctx: {"params": {"scroll_id": ctx["scroll_data"]["scroll_id"], "signature": ctx["signature"]},
+                          "json": ctx["scroll_data"]}),
+    Scenario("scroll_validate_batch_64", "POST", lambda ctx: "/api/scroll/validate/batch", _validate_batch),
+    Scenario("vaultmesh_status", "GET", lambda ctx: "/api/vaultmesh/status"),
+    Scenario("scroll_pulse", "GET", lambda ctx: "/api/scroll/pulse"),
+    Scenario("scroll_pulse_history", "GET", lambda ctx: "/api/scroll/pulse/history",
+             lambda ctx: {"params": {"buckets": 100}}),
+    Scenario("crypto_stats", "GET", lambda ctx: "/api/scroll/crypto/stats"),
+    Scenario("metrics", "GET", lambda ctx: "/metrics"),
+    Scenario("queen_bee_status", "GET", lambda ctx: "/api/queen-bee/status"),
+    Scenario("queen_bee_repos_sync", "POST", lambda ctx: "/api/queen-bee/repos/sync"),
+    Scenario("queen_bee_audit_aggregate", "GET", lambda ctx: "/api/queen-bee/audit/aggregate"),
+    Scenario("queen_bee_security_overview", "GET", lambda ctx: "/api/queen-bee/security/overview"),
+    Scenario("queen_bee_deploy_safeguards", "POST", lambda ctx: "/api/queen-bee/deploy/safeguards",
+             lambda ctx: {"params": {"repo_pattern": "bench-*"}}),
+]
+
+
+async def _seed(client: httpx.AsyncClient, key_dir: Optional[str]) -> dict:
+    """Create the license, token and signed scroll later scenarios reuse"""
+    response = await client.post("/api/claimroot/generate",
+                                 params={"app_id": "bench_app", "licensee_id": "bench_licensee"})
+    response.raise_for_status()
+    generated = response.json()
+    ctx = {"token": generated["token"], "pdf_url": generated["license"]["pdf_url"]}
+
+    scroll_data = {"scroll_id": "scroll_faa_bench", "app_concept": "Benchmark Scroll", "treaty_position": 248}
+    if key_dir:
+        # Sign with the server's own key directory so validation succeeds
+        from scroll_backend.crypto import ScrollCrypto
+        from scroll_backend.keystore import ScrollKeyStore
+        ctx["signature"] = ScrollCrypto(ScrollKeyStore(key_dir)).sign_scroll(scroll_data)
+    else:
+        ctx["signature"] = "unsigned"
+    ctx["scroll_data"] = scroll_data
+    return ctx
+
+
+async def _run_scenario(client: httpx.AsyncClient, scenario: Scenario, ctx: dict,
+                        concurrency: int, duration: float) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    path = scenario.path(ctx)
+    kwargs = scenario.request(ctx)
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, path, **kwargs)
+                await response.aread()
+                if response.status_code != scenario.expect:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.monotonic() - started
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "errors": errors
+    }
+
+
+@asynccontextmanager
+async def _client(args, scratch: Optional[str]):
+    limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency * 2)
+    timeout = httpx.Timeout(60.0)
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=timeout) as client:
+            yield client
+    elif args.target == "inprocess":
+        import main
+        async with main.app.router.lifespan_context(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://scroll-bench", timeout=timeout) as client:
+                yield client
+    else:
+        with scroll_server(scratch_env(scratch), workers=args.workers) as base_url:
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+                yield client
+
+
+async def run(args) -> Dict[str, Any]:
+    selected = [scenario for scenario in SCENARIOS if not args.scenarios or scenario.name in args.scenarios]
+    unknown = set(args.scenarios or ()) - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    with (nullcontext(None) if args.url else tempfile.TemporaryDirectory()) as scratch:
+        if scratch and args.target == "inprocess":
+            os.environ.update(scratch_env(scratch))
+        async with _client(args, scratch) as client:
+            ctx = await _seed(client, scratch_env(scratch)["SCROLL_KEY_DIR"] if scratch else None)
+            results = {}
+            for scenario in selected:
+                results[scenario.name] = await _run_scenario(client, scenario, ctx, args.concurrency, args.duration)
+                print(f"  {scenario.name:<34} {results[scenario.name]['rps']:>9} rps", file=sys.stderr)
+
+    return {
+        "benchmark": "load",
+        "environment": environment(),
+        "config": {
+            "target": args.url or args.target,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "workers": args.workers
+        },
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scroll backend endpoint load driver")
+    parser.add_argument("--target", choices=["local", "inprocess"], default="local")
+    parser.add_argument("--url", help="Drive an already running server instead")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes for --target local")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per scenario")
+    parser.add_argument("--scenarios", type=lambda value: value.split(","),
+                        help=f"Comma-separated subset of: {', '.join(s.name for s in SCENARIOS)}")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    sys.exit(emit(asyncio.run(run(args)), args))
+
+
+if __name__ == "__main__":
+    main()
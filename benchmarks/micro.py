@@ -0,0 +1,147 @@
+"""
+Micro-benchmarks for the scroll backend's hot paths
+
+Times ScrollCrypto signing and verification for every signer, license
+token encode/verify (decoded and cached), canonical JSON, FastAPI
+response encoding and funding parsing. Each case is calibrated to run
+for about ``--min-time`` seconds per repeat and reports the best repeat.
+
+    python -m benchmarks.micro --output results/micro.json
+    python -m benchmarks.micro --baseline results/micro.json --threshold 0.2
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict
+import argparse
+import copy
+import sys
+import tempfile
+import time
+
+from ._results import add_output_arguments, emit, environment
+
+SCROLL_DATA = {
+    "scroll_id": "scroll_faa_1700000000_0a1b2c3d",
+    "app_concept": "Benchmark Scroll",
+    "funding_amount": 75000.0,
+    "treaty_position": 248,
+    "scroll_compliance": True,
+    "timestamp": "2026-01-01T00:00:00.000000"
+}
+
+TOKEN_PAYLOAD = {
+    "scroll_id": SCROLL_DATA["scroll_id"],
+    "claim_root_license": "claim_faa_1700000000_0a1b2c3d",
+    "treaty_position": 248,
+    "funding_amount": 75000.0
+}
+
+
+def measure(fn: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, float]:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / 4 or number >= 1 << 24:
+            break
+        number *= 4
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return {"ns_per_op": round(best * 1e9, 1), "ops_per_sec": round(1 / best, 1), "loops": number}
+
+
+def cases(key_dir: str) -> Dict[str, Callable[[], Any]]:
+    from fastapi.encoders import jsonable_encoder
+
+    import main
+    from scroll_backend.canonical import FastJSONResponse, canonical_bytes
+    from scroll_backend.crypto import ScrollCrypto
+    from scroll_backend.keystore import ScrollKeyStore
+    from scroll_backend.license_tokens import LicenseTokenVerifier
+    from scroll_backend.signers import SIGNERS
+
+    selected: Dict[str, Callable[[], Any]] = {}
+    for alg in SIGNERS:
+        crypto = ScrollCrypto(ScrollKeyStore(f"{key_dir}/{alg}"))
+        crypto.key_store.rotate(alg)
+        signature = crypto.sign_scroll(SCROLL_DATA)
+        selected[f"scroll_sign_{alg}"] = lambda crypto=crypto: crypto.sign_scroll(SCROLL_DATA)
+        selected[f"scroll_verify_{alg}"] = (
+            lambda crypto=crypto, signature=signature: crypto.verify_scroll_signature(SCROLL_DATA, signature)
+        )
+
+    crypto = ScrollCrypto(ScrollKeyStore(f"{key_dir}/tokens"))
+    token = crypto.generate_jwt_token(dict(TOKEN_PAYLOAD))
+    cached_verifier = LicenseTokenVerifier(crypto.token_keys)
+    selected["jwt_encode"] = lambda: crypto.generate_jwt_token(dict(TOKEN_PAYLOAD))
+    selected["jwt_verify_decoded"] = lambda: crypto.token_keys.decode(token)
+    selected["jwt_verify_cached"] = lambda: cached_verifier.verify(token)
+
+    selected["canonical_json"] = lambda: canonical_bytes(SCROLL_DATA)
+
+    intake_response = {
+        "success": True,
+        "message": "VOORWAARD MARS - Planetary motion authorized",
+        "scroll_id": SCROLL_DATA["scroll_id"],
+        "treaty_position": 248,
+        "claim_root_license": TOKEN_PAYLOAD["claim_root_license"],
+        "license_token": token,
+        "scroll_signature": "rsa-pss:20260101-0a1b2c3d:" + "ab" * 256,
+        "vault_mesh_sync": True,
+        "planetary_motion": "AUTHORIZED",
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    license_response = {
+        "success": True,
+        "license": main.ClaimRootLicense(
+            license_id="license_faa_1700000000_0a1b2c3d", app_id="bench_app", licensee_id="bench_licensee",
+            treaty_position=248, scroll_bound=True, generated_at=datetime.utcnow(),
+            expires_at=datetime.utcnow(), pdf_url="/licenses/license_faa_1700000000_0a1b2c3d.pdf"
+        ).dict(),
+        "token": token,
+        "vault_mesh_sync": True
+    }
+    selected["response_encode_intake"] = lambda: FastJSONResponse(jsonable_encoder(copy.copy(intake_response))).body
+    selected["response_encode_license"] = lambda: FastJSONResponse(jsonable_encoder(copy.copy(license_response))).body
+    selected["funding_parse"] = lambda: main.parse_funding_declaration("$75,000")
+    return selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scroll backend micro-benchmarks")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cases", type=lambda value: value.split(","), help="Comma-separated subset of cases")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as key_dir:
+        available = cases(key_dir)
+        unknown = set(args.cases or ()) - set(available)
+        if unknown:
+            raise SystemExit(f"Unknown cases: {', '.join(sorted(unknown))}")
+        for name, fn in available.items():
+            if args.cases and name not in args.cases:
+                continue
+            results[name] = measure(fn, args.min_time, args.repeat)
+            print(f"  {name:<28} {results[name]['ns_per_op']:>12.1f} ns/op", file=sys.stderr)
+
+    sys.exit(emit({
+        "benchmark": "micro",
+        "environment": environment(),
+        "config": {"min_time": args.min_time, "repeat": args.repeat},
+        "results": results
+    }, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Idle-subscriber load test for the scroll pulse stream
+
+For each subscriber count, starts the backend, opens that many SSE
+connections to /api/scroll/pulse/stream, lets them idle across several
+pulses and samples the server's CPU time from /proc. Idle subscribers
+should add little beyond the per-pulse fan-out. Results use the shared
+format (one ``subscribers_<n>`` case each, see ``benchmarks._results``);
+the table goes to stderr.
+
+    python -m benchmarks.pulse_stream --subscribers 0,1000,5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import aiohttp
+
+from ._results import add_output_arguments, emit, environment
+from ._server import process_cpu_seconds, scroll_server
+
+
+async def _measure(base_url, subscribers: int, warmup: float, window: float):
+    received = 0
+    connected = 0
+
+    async def subscriber(session):
+        nonlocal received, connected
+        async with session.get(f"{base_url}/api/scroll/pulse/stream") as response:
+            connected += 1
+            async for line in response.content:
+                if line.startswith(b"data:"):
+                    received += 1
+
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=None)
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0), timeout=timeout) as session:
+        tasks = [asyncio.create_task(subscriber(session)) for _ in range(subscribers)]
+        while connected < subscribers:
+            await asyncio.sleep(0.1)
+        await asyncio.sleep(warmup)
+
+        received_before = received
+        cpu_before = process_cpu_seconds(base_url.pid)
+        started = time.monotonic()
+        await asyncio.sleep(window)
+        cpu_used = process_cpu_seconds(base_url.pid) - cpu_before
+        elapsed = time.monotonic() - started
+
+        async with session.get(f"{base_url}/api/scroll/pulse") as response:
+            pulse = await response.json()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        "subscribers": subscribers,
+        "server_cpu_percent": round(cpu_used / elapsed * 100, 2),
+        "events_delivered": received - received_before,
+        "hub_subscribers": pulse.get("stream_subscribers")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scroll pulse SSE idle-subscriber load test")
+    parser.add_argument("--subscribers", default="0,1000,5000")
+    parser.add_argument("--pulse-interval", type=float, default=3.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--window", type=float, default=9.0)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'subscribers':>11} {'server cpu %':>13} {'events':>8}", file=sys.stderr)
+    for count in (int(value) for value in args.subscribers.split(",")):
+        with scroll_server({"SCROLL_PULSE_INTERVAL": str(args.pulse_interval)}) as base_url:
+            row = results[f"subscribers_{count}"] = asyncio.run(_measure(base_url, count, args.warmup, args.window))
+        print(f"{row['subscribers']:>11} {row['server_cpu_percent']:>13} {row['events_delivered']:>8}", file=sys.stderr)
+
+    sys.exit(emit({
+        "benchmark": "pulse_stream",
+        "environment": environment(),
+        "config": {"pulse_interval": args.pulse_interval, "warmup": args.warmup, "window": args.window},
+        "results": results
+    }, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+CodeNest report sink benchmark
+
+Aggregates a synthetic ``.audit-cache`` (the audit_ingest generator) once to
+prime the incremental state, then writes the same report through every
+sink and compression the aggregator offers:
+
+    json        the single JSON document (the default)
+    ndjson      one finding per line between header and summary records
+    columnar    dictionary-encoded repo/type/severity/file/status columns
+
+each uncompressed, gzip, and zstd when ``zstandard`` is installed. Because
+no cache changed since the priming run, ``write_ms`` is almost entirely the
+sink. ``read_ms`` streams every finding back with ``iter_report``.
+
+    python -m benchmarks.report_formats --repos 500 --size-mb 256 --cache-dir /tmp/audit-cache
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ._results import add_output_arguments, emit, environment
+from .audit_ingest import MARKER, SCRIPTS_DIR, generate_cache
+
+
+def _aggregator_module():
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    import codenest_aggregator
+    return codenest_aggregator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CodeNest report sink benchmark")
+    parser.add_argument("--repos", type=int, default=500)
+    parser.add_argument("--size-mb", type=float, default=256, help="Approximate total cache size")
+    parser.add_argument("--cache-dir", help="Build (or reuse) the synthetic cache here instead of a temp dir")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N writes and reads per sink")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    codenest_aggregator = _aggregator_module()
+    compressions = [name for name in codenest_aggregator.COMPRESSIONS
+                    if name != "zstd" or codenest_aggregator.zstandard is not None]
+
+    with tempfile.TemporaryDirectory() as scratch:
+        cache_dir = args.cache_dir or os.path.join(scratch, "audit-cache")
+        config = generate_cache(cache_dir, args.repos, args.size_mb)
+
+        def aggregator(report_format: str = "json", compress: str = "none"):
+            instance = codenest_aggregator.CodeNestAggregator(
+                config["repos"], report_format=report_format, compress=compress
+            )
+            instance.audit_cache_dir = Path(cache_dir)
+            instance.reports_dir = Path(scratch)
+            instance.state_dir = Path(scratch) / "state"
+            return instance
+
+        # Parse every cache once; later runs only copy partials into the sink
+        findings = aggregator().collect_audits(Path(scratch) / "prime.json")["summary"]["total"]
+
+        results, json_bytes = {}, None
+        for report_format in codenest_aggregator.REPORT_FORMATS:
+            for compress in compressions:
+                name = report_format if compress == "none" else f"{report_format}_{compress}"
+                instance = aggregator(report_format, compress)
+                report_file = instance.report_path(name)
+                write_s, read_s = [], []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    instance.collect_audits(report_file)
+                    write_s.append(time.perf_counter() - started)
+
+                    started = time.perf_counter()
+                    read = sum(1 for _ in codenest_aggregator.iter_report(report_file))
+                    read_s.append(time.perf_counter() - started)
+                    assert read == findings, f"{name}: read {read} of {findings} findings"
+
+                size = os.path.getsize(report_file)
+                json_bytes = json_bytes or size
+                results[name] = {
+                    "size_mb": round(size / 1024 / 1024, 2),
+                    "size_vs_json": round(size / json_bytes, 3),
+                    "write_ms": round(min(write_s) * 1000, 1),
+                    "read_ms": round(min(read_s) * 1000, 1)
+                }
+                print(f"  {name:<16} {results[name]['size_mb']:>9} MB {results[name]['write_ms']:>9} ms write "
+                      f"{results[name]['read_ms']:>9} ms read", file=sys.stderr)
+                os.unlink(report_file)
+
+        cache_bytes = sum(entry.stat().st_size for entry in os.scandir(cache_dir)
+                          if entry.name.endswith(".json") and entry.name != MARKER)
+
+    sys.exit(emit({
+        "benchmark": "report_formats",
+        "environment": environment(),
+        "config": {"repos": args.repos, "cache_mb": round(cache_bytes / 1024 / 1024, 1), "findings": findings,
+                   "parser": "ijson" if codenest_aggregator.ijson else "raw_decode", "compressions": compressions},
+        "results": results
+    }, args))
+
+
+if __name__ == "__main__":
+    main()
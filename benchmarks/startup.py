@@ -0,0 +1,218 @@
+"""
+Cold-start benchmark for the scroll backend
+
+Each sample runs in a fresh interpreter and times ``import main`` plus the
+first signature, for three cases:
+
+    generate  RSA-2048 generated in-process (the old import-time behaviour)
+    cold      empty SCROLL_KEY_DIR: key store generates and persists a key
+    warm      populated SCROLL_KEY_DIR: key store loads the key from disk
+
+It also profiles ``python -X importtime -c "import main"``: the median
+cost of importing main on top of a bare interpreter, the heaviest
+top-level imports, and whether the optional subsystems (aiohttp,
+dnspython, PyJWT, cryptography) stayed deferred. Finally it spawns uvicorn
+and times process start to the first 200 from /health and from /ready,
+with and without SCROLL_PREWARM.
+
+Results use the shared format (``--output``/``--baseline``, see
+``benchmarks._results``); the tables go to stderr.
+
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+from ._results import add_output_arguments, emit, environment
+from ._server import REPO_ROOT, free_port
+
+DEFERRED_MODULES = ("aiohttp", "dns", "jwt", "cryptography")
+
+PROBE = """
+import time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+if {generate!r}:
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    rsa.generate_private_key(public_exponent=65537, key_size=2048)
+main.scroll_crypto.sign_scroll({{"scroll_id": "startup_probe"}})
+signed = time.perf_counter()
+print(imported - started, signed - started)
+"""
+
+
+def _sample(key_dir: str, generate: bool = False):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(generate=generate)],
+        cwd=REPO_ROOT,
+        env=dict(os.environ, SCROLL_KEY_DIR=key_dir),
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.split()
+    return float(output[0]), float(output[1])
+
+
+def _summarise(samples):
+    return {
+        "import_ms": round(statistics.median(s[0] for s in samples) * 1000, 1),
+        "first_sign_ms": round(statistics.median(s[1] for s in samples) * 1000, 1),
+        "key_and_sign_ms": round(statistics.median(s[1] - s[0] for s in samples) * 1000, 1)
+    }
+
+
+def _importtime(code: str):
+    """(self_us, cumulative_us, depth, module) rows from ``-X importtime``"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+
+def import_profile(runs: int, top: int = 10):
+    main_ms, bare_ms = [], []
+    rows = []
+    for _ in range(runs):
+        bare_ms.append(sum(row[1] for row in _importtime("pass") if row[2] == 0) / 1000)
+        rows = _importtime("import main")
+        main_ms.append(next(row[1] for row in rows if row[3] == "main") / 1000)
+    # importtime prints a module's imports just before it, so main's subtree
+    # is the run of nested rows immediately above the "main" row
+    end = next(index for index, row in enumerate(rows) if row[3] == "main")
+    start = end
+    while start > 0 and rows[start - 1][2] > 0:
+        start -= 1
+    children = sorted((row for row in rows[start:end] if row[2] == 1), key=lambda row: -row[1])
+    loaded = {row[3].split(".")[0] for row in rows}
+    return {
+        "import_main_ms": round(statistics.median(main_ms), 1),
+        "interpreter_imports_ms": round(statistics.median(bare_ms), 1),
+        "heaviest_imports": [{"module": row[3], "cumulative_ms": round(row[1] / 1000, 1)} for row in children[:top]],
+        "deferred": {module: module not in loaded for module in DEFERRED_MODULES}
+    }
+
+
+def _status(url: str) -> int:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return 0
+
+
+def time_to_ready(prewarm: bool, scratch: str, timeout: float = 60.0):
+    """Milliseconds from spawning uvicorn to the first 200 on /health and on /ready"""
+    port = free_port()
+    env = dict(
+        os.environ,
+        SCROLL_PREWARM="1" if prewarm else "0",
+        SCROLL_KEY_DIR=os.path.join(scratch, "keys"),
+        SCROLL_STORE_PATH=os.path.join(scratch, "store", "scrolls.db"),
+        SCROLL_SHARED_DIR=os.path.join(scratch, "shared"),
+        SCROLL_PDF_CACHE_DIR=os.path.join(scratch, "pdf-cache")
+    )
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    timings = {}
+    try:
+        while len(timings) < 2:
+            if proc.poll() is not None or time.perf_counter() - started > timeout:
+                raise RuntimeError("scroll backend failed to become ready")
+            for name in ("health", "ready"):
+                if name not in timings and _status(f"http://127.0.0.1:{port}/{name}") == 200:
+                    timings[name] = time.perf_counter() - started
+            time.sleep(0.005)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+    return timings["health"], timings["ready"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scroll backend startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as warm_dir:
+        _sample(warm_dir)  # populate the warm key directory
+        generate, cold, warm = [], [], []
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as scratch_dir:
+                generate.append(_sample(warm_dir, generate=True))
+                cold.append(_sample(scratch_dir))
+            warm.append(_sample(warm_dir))
+        first_signature = {
+            "generate": _summarise(generate),
+            "cold": _summarise(cold),
+            "warm": _summarise(warm)
+        }
+    results.update(first_signature)
+
+    profile = import_profile(args.runs)
+    results["imports"] = {
+        "import_main_ms": profile["import_main_ms"],
+        "interpreter_imports_ms": profile["interpreter_imports_ms"]
+    }
+    serving = {}
+    for prewarm in (False, True):
+        samples = []
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as scratch:
+                samples.append(time_to_ready(prewarm, scratch))
+        serving["prewarm" if prewarm else "lazy"] = {
+            "health_ms": round(statistics.median(s[0] for s in samples) * 1000, 1),
+            "ready_ms": round(statistics.median(s[1] for s in samples) * 1000, 1)
+        }
+    results.update({f"serving_{case}": row for case, row in serving.items()})
+
+    print(f"{'case':<10} {'import ms':>10} {'first sign ms':>14} {'key + sign ms':>14}", file=sys.stderr)
+    for case, row in first_signature.items():
+        print(f"{case:<10} {row['import_ms']:>10} {row['first_sign_ms']:>14} {row['key_and_sign_ms']:>14}",
+              file=sys.stderr)
+
+    print(f"\nimport main: {profile['import_main_ms']} ms (bare interpreter imports "
+          f"{profile['interpreter_imports_ms']} ms)", file=sys.stderr)
+    for row in profile["heaviest_imports"]:
+        print(f"  {row['module']:<36} {row['cumulative_ms']:>8} ms", file=sys.stderr)
+    print("deferred: " + ", ".join(f"{module}={'yes' if ok else 'NO'}" for module, ok in profile["deferred"].items()),
+          file=sys.stderr)
+
+    print(f"\n{'serving':<10} {'/health ms':>10} {'/ready ms':>10}", file=sys.stderr)
+    for case, row in serving.items():
+        print(f"{case:<10} {row['health_ms']:>10} {row['ready_ms']:>10}", file=sys.stderr)
+
+    sys.exit(emit({
+        "benchmark": "startup",
+        "environment": environment(),
+        "config": {"runs": args.runs},
+        "imports": {"heaviest": profile["heaviest_imports"], "deferred": profile["deferred"]},
+        "results": results
+    }, args))
+
+if __name__ == "__main__":
+    main()
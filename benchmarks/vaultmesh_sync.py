@@ -0,0 +1,216 @@
+"""
+VaultMesh sync engine check and benchmark against a local stub HTTP server
+
+The stub accepts POSTed batches, fails the first ``--fail-first`` requests
+with 503 to exercise retries, and answers after ``--latency`` seconds.
+Scenarios:
+
+    healthy   every scroll arrives once, after the 503s were retried
+    failing   an always-failing stub: every scroll lands in the dead-letter file
+    replay    replay_dead_letters re-queues that spill to a healthy stub and
+              truncates the file; a full queue spills instead of blocking
+
+Batches must never exceed ``--batch-size``. Exits 1 if any check fails,
+then reports timings.
+
+    python -m benchmarks.vaultmesh_sync --scrolls 20000 --batch-size 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from aiohttp import web
+
+from scroll_backend.vaultmesh_sync import VaultMeshSyncEngine
+
+from ._results import add_output_arguments, emit, environment
+from ._server import free_port
+
+
+async def start_stub(port: int, latency: float, fail_first: int, always_fail: bool = False):
+    state = {"requests": 0, "scrolls": 0, "max_batch": 0, "scroll_ids": set()}
+
+    async def sync(request):
+        state["requests"] += 1
+        request_number = state["requests"]
+        body = await request.json()
+        state["max_batch"] = max(state["max_batch"], len(body["scrolls"]))
+        await asyncio.sleep(latency)
+        if always_fail or request_number <= fail_first:
+            return web.Response(status=503)
+        state["scrolls"] += len(body["scrolls"])
+        state["scroll_ids"].update(scroll["scroll_id"] for scroll in body["scrolls"])
+        return web.json_response({"accepted": len(body["scrolls"])})
+
+    app = web.Application()
+    app.router.add_post("/sync", sync)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, state
+
+
+def read_spill(path: str) -> list:
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+    except FileNotFoundError:
+        return []
+
+
+def scroll_ids(count: int):
+    return [f"scroll_bench_{index}" for index in range(count)]
+
+
+def engine_for(args, port: int, dead_letter_path: str, **overrides) -> VaultMeshSyncEngine:
+    options = dict(
+        endpoint=f"http://127.0.0.1:{port}/sync",
+        batch_size=args.batch_size,
+        flush_interval=args.flush_interval,
+        max_queue=args.scrolls,
+        max_retries=5,
+        backoff_base=0.01,
+        dead_letter_path=dead_letter_path
+    )
+    options.update(overrides)
+    return VaultMeshSyncEngine(**options)
+
+
+def check(failures: list, scenario: str, condition: bool, message: str):
+    if not condition:
+        failures.append(f"{scenario}: {message}")
+
+
+async def run_healthy(args, scratch: str, failures: list) -> dict:
+    port = free_port()
+    runner, state = await start_stub(port, args.latency, args.fail_first)
+    engine = engine_for(args, port, os.path.join(scratch, "healthy.ndjson"))
+    engine.start()
+    started = time.perf_counter()
+    engine.enqueue_many([{"scroll_id": scroll_id, "validation": "CONFIRMED"} for scroll_id in scroll_ids(args.scrolls)])
+    await engine.stop(drain_timeout=120)
+    elapsed = time.perf_counter() - started
+    await runner.cleanup()
+
+    stats = engine.stats()
+    check(failures, "healthy", stats["retries"] >= args.fail_first,
+          f"{stats['retries']} retries for {args.fail_first} 503 responses")
+    check(failures, "healthy", stats["synced"] == args.scrolls and state["scrolls"] == args.scrolls,
+          f"synced {stats['synced']}, stub accepted {state['scrolls']} of {args.scrolls}")
+    check(failures, "healthy", state["scroll_ids"] == set(scroll_ids(args.scrolls)), "stub did not see every scroll")
+    check(failures, "healthy", stats["dead_lettered"] == 0 and not os.path.exists(engine.dead_letter_path),
+          f"{stats['dead_lettered']} scrolls dead-lettered")
+    check(failures, "healthy", 0 < state["max_batch"] <= args.batch_size,
+          f"largest batch {state['max_batch']} > batch_size {args.batch_size}")
+    return {
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "scrolls_per_sec": round(args.scrolls / elapsed),
+        "stub_requests": state["requests"],
+        "max_batch": state["max_batch"],
+        **{key: stats[key] for key in ("batches_sent", "retries", "synced")}
+    }
+
+
+async def run_failing(args, dead_letter_path: str, failures: list) -> dict:
+    port = free_port()
+    runner, state = await start_stub(port, args.latency, 0, always_fail=True)
+    engine = engine_for(args, port, dead_letter_path, max_retries=2)
+    engine.start()
+    payloads = [{"scroll_id": scroll_id} for scroll_id in scroll_ids(args.scrolls // 10)]
+    started = time.perf_counter()
+    engine.enqueue_many(payloads)
+    await engine.stop(drain_timeout=120)
+    elapsed = time.perf_counter() - started
+    await runner.cleanup()
+
+    stats = engine.stats()
+    check(failures, "failing", stats["dead_lettered"] == len(payloads),
+          f"dead_lettered {stats['dead_lettered']} of {len(payloads)}")
+    spilled = read_spill(dead_letter_path)
+    check(failures, "failing", sorted(entry["scroll"]["scroll_id"] for entry in spilled)
+          == sorted(payload["scroll_id"] for payload in payloads), "dead-letter file does not hold every scroll")
+    check(failures, "failing", all(entry["reason"] for entry in spilled), "dead-letter entries without a reason")
+    check(failures, "failing", stats["synced"] == 0 and state["scrolls"] == 0, "stub accepted scrolls")
+    check(failures, "failing", state["max_batch"] <= args.batch_size,
+          f"largest batch {state['max_batch']} > batch_size {args.batch_size}")
+    return {
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "stub_requests": state["requests"],
+        **{key: stats[key] for key in ("batches_sent", "retries", "failed_batches", "dead_lettered")}
+    }
+
+
+async def run_replay(args, dead_letter_path: str, failures: list) -> dict:
+    expected = {entry["scroll"]["scroll_id"] for entry in read_spill(dead_letter_path)}
+    port = free_port()
+    runner, state = await start_stub(port, args.latency, 0)
+    engine = engine_for(args, port, dead_letter_path)
+    engine.start()
+    started = time.perf_counter()
+    replayed = await engine.replay_dead_letters()
+    check(failures, "replay", replayed == len(expected), f"re-queued {replayed} of {len(expected)}")
+    check(failures, "replay", not os.path.exists(dead_letter_path), "dead-letter file not truncated")
+    check(failures, "replay", await engine.replay_dead_letters() == 0, "second replay re-queued scrolls")
+    await engine.stop(drain_timeout=120)
+    elapsed = time.perf_counter() - started
+    await runner.cleanup()
+    check(failures, "replay", state["scroll_ids"] == expected, "stub did not receive every replayed scroll")
+
+    # A full queue spills to the dead-letter file instead of blocking the producer
+    full_path = os.path.join(os.path.dirname(dead_letter_path), "queue_full.ndjson")
+    full = engine_for(args, port, full_path, max_queue=1)
+    accepted = full.enqueue_many([{"scroll_id": "queued"}, {"scroll_id": "overflow"}])
+    await full.stop(drain_timeout=0)
+    reasons = sorted(entry["reason"] for entry in read_spill(full_path))
+    check(failures, "replay", accepted == 1 and reasons == ["queue_full", "shutdown"],
+          f"queue_full spill: accepted {accepted}, reasons {reasons}")
+    return {"elapsed_ms": round(elapsed * 1000, 1), "replayed": replayed, "stub_requests": state["requests"]}
+
+
+async def run(args, failures: list) -> dict:
+    with tempfile.TemporaryDirectory() as scratch:
+        spill = os.path.join(scratch, "failing.ndjson")
+        return {
+            "healthy": await run_healthy(args, scratch, failures),
+            "failing": await run_failing(args, spill, failures),
+            "replay": await run_replay(args, spill, failures)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VaultMesh sync engine check and benchmark")
+    parser.add_argument("--scrolls", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--flush-interval", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--fail-first", type=int, default=3)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    failures = []
+    results = asyncio.run(run(args, failures))
+    code = emit({
+        "benchmark": "vaultmesh_sync",
+        "environment": environment(),
+        "config": {"scrolls": args.scrolls, "batch_size": args.batch_size, "flush_interval": args.flush_interval,
+                   "latency": args.latency, "fail_first": args.fail_first},
+        "checks": {"failures": failures},
+        "results": results
+    }, args)
+
+    if failures:
+        print(f"❌ {len(failures)} VaultMesh sync check(s) failed:", file=sys.stderr)
+        for failure in failures:
+            print(f"   {failure}", file=sys.stderr)
+        sys.exit(1)
+    print("✅ Retries, batching, dead-letter spill and replay behave as expected", file=sys.stderr)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,17 +5,12 @@ Scroll-Signed TreatySync & ClaimRoot API
 VaultMesh Integration with Cryptographic Validation
 """
 
-from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, BackgroundTasks, Depends, Header, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 from typing import Optional, List, Dict, Any
 import asyncio
-import aiohttp
-import dns.resolver
-import jwt
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.backends import default_backend
 import time
 import uuid
 import json
@@ -23,6 +18,24 @@ import logging
 from datetime import datetime, timedelta
 import os
 
+# Readiness timings count from here (module load, after the imports above)
+PROCESS_STARTED = time.monotonic()
+
+from scroll_backend.audit_reports import SEVERITIES, AuditReportCache
+from scroll_backend.canonical import FastJSONResponse, json_line
+from scroll_backend.crypto import ScrollCrypto
+from scroll_backend.crypto_executor import CryptoExecutor, CryptoPoolSaturated
+from scroll_backend.dns_monitor import DNSHealthMonitor
+from scroll_backend.idempotency import IdempotencyCache, IdempotencyKeyReused, request_fingerprint
+from scroll_backend.license_pdf import PDFRenderCache, license_fingerprint
+from scroll_backend.license_tokens import InvalidLicenseToken, LicenseTokenVerifier, RevokedLicenseToken
+from scroll_backend.metrics import REGISTRY, PrometheusMiddleware, stage_timer
+from scroll_backend.pulse_hub import PulseHub
+from scroll_backend.pulse_history import PulseHistory
+from scroll_backend.shared_state import LeaderLease, SharedCounters
+from scroll_backend.store import ScrollStore
+from scroll_backend.vaultmesh_sync import VaultMeshSyncEngine
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("faa_scroll_backend")
@@ -30,7 +43,8 @@ logger = logging.getLogger("faa_scroll_backend")
 app = FastAPI(
     title="FAA.zone™ SCROLL BACKEND",
     description="Python-native scroll architecture for TreatySync and ClaimRoot handling",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS configuration for frontend integration
@@ -42,6 +56,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route request histograms for /metrics
+app.add_middleware(PrometheusMiddleware)
+
 # Scroll Architecture Data Models
 class ScrollMetadata(BaseModel):
     scroll_id: str
@@ -58,6 +75,30 @@ class TreatySyncRequest(BaseModel):
     scroll_compliance: bool
     metadata: Optional[Dict[str, Any]] = None
 
+class ScrollValidationItem(BaseModel):
+    scroll_id: str
+    signature: str
+    scroll_data: Dict[str, Any]
+
+class ScrollValidationBatch(BaseModel):
+    scrolls: List[ScrollValidationItem]
+
+# Batch intake limits: items per request and items per crypto pool task
+BATCH_MAX_ITEMS = int(os.getenv("SCROLL_BATCH_MAX_ITEMS", "10000"))
+BATCH_CHUNK_SIZE = int(os.getenv("SCROLL_BATCH_CHUNK_SIZE", "64"))
+MIN_FUNDING_AMOUNT = 50000
+
+def parse_funding_declaration(funding_declaration: str) -> float:
+    """Parse a "$75,000"-style funding declaration"""
+    with stage_timer("funding_parse"):
+        return float(funding_declaration.replace('$', '').replace(',', ''))
+
+def funding_shortfall(funding_amount: float) -> Optional[str]:
+    """Describe why a funding amount misses the minimum fuel load, if it does"""
+    if funding_amount < MIN_FUNDING_AMOUNT:
+        return f"Minimum fuel load not met. Required: $50,000, Provided: ${funding_amount:,.2f}"
+    return None
+
 class ClaimRootLicense(BaseModel):
     license_id: str
     app_id: str
@@ -77,132 +118,301 @@ class VaultMeshStatus(BaseModel):
     scrolls_active: int
     mars_condition: str
 
-# Cryptographic utilities for scroll signing
-class ScrollCrypto:
-    def __init__(self):
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-            backend=default_backend()
-        )
-        self.public_key = self.private_key.public_key()
-    
-    def sign_scroll(self, scroll_data: dict) -> str:
-        """Generate cryptographic signature for scroll data"""
-        message = json.dumps(scroll_data, sort_keys=True).encode()
-        signature = self.private_key.sign(
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
-        return signature.hex()
-    
-    def verify_scroll_signature(self, scroll_data: dict, signature: str) -> bool:
-        """Verify scroll signature"""
-        try:
-            message = json.dumps(scroll_data, sort_keys=True).encode()
-            self.public_key.verify(
-                bytes.fromhex(signature),
-                message,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
-            return True
-        except Exception:
-            return False
-
-    def generate_jwt_token(self, payload: dict, expires_hours: int = 24) -> str:
-        """Generate JWT token for ClaimRoot licensing"""
-        payload.update({
-            'exp': datetime.utcnow() + timedelta(hours=expires_hours),
-            'iat': datetime.utcnow(),
-            'iss': 'faa.zone.scroll.backend'
-        })
-        return jwt.encode(payload, "faa_scroll_secret", algorithm="HS256")
-
 # Initialize crypto handler
 scroll_crypto = ScrollCrypto()
 
+# Signing and verification run on a bounded worker pool, off the event loop
+crypto_executor = CryptoExecutor(scroll_crypto)
+
+# Durable scroll / license store and treaty position sequence
+scroll_store = ScrollStore()
+pdf_cache = PDFRenderCache()
+
+# Completed responses replayed for retried Idempotency-Key requests
+idempotency_cache = IdempotencyCache()
+
+# Latest CodeNest aggregator report, indexed for the Queen Bee endpoints
+audit_reports = AuditReportCache()
+AUDIT_PAGE_MAX = 1000
+
+# License token checks: cached claims plus a revocation set synced from the store
+license_verifier = LicenseTokenVerifier(scroll_crypto.token_keys)
+REVOCATION_REFRESH_SECONDS = float(os.getenv("SCROLL_REVOCATION_REFRESH", "5"))
+revocation_sync = {"seq": 0, "checked_at": 0.0}
+
+async def sync_revocations(force: bool = False):
+    """Pull revocations recorded by any worker since the last sync"""
+    if not force and time.monotonic() - revocation_sync["checked_at"] < REVOCATION_REFRESH_SECONDS:
+        return
+    revocation_sync["checked_at"] = time.monotonic()
+    identifiers, revocation_sync["seq"] = await scroll_store.revocations_since(revocation_sync["seq"])
+    license_verifier.revoke(identifiers)
+
+async def require_license_token(
+    authorization: Optional[str] = Header(None),
+    x_license_token: Optional[str] = Header(None)
+) -> Dict[str, Any]:
+    """Verified ClaimRoot token claims from ``Authorization: Bearer`` or ``X-License-Token``"""
+    token = x_license_token
+    if authorization and authorization[:7].lower() == "bearer ":
+        token = authorization[7:].strip()
+    if not token:
+        raise HTTPException(status_code=401, detail="License token required",
+                            headers={"WWW-Authenticate": "Bearer"})
+    try:
+        await sync_revocations()
+    except Exception as e:
+        logger.warning(f"⚠️ Revocation sync failed, using cached set: {e}")
+    try:
+        return license_verifier.verify(token)
+    except RevokedLicenseToken as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except InvalidLicenseToken as e:
+        raise HTTPException(status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"})
+
 # VaultMesh integration utilities
 class VaultMeshConnector:
     def __init__(self):
-        self.pulse_interval = 9  # 9-second intervals
-        self.last_pulse = datetime.utcnow()
-        self.nodes_active = 89
-        self.network_health = 98
-        self.scrolls_active = 247
+        self.pulse_interval = float(os.getenv("SCROLL_PULSE_INTERVAL", "9"))  # 9-second intervals
+        # Counters live in a segment every uvicorn worker maps, so totals
+        # and the leader's latest pulse are the same whichever worker answers
+        self.shared = SharedCounters({
+            "nodes_active": 89,
+            "network_health": 98,
+            "scrolls_active": 247,
+            "last_pulse_us": int(time.time() * 1e6),
+            "pulse_seq": 0,
+            "pulse_ts_us": 0,
+            "pulse_nodes_active": 0,
+            "pulse_scrolls_active": 0,
+            "pulse_network_health": 0
+        })
+        self.dns_monitor = DNSHealthMonitor()
+        self.sync_engine = VaultMeshSyncEngine(on_synced=self._record_sync)
+    
+    @property
+    def nodes_active(self) -> int:
+        return self.shared.get("nodes_active")
+    
+    @property
+    def network_health(self) -> int:
+        return self.shared.get("network_health")
+    
+    @property
+    def scrolls_active(self) -> int:
+        return self.shared.get("scrolls_active")
+    
+    @property
+    def last_pulse(self) -> datetime:
+        return datetime.utcfromtimestamp(self.shared.get("last_pulse_us") / 1e6)
+    
+    def _record_sync(self, count: int):
+        self.shared.add("scrolls_active", count)
+        self.shared.update({"last_pulse_us": int(time.time() * 1e6)})
+    
+    def record_pulse(self) -> Dict[str, Any]:
+        """Publish a new pulse to the shared segment (pulse leader only)"""
+        now = time.time()
+        values = self.shared.snapshot(("nodes_active", "scrolls_active", "network_health", "pulse_seq"))
+        self.shared.update({
+            "pulse_seq": values["pulse_seq"] + 1,
+            "pulse_ts_us": int(now * 1e6),
+            "pulse_nodes_active": values["nodes_active"],
+            "pulse_scrolls_active": values["scrolls_active"],
+            "pulse_network_health": values["network_health"]
+        })
+        return self._pulse(values["pulse_seq"] + 1, now, values["nodes_active"],
+                           values["scrolls_active"], values["network_health"])
+    
+    def latest_pulse(self, after_seq: int) -> Optional[Dict[str, Any]]:
+        """The leader's most recent pulse, if newer than ``after_seq``"""
+        if self.shared.get("pulse_seq") <= after_seq:
+            return None
+        values = self.shared.snapshot((
+            "pulse_seq", "pulse_ts_us", "pulse_nodes_active", "pulse_scrolls_active", "pulse_network_health"
+        ))
+        return self._pulse(values["pulse_seq"], values["pulse_ts_us"] / 1e6, values["pulse_nodes_active"],
+                           values["pulse_scrolls_active"], values["pulse_network_health"])
+    
+    @staticmethod
+    def _pulse(seq: int, timestamp: float, nodes_active: int, scrolls_active: int, network_health: int) -> Dict[str, Any]:
+        return {
+            "seq": seq,
+            "timestamp": datetime.utcfromtimestamp(timestamp).isoformat(),
+            "nodes_active": nodes_active,
+            "scrolls_active": scrolls_active,
+            "network_health": network_health,
+            "mars_condition": "PLANETARY_MOTION_AUTHORIZED"
+        }
     
     async def sync_with_vaultmesh(self, scroll_data: dict) -> bool:
-        """Synchronize scroll data with VaultMesh network"""
-        try:
-            # Simulate VaultMesh sync (replace with actual implementation)
-            await asyncio.sleep(0.1)  # Simulate network delay
-            self.last_pulse = datetime.utcnow()
-            self.scrolls_active += 1
-            logger.info(f"🧬 VaultMesh sync complete for scroll: {scroll_data.get('scroll_id')}")
-            return True
-        except Exception as e:
-            logger.error(f"❌ VaultMesh sync failed: {e}")
-            return False
+        """Queue scroll data for batched VaultMesh synchronization"""
+        return self.sync_engine.enqueue(scroll_data)
+    
+    async def sync_batch_with_vaultmesh(self, scrolls: List[dict]) -> bool:
+        """Queue a batch of scrolls for VaultMesh synchronization"""
+        return self.sync_engine.enqueue_many(scrolls) == len(scrolls)
     
     async def check_dns_status(self) -> Dict[str, Any]:
-        """Monitor DNS status for Cloudflare sync"""
-        try:
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = 2
-            resolver.lifetime = 2
-            
-            # Check FAA.zone DNS resolution
-            answers = resolver.resolve('faa.zone', 'A')
-            dns_healthy = len(answers) > 0
-            
-            return {
-                "dns_status": "SYNCHRONIZED" if dns_healthy else "DEGRADED",
-                "resolver_health": dns_healthy,
-                "last_check": datetime.utcnow().isoformat()
-            }
-        except Exception as e:
-            logger.warning(f"DNS check failed: {e}")
-            return {
-                "dns_status": "DEGRADED",
-                "resolver_health": False,
-                "last_check": datetime.utcnow().isoformat()
-            }
+        """Monitor DNS status for Cloudflare sync (served from the cached monitor)"""
+        return await self.dns_monitor.status()
 
 # Initialize VaultMesh connector
 vault_mesh = VaultMeshConnector()
 
+# Pulse broadcast for SSE / WebSocket dashboards
+pulse_hub = PulseHub()
+pulse_history = PulseHistory()
+PULSE_KEEPALIVE_SECONDS = 15
+
+# One worker (the flock holder) emits pulses; the others relay them
+pulse_leader = LeaderLease()
+PULSE_FOLLOW_SECONDS = float(os.getenv("SCROLL_PULSE_FOLLOW_INTERVAL", "1"))
+
 # Background task for scroll pulse emission
 async def emit_scroll_pulse():
     """Emit scroll pulse every 9 seconds for VaultMesh synchronization"""
+    seen_seq = 0
     while True:
+        delay = min(PULSE_FOLLOW_SECONDS, vault_mesh.pulse_interval)
         try:
-            pulse_data = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "nodes_active": vault_mesh.nodes_active,
-                "scrolls_active": vault_mesh.scrolls_active,
-                "network_health": vault_mesh.network_health,
-                "mars_condition": "PLANETARY_MOTION_AUTHORIZED"
-            }
-            logger.info(f"🧬 Scroll pulse emitted: {pulse_data}")
-            await asyncio.sleep(vault_mesh.pulse_interval)
+            if pulse_leader.try_acquire():
+                pulse_data = vault_mesh.record_pulse()
+                delay = vault_mesh.pulse_interval
+                logger.info(f"🧬 Scroll pulse emitted: {pulse_data}")
+            else:
+                pulse_data = vault_mesh.latest_pulse(seen_seq)
+            if pulse_data:
+                seen_seq = pulse_data["seq"]
+                pulse_history.append(
+                    time.time(), pulse_data["nodes_active"], pulse_data["scrolls_active"], pulse_data["network_health"]
+                )
+                pulse_hub.publish(pulse_data)
         except Exception as e:
             logger.error(f"❌ Scroll pulse emission failed: {e}")
-            await asyncio.sleep(vault_mesh.pulse_interval)
+        await asyncio.sleep(delay)
+
+# Scrape-time gauges and counters owned by the subsystems above
+REGISTRY.gauge_callback(
+    "scroll_crypto_pool_in_flight", "Crypto operations submitted or running", lambda: crypto_executor.in_flight
+)
+REGISTRY.gauge_callback(
+    "scroll_crypto_pool_saturation", "Crypto pool occupancy as a fraction of its queue limit",
+    lambda: crypto_executor.in_flight / crypto_executor.max_queue
+)
+REGISTRY.counter_callback(
+    "scroll_crypto_pool_rejected_total", "Crypto operations shed because the pool stayed saturated",
+    lambda: crypto_executor.rejected
+)
+REGISTRY.counter_callback(
+    "scroll_verify_cache_lookups_total", "Verified-signature cache lookups by result",
+    lambda: {(result,): crypto_executor.verify_cache.stats()[result] for result in ("hits", "misses")},
+    ("result",)
+)
+REGISTRY.gauge_callback(
+    "scroll_vaultmesh_sync_queue_depth", "Scrolls waiting for VaultMesh sync",
+    lambda: vault_mesh.sync_engine.stats()["queue_depth"]
+)
+REGISTRY.counter_callback(
+    "scroll_vaultmesh_sync_events_total", "VaultMesh sync engine events",
+    lambda: {(event,): count for event, count in vault_mesh.sync_engine.metrics.items()},
+    ("event",)
+)
+REGISTRY.gauge_callback(
+    "scroll_store_write_queue_depth", "Store writes waiting for the next group commit",
+    lambda: scroll_store.stats()["queued"]
+)
+REGISTRY.gauge_callback(
+    "scroll_background_tasks", "asyncio tasks alive on the event loop", lambda: len(asyncio.all_tasks())
+)
+REGISTRY.gauge_callback(
+    "scroll_pulse_leader", "1 on the worker currently emitting scroll pulses",
+    lambda: int(pulse_leader.is_leader)
+)
+REGISTRY.gauge_callback(
+    "scroll_pulse_subscribers", "Open SSE / WebSocket pulse subscriptions",
+    lambda: pulse_hub.stats()["subscribers"]
+)
+REGISTRY.gauge_callback(
+    "scroll_idempotency_in_flight", "Idempotent requests currently computing",
+    lambda: idempotency_cache.stats()["in_flight"]
+)
+REGISTRY.counter_callback(
+    "scroll_idempotency_lookups_total", "Idempotency-Key lookups by result",
+    lambda: {(result,): idempotency_cache.metrics[result] for result in ("hits", "collapsed", "misses")},
+    ("result",)
+)
+REGISTRY.counter_callback(
+    "scroll_license_token_verifications_total", "License token verifications by outcome",
+    lambda: {(outcome,): license_verifier.metrics[outcome] for outcome in ("verified", "cache_hits", "rejected", "revoked")},
+    ("outcome",)
+)
+
+# Readiness: /health answers as soon as the process is up, /ready only once
+# startup and the optional warm-up (SCROLL_PREWARM=1) have finished
+PREWARM = os.getenv("SCROLL_PREWARM", "0") == "1"
+readiness: Dict[str, Any] = {"ready": False, "startup_ms": None, "warmup": {}}
+
+def mark_ready():
+    readiness["ready"] = True
+    readiness["startup_ms"] = round((time.monotonic() - PROCESS_STARTED) * 1000, 1)
+    logger.info(f"✅ Scroll backend ready after {readiness['startup_ms']} ms")
+
+async def warm_scroll_crypto():
+    warmup_scroll = {"scroll_id": "scroll_faa_warmup", "treaty_position": 0}
+    signature = await crypto_executor.sign_scroll(warmup_scroll)
+    await crypto_executor.verify_scroll_signature(warmup_scroll, signature)
+
+async def warm_license_tokens():
+    await asyncio.to_thread(
+        lambda: scroll_crypto.token_keys.decode(scroll_crypto.generate_jwt_token({"scroll_id": "scroll_faa_warmup"}))
+    )
+
+async def warm_up():
+    """Pay first-request costs (keys, crypto pool, token ring, DNS) before taking traffic"""
+    for name, step in (
+        ("scroll_crypto", warm_scroll_crypto),
+        ("license_tokens", warm_license_tokens),
+        ("dns", vault_mesh.dns_monitor.status),
+        ("audit_report", audit_reports.current)
+    ):
+        started = time.perf_counter()
+        try:
+            await step()
+            readiness["warmup"][name] = round((time.perf_counter() - started) * 1000, 2)
+        except Exception as e:
+            readiness["warmup"][name] = None
+            logger.warning(f"⚠️ Warm-up step {name} failed: {e}")
+    mark_ready()
 
 # API Endpoints
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize scroll pulse emission on startup"""
+    crypto_executor.start()
+    scroll_store.start()
+    await sync_revocations(force=True)
+    vault_mesh.dns_monitor.start()
+    vault_mesh.sync_engine.start()
     asyncio.create_task(emit_scroll_pulse())
     logger.info("🚀 FAA.zone™ Scroll Backend initialized")
+    if PREWARM:
+        asyncio.create_task(warm_up())
+    else:
+        mark_ready()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the crypto worker pool and background refreshers"""
+    readiness["ready"] = False
+    vault_mesh.dns_monitor.stop()
+    await vault_mesh.sync_engine.stop()
+    crypto_executor.shutdown()
+    scroll_store.close()
+    audit_reports.close()
+    pulse_leader.release()
+    vault_mesh.shared.close()
 
 @app.get("/")
 async def root():
@@ -213,21 +423,47 @@ async def root():
         "planetary_motion": "AUTHORIZED"
     }
 
+async def idempotent(
+    scope: str, idempotency_key: Optional[str], payload: Any, response: Response, compute
+) -> Dict[str, Any]:
+    """Run ``compute`` once per Idempotency-Key, replaying its response for duplicates"""
+    if idempotency_key is None:
+        return await compute()
+    fingerprint = request_fingerprint(json.dumps(payload, sort_keys=True, default=str))
+    try:
+        result, replayed = await idempotency_cache.run(scope, idempotency_key, fingerprint, compute)
+    except IdempotencyKeyReused as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["Idempotent-Replayed"] = "true" if replayed else "false"
+    return result
+
 @app.post("/api/treaty-sync/intake")
-async def treaty_sync_intake(request: TreatySyncRequest, background_tasks: BackgroundTasks):
+async def treaty_sync_intake(
+    request: TreatySyncRequest,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None)
+):
     """Process scroll-signed TreatySync intake with cryptographic validation"""
+    return await idempotent(
+        "treaty-sync-intake", idempotency_key, request.dict(), response,
+        lambda: process_treaty_intake(request, background_tasks)
+    )
+
+async def process_treaty_intake(request: TreatySyncRequest, background_tasks: BackgroundTasks) -> Dict[str, Any]:
     try:
         # Validate funding requirement
-        funding_amount = float(request.funding_declaration.replace('$', '').replace(',', ''))
-        if funding_amount < 50000:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Minimum fuel load not met. Required: $50,000, Provided: ${funding_amount:,.2f}"
-            )
+        funding_amount = parse_funding_declaration(request.funding_declaration)
+        shortfall = funding_shortfall(funding_amount)
+        if shortfall:
+            raise HTTPException(status_code=400, detail=shortfall)
         
         # Generate scroll metadata
         scroll_id = f"scroll_faa_{int(time.time())}_{uuid.uuid4().hex[:8]}"
-        treaty_position = vault_mesh.scrolls_active + 1
+        treaty_position = await scroll_store.allocate_treaty_positions(1)
+        timestamp = datetime.utcnow().isoformat()
         
         scroll_data = {
             "scroll_id": scroll_id,
@@ -235,11 +471,11 @@ async def treaty_sync_intake(request: TreatySyncRequest, background_tasks: Backg
             "funding_amount": funding_amount,
             "treaty_position": treaty_position,
             "scroll_compliance": request.scroll_compliance,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
         
         # Generate cryptographic signature
-        scroll_signature = scroll_crypto.sign_scroll(scroll_data)
+        scroll_signature = await crypto_executor.sign_scroll(scroll_data)
         scroll_data["scroll_signature"] = scroll_signature
         
         # Schedule VaultMesh synchronization
@@ -253,6 +489,7 @@ async def treaty_sync_intake(request: TreatySyncRequest, background_tasks: Backg
             "treaty_position": treaty_position,
             "funding_amount": funding_amount
         })
+        await scroll_store.append_scroll({**scroll_data, "claim_root_license": claim_root_license})
         
         logger.info(f"🌍 VOORWAARD MARS: Treaty intake processed - {scroll_id}")
         
@@ -266,25 +503,187 @@ async def treaty_sync_intake(request: TreatySyncRequest, background_tasks: Backg
             "scroll_signature": scroll_signature,
             "vault_mesh_sync": True,
             "planetary_motion": "AUTHORIZED",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
         
+    except HTTPException:
+        raise
+    except CryptoPoolSaturated as e:
+        logger.warning(f"⚠️ Treaty sync intake shed: {e}")
+        raise HTTPException(status_code=503, detail="Scroll signing capacity exhausted, retry shortly",
+                            headers={"Retry-After": "1"})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid funding declaration: {str(e)}")
     except Exception as e:
         logger.error(f"❌ Treaty sync intake failed: {e}")
         raise HTTPException(status_code=500, detail="Treaty sync intake processing failed")
 
+def parse_treaty_batch(body: bytes, content_type: str) -> List[Any]:
+    """Decode a batch intake body given as a JSON array or as NDJSON"""
+    text = body.decode("utf-8").strip()
+    if "ndjson" not in content_type and text.startswith("["):
+        items = json.loads(text)
+        if not isinstance(items, list):
+            raise ValueError("Batch body must be a JSON array")
+        return items
+    items = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if line.strip():
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid NDJSON on line {line_number}: {e.msg}")
+    return items
+
+@app.post("/api/treaty-sync/intake/batch")
+async def treaty_sync_intake_batch(request: Request, background_tasks: BackgroundTasks):
+    """Process a batch of TreatySync intakes, streaming NDJSON results as chunks finish"""
+    try:
+        raw_items = parse_treaty_batch(await request.body(), request.headers.get("content-type", ""))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {str(e)}")
+    
+    if not raw_items:
+        raise HTTPException(status_code=400, detail="Batch contains no treaties")
+    if len(raw_items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {BATCH_MAX_ITEMS} treaties")
+    
+    # Validate everything up front so a bad item never leaves a half-issued batch
+    treaties = []
+    errors = []
+    for index, item in enumerate(raw_items):
+        try:
+            treaty = TreatySyncRequest(**item) if isinstance(item, dict) else None
+            if treaty is None:
+                raise ValueError("Treaty must be a JSON object")
+            funding_amount = parse_funding_declaration(treaty.funding_declaration)
+            shortfall = funding_shortfall(funding_amount)
+            if shortfall:
+                raise ValueError(shortfall)
+            treaties.append((treaty, funding_amount))
+        except ValidationError as e:
+            errors.append({"index": index, "error": [
+                {"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors()
+            ]})
+        except ValueError as e:
+            errors.append({"index": index, "error": str(e)})
+    if errors:
+        raise HTTPException(status_code=422, detail={"invalid_items": len(errors), "errors": errors[:100]})
+    
+    # One atomic reservation keeps the batch's treaty positions contiguous
+    first_position = await scroll_store.allocate_treaty_positions(len(treaties))
+    batch_timestamp = datetime.utcnow().isoformat()
+    batch_stamp = int(time.time())
+    
+    chunks = []
+    for chunk_start in range(0, len(treaties), BATCH_CHUNK_SIZE):
+        chunk = []
+        for offset, (treaty, funding_amount) in enumerate(treaties[chunk_start:chunk_start + BATCH_CHUNK_SIZE]):
+            index = chunk_start + offset
+            scroll_id = f"scroll_faa_{batch_stamp}_{uuid.uuid4().hex[:8]}"
+            claim_root_license = f"claim_faa_{batch_stamp}_{uuid.uuid4().hex[:8]}"
+            treaty_position = first_position + index
+            scroll_data = {
+                "scroll_id": scroll_id,
+                "app_concept": treaty.app_concept,
+                "funding_amount": funding_amount,
+                "treaty_position": treaty_position,
+                "scroll_compliance": treaty.scroll_compliance,
+                "timestamp": batch_timestamp
+            }
+            token_payload = {
+                "scroll_id": scroll_id,
+                "claim_root_license": claim_root_license,
+                "treaty_position": treaty_position,
+                "funding_amount": funding_amount
+            }
+            chunk.append((index, scroll_data, token_payload))
+        chunks.append(chunk)
+    
+    # Bound this request's fan-out so single intakes still get pool slots
+    fan_out = asyncio.Semaphore(max(1, crypto_executor.workers))
+    
+    async def issue_chunk(chunk):
+        async with fan_out:
+            issued = await crypto_executor.issue_scrolls([(scroll_data, token) for _, scroll_data, token in chunk])
+        return chunk, issued
+    
+    synced_scrolls: List[dict] = []
+    background_tasks.add_task(vault_mesh.sync_batch_with_vaultmesh, synced_scrolls)
+    
+    async def stream_results():
+        tasks = [asyncio.create_task(issue_chunk(chunk)) for chunk in chunks]
+        started = time.perf_counter()
+        succeeded = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                lines = []
+                try:
+                    chunk, issued = await next_done
+                    for (_, scroll_data, token_payload), (scroll_signature, _) in zip(chunk, issued):
+                        scroll_data["scroll_signature"] = scroll_signature
+                    await scroll_store.append_scrolls([
+                        {**scroll_data, "claim_root_license": token_payload["claim_root_license"]}
+                        for _, scroll_data, token_payload in chunk
+                    ])
+                except Exception as e:
+                    logger.error(f"❌ Batch intake chunk failed: {e}")
+                    continue
+                for (index, scroll_data, token_payload), (scroll_signature, license_token) in zip(chunk, issued):
+                    synced_scrolls.append(scroll_data)
+                    succeeded += 1
+                    lines.append(json_line({
+                        "index": index,
+                        "success": True,
+                        "scroll_id": scroll_data["scroll_id"],
+                        "treaty_position": scroll_data["treaty_position"],
+                        "claim_root_license": token_payload["claim_root_license"],
+                        "license_token": license_token,
+                        "scroll_signature": scroll_signature
+                    }))
+                yield "".join(lines)
+            
+            failed = len(treaties) - succeeded
+            if failed:
+                issued_indexes = {scroll_data["treaty_position"] - first_position for scroll_data in synced_scrolls}
+                yield "".join(
+                    json_line({"index": index, "success": False, "error": "Scroll signing failed"})
+                    for index in range(len(treaties)) if index not in issued_indexes
+                )
+            yield json_line({"summary": {
+                "treaties": len(treaties),
+                "succeeded": succeeded,
+                "failed": failed,
+                "treaty_positions": [first_position, first_position + len(treaties) - 1],
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                "planetary_motion": "AUTHORIZED"
+            }})
+            logger.info(f"🌍 VOORWAARD MARS: Batch intake processed - {succeeded}/{len(treaties)} treaties")
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 @app.post("/api/claimroot/generate")
 async def generate_claimroot_license(
     app_id: str,
     licensee_id: str,
-    treaty_position: Optional[int] = None
+    response: Response,
+    treaty_position: Optional[int] = None,
+    idempotency_key: Optional[str] = Header(None)
 ):
     """Generate ClaimRoot license with JWT token and PDF URL"""
+    return await idempotent(
+        "claimroot-generate", idempotency_key,
+        {"app_id": app_id, "licensee_id": licensee_id, "treaty_position": treaty_position}, response,
+        lambda: issue_claimroot_license(app_id, licensee_id, treaty_position)
+    )
+
+async def issue_claimroot_license(app_id: str, licensee_id: str, treaty_position: Optional[int]) -> Dict[str, Any]:
     try:
         license_id = f"license_faa_{int(time.time())}_{uuid.uuid4().hex[:8]}"
-        position = treaty_position or (vault_mesh.scrolls_active + 1)
+        position = treaty_position or await scroll_store.allocate_treaty_positions(1)
         
         # Generate secure license token
         license_payload = {
@@ -297,6 +696,7 @@ async def generate_claimroot_license(
         
         license_token = scroll_crypto.generate_jwt_token(license_payload)
         pdf_url = f"/licenses/{license_id}.pdf"
+        generated_at = datetime.utcnow()
         
         license_data = ClaimRootLicense(
             license_id=license_id,
@@ -304,10 +704,11 @@ async def generate_claimroot_license(
             licensee_id=licensee_id,
             treaty_position=position,
             scroll_bound=True,
-            generated_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(days=365),
+            generated_at=generated_at,
+            expires_at=generated_at + timedelta(days=365),
             pdf_url=pdf_url
         )
+        await scroll_store.append_license(license_data.dict())
         
         logger.info(f"📜 ClaimRoot license generated: {license_id}")
         
@@ -322,6 +723,131 @@ async def generate_claimroot_license(
         logger.error(f"❌ ClaimRoot generation failed: {e}")
         raise HTTPException(status_code=500, detail="ClaimRoot license generation failed")
 
+@app.get("/api/claimroot/license/verify")
+async def verify_claimroot_license_token(claims: Dict[str, Any] = Depends(require_license_token)):
+    """Check a ClaimRoot license token and return its claims"""
+    return {"valid": True, "claims": claims}
+
+@app.post("/api/claimroot/license/revoke")
+async def revoke_claimroot_license_token(
+    scope: str = Query("license", pattern="^(license|token)$"),
+    claims: Dict[str, Any] = Depends(require_license_token)
+):
+    """Revoke the presented token, or every token for its license"""
+    if scope == "token":
+        identifiers = [claims["jti"]] if claims.get("jti") else []
+    else:
+        identifiers = [claims[claim] for claim in ("license_id", "claim_root_license") if claims.get(claim)]
+    if not identifiers:
+        raise HTTPException(status_code=400, detail=f"Token carries nothing to revoke at {scope} scope")
+    try:
+        await scroll_store.append_revocations(identifiers)
+    except Exception as e:
+        logger.error(f"❌ License revocation failed: {e}")
+        raise HTTPException(status_code=500, detail="License revocation failed")
+    license_verifier.revoke(identifiers)
+    logger.info(f"🚫 ClaimRoot {scope} revoked: {', '.join(identifiers)}")
+    return {"success": True, "scope": scope, "revoked": identifiers}
+
+LICENSE_PAGE_MAX = 1000
+
+async def license_query_response(stream: bool, limit: int, **filters):
+    """Serve one keyset page of licenses, or stream every match as NDJSON"""
+    try:
+        if stream:
+            pages = scroll_store.iter_licenses(page_size=LICENSE_PAGE_MAX, **filters)
+            # Fail fast on a bad cursor before the 200 goes out
+            first_page = await pages.__anext__()
+        else:
+            licenses, next_cursor = await scroll_store.query_licenses(limit=limit, **filters)
+    except StopAsyncIteration:
+        first_page = []
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ License query failed: {e}")
+        raise HTTPException(status_code=500, detail="License query failed")
+    
+    if not stream:
+        return {
+            "licenses": [ClaimRootLicense(**record) for record in licenses],
+            "count": len(licenses),
+            "next_cursor": next_cursor
+        }
+    
+    async def stream_licenses():
+        if first_page:
+            yield "".join(json_line(record) for record in first_page)
+        async for page in pages:
+            yield "".join(json_line(record) for record in page)
+    
+    return StreamingResponse(stream_licenses(), media_type="application/x-ndjson")
+
+@app.get("/api/claimroot/licenses")
+async def list_claimroot_licenses(
+    licensee_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=LICENSE_PAGE_MAX),
+    stream: bool = Query(False, description="Stream every match as NDJSON instead of one page")
+):
+    """List ClaimRoot licenses by licensee and/or app, newest last, keyset-paginated"""
+    return await license_query_response(stream, limit, licensee_id=licensee_id, app_id=app_id, cursor=cursor)
+
+@app.get("/api/claimroot/licenses/expiring")
+async def list_expiring_claimroot_licenses(
+    days: int = Query(30, ge=1, le=3650),
+    licensee_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=LICENSE_PAGE_MAX),
+    stream: bool = Query(False, description="Stream every match as NDJSON instead of one page")
+):
+    """ClaimRoot licenses expiring within ``days``, soonest first, keyset-paginated"""
+    now = datetime.utcnow()
+    return await license_query_response(
+        stream, limit,
+        licensee_id=licensee_id, app_id=app_id, cursor=cursor,
+        expires_from=now.isoformat(), expires_to=(now + timedelta(days=days)).isoformat()
+    )
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+@app.get("/licenses/{license_id}.pdf")
+async def get_claimroot_license_pdf(license_id: str, request: Request):
+    """Stream the ClaimRoot license PDF, cached by content with ETag and Range support"""
+    try:
+        record = await scroll_store.get_license(license_id)
+    except Exception as e:
+        logger.error(f"❌ License lookup failed: {e}")
+        raise HTTPException(status_code=500, detail="License lookup failed")
+    if record is None:
+        raise HTTPException(status_code=404, detail="License not found")
+    
+    fingerprint = license_fingerprint(record)
+    etag = f'"{fingerprint}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=86400",
+        "Content-Disposition": f'inline; filename="{license_id}.pdf"'
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    cached = pdf_cache.lookup(fingerprint)
+    if cached is None and "range" in request.headers:
+        cached = await asyncio.to_thread(pdf_cache.render, fingerprint, record)
+    if cached is not None:
+        # FileResponse answers Range / If-Range requests from the cached file
+        return FileResponse(cached, media_type="application/pdf", headers=headers)
+    
+    logger.info(f"📜 Rendering ClaimRoot license PDF: {license_id}")
+    return StreamingResponse(pdf_cache.stream(fingerprint, record), media_type="application/pdf", headers=headers)
+
 @app.get("/api/vaultmesh/status")
 async def get_vaultmesh_status():
     """Get real-time VaultMesh network status"""
@@ -340,6 +866,7 @@ async def get_vaultmesh_status():
         return {
             "vault_mesh": status.dict(),
             "dns": dns_status,
+            "sync": vault_mesh.sync_engine.stats(),
             "planetary_motion": "ACTIVE"
         }
         
@@ -351,7 +878,7 @@ async def get_vaultmesh_status():
 async def validate_scroll_signature(scroll_id: str, signature: str, scroll_data: dict):
     """Validate scroll cryptographic signature"""
     try:
-        is_valid = scroll_crypto.verify_scroll_signature(scroll_data, signature)
+        is_valid = await crypto_executor.verify_scroll_signature(scroll_data, signature)
         
         if is_valid:
             # Sync validation with VaultMesh
@@ -370,24 +897,175 @@ async def validate_scroll_signature(scroll_id: str, signature: str, scroll_data:
             "timestamp": datetime.utcnow().isoformat()
         }
         
+    except CryptoPoolSaturated as e:
+        logger.warning(f"⚠️ Scroll validation shed: {e}")
+        raise HTTPException(status_code=503, detail="Scroll verification capacity exhausted, retry shortly",
+                            headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"❌ Scroll validation failed: {e}")
         raise HTTPException(status_code=500, detail="Scroll signature validation failed")
 
+@app.post("/api/scroll/validate/batch")
+async def validate_scroll_signature_batch(request: ScrollValidationBatch, background_tasks: BackgroundTasks):
+    """Validate many scroll signatures in parallel with one batched VaultMesh confirmation"""
+    if not request.scrolls:
+        raise HTTPException(status_code=400, detail="Batch contains no scrolls")
+    if len(request.scrolls) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {BATCH_MAX_ITEMS} scrolls")
+    
+    try:
+        started = time.perf_counter()
+        cache_hits_before = crypto_executor.verify_cache.hits
+        results = await crypto_executor.verify_scroll_batch(
+            [(item.scroll_data, item.signature) for item in request.scrolls],
+            chunk_size=BATCH_CHUNK_SIZE
+        )
+        verify_ms = (time.perf_counter() - started) * 1000
+        timestamp = datetime.utcnow().isoformat()
+        
+        # Confirmations go to VaultMesh in one sync after the response is sent
+        confirmations = [
+            {"scroll_id": item.scroll_id, "validation": "CONFIRMED", "timestamp": timestamp}
+            for item, is_valid in zip(request.scrolls, results) if is_valid
+        ]
+        background_tasks.add_task(vault_mesh.sync_batch_with_vaultmesh, confirmations)
+        
+        valid_count = len(confirmations)
+        logger.info(f"🧬 Scroll batch validation: {valid_count}/{len(results)} VALID")
+        
+        return {
+            "results": [
+                {"scroll_id": item.scroll_id, "signature_valid": is_valid, "vault_mesh_sync": is_valid}
+                for item, is_valid in zip(request.scrolls, results)
+            ],
+            "summary": {
+                "scrolls": len(results),
+                "valid": valid_count,
+                "invalid": len(results) - valid_count,
+                "cache_hits": crypto_executor.verify_cache.hits - cache_hits_before,
+                "verify_ms": round(verify_ms, 2),
+                "per_scroll_us": round(verify_ms * 1000 / len(results), 1)
+            },
+            "timestamp": timestamp
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Scroll batch validation failed: {e}")
+        raise HTTPException(status_code=500, detail="Scroll batch signature validation failed")
+
+@app.get("/api/scroll/crypto/stats")
+async def get_crypto_stats():
+    """Crypto pool load, verified-signature cache and license token counters"""
+    return {
+        "crypto_executor": crypto_executor.stats(),
+        "license_tokens": license_verifier.stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+@app.get("/api/scroll/idempotency/stats")
+async def get_idempotency_stats():
+    """Idempotency-Key replay cache hit rate and occupancy"""
+    return {
+        "idempotency_cache": idempotency_cache.stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
 @app.get("/api/scroll/pulse")
 async def get_scroll_pulse():
     """Get current scroll pulse data (9-second intervals)"""
     return {
-        "pulse_interval": f"{vault_mesh.pulse_interval}s",
+        "pulse_interval": f"{vault_mesh.pulse_interval:g}s",
         "last_pulse": vault_mesh.last_pulse.isoformat(),
         "nodes_active": vault_mesh.nodes_active,
         "scrolls_active": vault_mesh.scrolls_active,
         "network_health": vault_mesh.network_health,
         "mars_condition": "PLANETARY_MOTION_AUTHORIZED",
         "treaties_synced": 247 + (int(time.time()) % 10),
-        "dns_synchronized": True
+        "dns_synchronized": True,
+        "stream_subscribers": pulse_hub.stats()["subscribers"],
+        "worker_pid": os.getpid(),
+        "pulse_leader_pid": pulse_leader.holder()
+    }
+
+@app.get("/api/scroll/pulse/history")
+async def get_scroll_pulse_history(
+    from_ts: Optional[float] = Query(None, alias="from", description="Range start, epoch seconds"),
+    to_ts: Optional[float] = Query(None, alias="to", description="Range end, epoch seconds"),
+    buckets: Optional[int] = Query(None, ge=1, le=10000, description="Downsample into min/max/avg buckets"),
+    format: str = Query("json", pattern="^(json|binary)$")
+):
+    """Pulse history for trend charts, raw or downsampled, as compact JSON or binary"""
+    if format == "binary":
+        return Response(
+            pulse_history.to_binary(from_ts, to_ts, buckets),
+            media_type="application/octet-stream"
+        )
+    
+    if buckets:
+        series = pulse_history.downsample(from_ts, to_ts, buckets)
+    else:
+        raw = pulse_history.query(from_ts, to_ts)
+        series = {name: column.tolist() for name, column in raw.items()}
+    return {
+        "from": from_ts,
+        "to": to_ts,
+        "samples": len(series["t"]),
+        "capacity": pulse_history.capacity,
+        **series
     }
 
+@app.get("/api/scroll/pulse/stream")
+async def stream_scroll_pulse():
+    """Stream scroll pulses as Server-Sent Events"""
+    subscription = pulse_hub.subscribe()
+    
+    async def pulse_events():
+        try:
+            if pulse_hub.latest:
+                yield f"event: pulse\ndata: {pulse_hub.latest}\n\n"
+            while True:
+                message = await subscription.next(timeout=PULSE_KEEPALIVE_SECONDS)
+                if message is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield f"event: pulse\ndata: {message}\n\n"
+        finally:
+            subscription.close()
+    
+    return StreamingResponse(
+        pulse_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.websocket("/api/scroll/pulse/stream")
+async def scroll_pulse_websocket(websocket: WebSocket):
+    """Stream scroll pulses over WebSocket (needs uvicorn's websockets extra)"""
+    await websocket.accept()
+    subscription = pulse_hub.subscribe()
+    
+    async def wait_for_disconnect():
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    
+    # Watch the socket while waiting so idle clients are released on close
+    disconnected = asyncio.create_task(wait_for_disconnect())
+    try:
+        if pulse_hub.latest:
+            await websocket.send_text(pulse_hub.latest)
+        while not disconnected.done():
+            next_pulse = asyncio.create_task(subscription.next())
+            await asyncio.wait({next_pulse, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if next_pulse.done():
+                await websocket.send_text(next_pulse.result())
+            else:
+                next_pulse.cancel()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        subscription.close()
+
 # Queen Bee Control Room API Endpoints
 
 @app.get("/api/queen-bee/status")
@@ -399,7 +1077,7 @@ async def get_queen_bee_status():
         "vault_mesh_sync": True,
         "last_audit": datetime.utcnow().isoformat(),
         "deployment_status": "ACTIVE",
-        "vaultmesh_pulse_interval": f"{vault_mesh.pulse_interval}s",
+        "vaultmesh_pulse_interval": f"{vault_mesh.pulse_interval:g}s",
         "network_health": vault_mesh.network_health,
         "scrolls_active": vault_mesh.scrolls_active
     }
@@ -430,31 +1108,57 @@ async def sync_repositories(background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail="Repository synchronization failed")
 
 @app.get("/api/queen-bee/audit/aggregate")
-async def aggregate_audits():
-    """Consolidate audit results from .audit-cache/ across repos"""
+async def aggregate_audits(
+    repo: Optional[str] = None,
+    severity: Optional[str] = None,
+    finding_type: Optional[str] = Query(None, alias="type"),
+    status: Optional[str] = Query(None, pattern="^(new|recurring)$"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=AUDIT_PAGE_MAX)
+):
+    """Consolidated audit results from the latest CodeNest report, optionally filtered"""
     try:
-        # Placeholder for audit aggregation logic
+        filters = {"repo": repo, "severity": severity, "type": finding_type, "status": status}
+        report = await audit_reports.current()
         aggregated_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "repos_scanned": 84,
+            "report": None,
+            "timestamp": None,
+            "repos_scanned": 0,
             "total_findings": 0,
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
+            **{name: 0 for name in SEVERITIES},
             "summary": {
                 "secret_scanning": 0,
                 "large_files": 0,
                 "merge_conflicts": 0,
                 "yaml_errors": 0
-            }
+            },
+            "changes": {},
+            "filters": {name: value for name, value in filters.items() if value is not None},
+            "findings": [],
+            "next_offset": None
         }
+        if report is not None:
+            with stage_timer("audit_query"):
+                result = report.query(offset, limit, **filters)
+            aggregated_data.update(
+                report=report.path.name,
+                timestamp=report.timestamp,
+                repos_scanned=report.header.get("repos_scanned", len(result["by_repo"])),
+                total_findings=result["matched"],
+                changes=report.changes,
+                findings=result["findings"],
+                next_offset=offset + limit if result["matched"] > offset + limit else None,
+                **{name: result["by_severity"].get(name, 0) for name in SEVERITIES}
+            )
+            aggregated_data["summary"].update(result["by_type"])
         
         return {
             "success": True,
             "audit_data": aggregated_data,
             "vault_mesh_sync": True
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Audit aggregation failed: {e}")
         raise HTTPException(status_code=500, detail="Audit aggregation failed")
@@ -463,23 +1167,32 @@ async def aggregate_audits():
 async def security_overview():
     """Cross-repo security posture dashboard"""
     try:
+        report = await audit_reports.current()
+        repo_severities = report.repo_severities() if report else {}
+        repos_scanned = report.header.get("repos_scanned", len(repo_severities)) if report else 0
+        # Per repo: 100 less 25 per critical, 10 per high, 3 per medium and 1 per low
+        # finding, floored at 0; repos without findings score 100. Averaged over repos.
+        penalties = [
+            25 * counts["critical"] + 10 * counts["high"] + 3 * counts["medium"] + counts["low"]
+            for counts in repo_severities.values()
+        ]
+        scores = [max(0, 100 - penalty) for penalty in penalties]
+        scores += [100] * max(0, repos_scanned - len(scores))
         return {
             "total_repos": 84,
             "repos_with_hooks": 0,
-            "repos_scanned": 0,
-            "security_score": 0,
+            "repos_scanned": repos_scanned,
+            "security_score": round(sum(scores) / len(scores)) if scores else 0,
             "vulnerabilities": {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0
+                name: report.summary.get("by_severity", {}).get(name, 0) if report else 0
+                for name in SEVERITIES
             },
             "compliance": {
                 "pre_commit_hooks": 0,
                 "secret_scanning": 0,
                 "dependency_scanning": 0
             },
-            "last_updated": datetime.utcnow().isoformat()
+            "last_updated": report.timestamp if report else None
         }
     except Exception as e:
         logger.error(f"❌ Security overview failed: {e}")
@@ -510,6 +1223,11 @@ async def deploy_safeguards(repo_pattern: str, background_tasks: BackgroundTasks
         logger.error(f"❌ Safeguard deployment failed: {e}")
         raise HTTPException(status_code=500, detail="Safeguard deployment failed")
 
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text exposition of request, stage and subsystem metrics"""
+    return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring"""
@@ -521,12 +1239,29 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat()
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until startup and warm-up have finished"""
+    if not readiness["ready"]:
+        raise HTTPException(status_code=503, detail={"ready": False, "warmup": readiness["warmup"]})
+    return readiness
+
 if __name__ == "__main__":
     import uvicorn
+    # SCROLL_WORKERS > 1 is the production mode: N uvicorn worker processes
+    # sharing keys, store and counters on disk, no autoreload
+    workers = int(os.getenv("SCROLL_WORKERS", "1"))
+    if workers > 1:
+        # Split the cores between workers instead of giving each a full crypto pool
+        os.environ.setdefault("SCROLL_CRYPTO_WORKERS", str(max(1, (os.cpu_count() or 2) // workers)))
+    # Counters start fresh for each launch, as they did when they were in-process
+    vault_mesh.shared.reset()
+    vault_mesh.shared.close()
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=3000,
-        reload=True,
+        host=os.getenv("SCROLL_HOST", "0.0.0.0"),
+        port=int(os.getenv("SCROLL_PORT", "3000")),
+        reload=workers == 1 and os.getenv("SCROLL_RELOAD", "1") == "1",
+        workers=workers,
         log_level="info"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,4 @@
+"""
+FAA.zone™ Scroll Backend Subsystems
+Crypto, VaultMesh and scroll processing helpers used by main.py
+"""
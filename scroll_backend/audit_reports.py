@@ -0,0 +1,453 @@
+"""
+FAA.zone™ Audit Report Index
+Cached, indexed reader for the CodeNest aggregator's latest audit report
+
+The aggregator (``.github/scripts/codenest_aggregator.py``) writes
+``audit-<timestamp>.<json|ndjson|columnar.json>[.gz|.zst]`` into
+``CODENEST_REPORTS_DIR`` (default ``.codenest-reports/``). The newest one
+is loaded once into an AuditReport:
+
+    columns    one uint32 code per finding for repo, severity, type and status
+    postings   per column, the sorted rows holding each code
+    counts     findings per (repo, severity, type, status) combination
+    store      finding bodies, addressed by byte offset and length
+
+Filtered totals are sums over ``counts`` (one entry per combination, not
+per finding), kept per filter since a loaded report never changes, and a
+page of findings walks the shortest matching posting list, so queries
+never touch the file beyond the rows they return.
+
+Uncompressed JSON and NDJSON reports hold one finding per line, so the
+report itself is memory-mapped as the store. Compressed, columnar and
+legacy (pretty-printed) reports are parsed once into an NDJSON spool
+under ``SCROLL_AUDIT_CACHE_DIR`` (default ``.scroll-audit-cache/``), which
+is mapped and immediately unlinked instead.
+"""
+
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import gzip
+import json
+import logging
+import mmap
+import os
+import re
+
+from .metrics import stage_timer
+
+logger = logging.getLogger("faa_scroll_backend")
+
+INDEXED = ("repo", "severity", "type", "status")
+SEVERITIES = ("critical", "high", "medium", "low")
+# Filter combinations whose totals are kept per loaded report
+COUNTS_CACHE_SIZE = 1024
+
+REPORT_PREFIX = "audit-"
+LAYOUT_SUFFIXES = ((".columnar.json", "columnar"), (".ndjson", "ndjson"), (".json", "json"))
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+# Line layout written by the aggregator: these keys in this order, then status
+_MARKERS = (b', "repo": ', b', "type": ', b', "severity": ', b', "file": ', b', "details": ')
+_STATUS_MARKER = b', "status": '
+# A status token the fast path may trust: a plain string closing the line
+_PLAIN_STATUS = re.compile(rb'"[^"\\]*"')
+_JSON_FINDINGS_OPEN = b', "findings": ['
+
+
+def report_layout(name: str) -> Optional[Tuple[str, str]]:
+    """(layout, compression) of an aggregator report file name, or None for anything else"""
+    if not name.startswith(REPORT_PREFIX):
+        return None
+    compression = "none"
+    for suffix, kind in COMPRESSION_SUFFIXES.items():
+        if name.endswith(suffix):
+            name, compression = name[:-len(suffix)], kind
+    for suffix, layout in LAYOUT_SUFFIXES:
+        if name.endswith(suffix):
+            return layout, compression
+    return None
+
+
+def _open_compressed(path: Path, compression: str):
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        import zstandard  # optional, only for .zst reports
+        return zstandard.open(path, "rb")
+    return open(path, "rb")
+
+
+def _line_tokens(line: bytes) -> Tuple[bytes, bytes, bytes, bytes]:
+    """Raw JSON tokens for repo, severity, type and status of one finding line.
+
+    Slices the aggregator's fixed key order (no earlier value can contain
+    an unescaped '", "<key>": '). Details come last before status and are
+    arbitrary JSON, so a status match is only trusted when it is a plain
+    string that closes the line; anything else, or a line in another shape,
+    is decoded in full.
+    """
+    try:
+        bounds, position = [], 0
+        for marker in _MARKERS:
+            position = line.index(marker, position)
+            bounds.append(position)
+    except ValueError:
+        return _decoded_tokens(line)
+    repo, finding_type, severity = (
+        line[at + len(marker):end] for at, marker, end in zip(bounds, _MARKERS, bounds[1:4])
+    )
+    status_at = line.rfind(_STATUS_MARKER, bounds[4])
+    if status_at < 0:
+        # No marker anywhere after details: a report from before statuses
+        return repo, severity, finding_type, b"null"
+    status = line[status_at + len(_STATUS_MARKER):-1]
+    if not line.endswith(b"}") or not _PLAIN_STATUS.fullmatch(status):
+        # The match may sit inside details (or the status has escapes)
+        return _decoded_tokens(line)
+    return repo, severity, finding_type, status
+
+
+def _decoded_tokens(line: bytes) -> Tuple[bytes, ...]:
+    finding = json.loads(line)
+    return tuple(json.dumps(finding.get(column)).encode() for column in INDEXED)
+
+
+class AuditReport:
+    """One aggregator report, indexed for filtered queries (see module docstring)"""
+
+    def __init__(self, path: Path, identity: Tuple[int, int]):
+        self.path = path
+        self.identity = identity
+        self.header: Dict[str, Any] = {}
+        self.trailer: Dict[str, Any] = {}
+        self.resolved = 0
+        self.values: Dict[str, List[Any]] = {column: [] for column in INDEXED}
+        self.columns = {column: array("I") for column in INDEXED}
+        self.postings: Dict[str, List[array]] = {column: [] for column in INDEXED}
+        self.counts: Dict[Tuple[int, int, int, int], int] = {}
+        self.offsets = array("Q")
+        self.lengths = array("I")
+        self._codes: Dict[str, Dict[bytes, int]] = {column: {} for column in INDEXED}
+        self._totals: Dict[Tuple[Optional[int], ...], Dict[str, Any]] = {}
+        self._store_file = None
+        self._store: Optional[mmap.mmap] = None
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def timestamp(self) -> Optional[str]:
+        return self.header.get("timestamp")
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        return self.trailer.get("summary", {})
+
+    @property
+    def changes(self) -> Dict[str, int]:
+        return self.trailer.get("changes", {})
+
+    # Loading
+
+    @classmethod
+    def load(cls, path: Path, cache_dir: Path) -> "AuditReport":
+        """Parse and index ``path`` (blocking; run it off the event loop)"""
+        stat = path.stat()
+        layout, compression = report_layout(path.name)
+        report = cls(path, (stat.st_mtime_ns, stat.st_size))
+        with stage_timer("audit_report_load"):
+            if compression == "none" and layout in ("json", "ndjson") and report._index_mapped(layout):
+                return report
+            report._index_spooled(layout, compression, cache_dir)
+        return report
+
+    def _add(self, tokens: Tuple[bytes, ...], start: int, length: int):
+        row = len(self.offsets)
+        codes = []
+        for column, token in zip(INDEXED, tokens):
+            column_codes = self._codes[column]
+            code = column_codes.get(token)
+            if code is None:
+                code = column_codes[token] = len(column_codes)
+                self.values[column].append(json.loads(token))
+                self.postings[column].append(array("I"))
+            self.columns[column].append(code)
+            self.postings[column][code].append(row)
+            codes.append(code)
+        key = tuple(codes)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.offsets.append(start)
+        self.lengths.append(length)
+
+    def _map(self, path: Path):
+        self._store_file = open(path, "rb")
+        if os.fstat(self._store_file.fileno()).st_size:
+            self._store = mmap.mmap(self._store_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index_mapped(self, layout: str) -> bool:
+        """Index an uncompressed one-finding-per-line report in place; False if it is not one"""
+        self._map(self.path)
+        store = self._store
+        if store is None:
+            self.close()
+            return False
+        first_end = store.find(b"\n")
+        first_line = store[:first_end if first_end >= 0 else len(store)]
+        if layout == "json" and not first_line.endswith(_JSON_FINDINGS_OPEN):
+            # Pretty-printed legacy report
+            self.close()
+            return False
+
+        if layout == "json":
+            self.header = json.loads(first_line[:-len(_JSON_FINDINGS_OPEN)] + b"}")
+        position = 0 if layout == "ndjson" else first_end + 1
+        size = len(store)
+        while position < size:
+            end = store.find(b"\n", position)
+            if end < 0:
+                end = size
+            line = store[position:end].rstrip(b", \r")
+            if layout == "json" and line.startswith(b"]"):
+                # '], "resolved_findings": [...], "changes": ..., "summary": ...}'
+                tail = json.loads(b"{" + store[position:].lstrip(b"], "))
+                self.resolved = len(tail.pop("resolved_findings", []))
+                self.trailer = tail
+                break
+            if line.startswith(b'{"record": '):
+                record = json.loads(line)
+                kind = record.pop("record")
+                if kind == "header":
+                    self.header = record
+                else:
+                    self.trailer = record
+            elif line:
+                tokens = _line_tokens(line)
+                if tokens[3] == b'"resolved"':
+                    self.resolved += 1
+                else:
+                    self._add(tokens, position, len(line))
+            position = end + 1
+        return True
+
+    def _index_spooled(self, layout: str, compression: str, cache_dir: Path):
+        """Stream-parse any other report into an NDJSON spool and index that"""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        spool_path = cache_dir / f"{self.path.name}.{os.getpid()}.ndjson"
+        try:
+            with _open_compressed(self.path, compression) as source, open(spool_path, "wb") as spool:
+                for finding in self._iter_findings(source, layout):
+                    line = json.dumps(finding).encode()
+                    self._add(tuple(json.dumps(finding.get(column)).encode() for column in INDEXED),
+                              spool.tell(), len(line))
+                    spool.write(line + b"\n")
+            self._map(spool_path)
+        finally:
+            # The mapping outlives the name, so nothing is left behind on exit
+            spool_path.unlink(missing_ok=True)
+
+    def _iter_findings(self, source, layout: str) -> Iterator[Dict[str, Any]]:
+        if layout == "ndjson":
+            for line in source:
+                finding = json.loads(line)
+                kind = finding.pop("record", None)
+                if kind == "header":
+                    self.header = finding
+                elif kind is not None:
+                    self.trailer = finding
+                elif finding.get("status") == "resolved":
+                    self.resolved += 1
+                else:
+                    yield finding
+            return
+
+        document = json.load(source)
+        self.resolved = len(document.pop("resolved_findings", []))
+        if layout == "columnar":
+            columns, dictionaries = document.pop("columns"), document.pop("dictionaries")
+            count = document.pop("count", 0)
+            decoded = [
+                (name, [dictionaries[name][code] for code in values] if name in dictionaries else values)
+                for name, values in columns.items()
+            ]
+            findings = ({name: values[row] for name, values in decoded} for row in range(count))
+        else:
+            findings = document.pop("findings", [])
+        self.trailer = {key: document.pop(key) for key in ("changes", "summary") if key in document}
+        self.header = document
+        yield from findings
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        if self._store_file is not None:
+            self._store_file.close()
+            self._store_file = None
+
+    # Queries
+
+    def _code(self, column: str, value: Optional[str]) -> Optional[int]:
+        """Code for a filter value: None when unfiltered, -1 when the value never occurs"""
+        if value is None:
+            return None
+        return self._codes[column].get(json.dumps(value).encode(), -1)
+
+    def _label(self, column: str, code: int) -> str:
+        value = self.values[column][code]
+        return value if isinstance(value, str) else "unknown"
+
+    def finding(self, row: int) -> Dict[str, Any]:
+        start = self.offsets[row]
+        return json.loads(self._store[start:start + self.lengths[row]])
+
+    def query(self, offset: int = 0, limit: int = 100, **filters: Optional[str]) -> Dict[str, Any]:
+        """Counts and one page of findings matching every given repo/severity/type/status"""
+        wanted = {column: self._code(column, filters.get(column)) for column in INDEXED}
+        totals = self._totals.get(tuple(wanted.values()))
+        if totals is None:
+            totals = self._count(wanted)
+            if len(self._totals) >= COUNTS_CACHE_SIZE:
+                self._totals.clear()
+            self._totals[tuple(wanted.values())] = totals
+        wanted = {column: code for column, code in wanted.items() if code is not None}
+        matched = totals["matched"]
+        return {
+            **totals,
+            "by_severity": dict(totals["by_severity"]),
+            "by_type": dict(totals["by_type"]),
+            "by_repo": dict(totals["by_repo"]),
+            "findings": [self.finding(row) for row in self._rows(wanted, offset, limit)] if matched > offset else []
+        }
+
+    def _count(self, wanted: Dict[str, Optional[int]]) -> Dict[str, Any]:
+        by_severity = {severity: 0 for severity in SEVERITIES}
+        by_type: Dict[str, int] = {}
+        by_repo: Dict[str, int] = {}
+        matched = 0
+        filtered = [(position, code) for position, code in enumerate(wanted.values()) if code is not None]
+        if all(code >= 0 for _, code in filtered):
+            for key, count in self.counts.items():
+                if any(key[position] != code for position, code in filtered):
+                    continue
+                matched += count
+                repo, severity, finding_type, _ = (self._label(column, code) for column, code in zip(INDEXED, key))
+                by_severity[severity] = by_severity.get(severity, 0) + count
+                by_type[finding_type] = by_type.get(finding_type, 0) + count
+                by_repo[repo] = by_repo.get(repo, 0) + count
+        return {"matched": matched, "by_severity": by_severity, "by_type": by_type, "by_repo": by_repo}
+
+    def _rows(self, wanted: Dict[str, int], offset: int, limit: int) -> List[int]:
+        if not wanted:
+            return list(range(offset, min(offset + limit, len(self))))
+        # Walk the shortest posting list, checking the other columns per row
+        lead = min(wanted, key=lambda column: len(self.postings[column][wanted[column]]))
+        checks = [(self.columns[column], code) for column, code in wanted.items() if column != lead]
+        rows, skipped = [], 0
+        for row in self.postings[lead][wanted[lead]]:
+            if all(column[row] == code for column, code in checks):
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
+        return rows
+
+    def repo_severities(self) -> Dict[str, Dict[str, int]]:
+        """Findings per repo and severity, from the combination counts"""
+        result: Dict[str, Dict[str, int]] = {}
+        for (repo, severity, _, _), count in self.counts.items():
+            counts = result.setdefault(self._label("repo", repo), {name: 0 for name in SEVERITIES})
+            name = self._label("severity", severity)
+            counts[name] = counts.get(name, 0) + count
+        return result
+
+
+class AuditReportCache:
+    """Serves the newest aggregator report, reloading only when a newer one appears.
+
+    Each call costs one ``stat`` of the reports directory; the directory is
+    rescanned only when its mtime moves (the aggregator renames finished
+    reports into place). A new report is indexed in a worker thread while
+    callers keep getting the previous one; only the very first load is
+    awaited. Concurrent callers share one load, and a report that fails to
+    load is not retried until its file changes.
+    """
+
+    def __init__(self, reports_dir: Optional[str] = None, cache_dir: Optional[str] = None):
+        self.reports_dir = Path(reports_dir or os.getenv("CODENEST_REPORTS_DIR", ".codenest-reports"))
+        self.cache_dir = Path(cache_dir or os.getenv("SCROLL_AUDIT_CACHE_DIR", ".scroll-audit-cache"))
+        self._report: Optional[AuditReport] = None
+        self._dir_mtime: Optional[int] = None
+        self._latest: Optional[Tuple[Path, Tuple[int, int]]] = None
+        self._failed: Optional[Tuple[Path, Tuple[int, int]]] = None
+        self._loading: Optional[asyncio.Task] = None
+        self._loading_target: Optional[Tuple[Path, Tuple[int, int]]] = None
+        self.loads = 0
+        self.scans = 0
+
+    def _newest(self) -> Optional[Tuple[Path, Tuple[int, int]]]:
+        try:
+            dir_mtime = os.stat(self.reports_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._dir_mtime = self._latest = None
+            return None
+        if dir_mtime != self._dir_mtime:
+            self.scans += 1
+            newest = None
+            for entry in os.scandir(self.reports_dir):
+                if report_layout(entry.name) is None or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                candidate = (stat.st_mtime_ns, entry.name, (stat.st_mtime_ns, stat.st_size))
+                if newest is None or candidate > newest:
+                    newest = candidate
+            self._dir_mtime = dir_mtime
+            self._latest = (self.reports_dir / newest[1], newest[2]) if newest else None
+        return self._latest
+
+    def _load(self, target: Tuple[Path, Tuple[int, int]]) -> asyncio.Task:
+        if self._loading is None or self._loading.done() or self._loading_target != target:
+            self._loading_target = target
+            self._loading = asyncio.create_task(self._swap(target))
+        return self._loading
+
+    async def _swap(self, target: Tuple[Path, Tuple[int, int]]):
+        path, _ = target
+        try:
+            report = await asyncio.to_thread(AuditReport.load, path, self.cache_dir)
+        except Exception as e:
+            self._failed = target
+            logger.warning(f"⚠️ Audit report {path.name} could not be loaded: {e}")
+            return
+        self.loads += 1
+        previous, self._report = self._report, report
+        if previous is not None:
+            previous.close()
+        logger.info(f"🐝 Audit report loaded: {path.name} ({len(report)} findings)")
+
+    async def current(self) -> Optional[AuditReport]:
+        """The newest loaded report (None until one exists and has loaded)"""
+        target = self._newest()
+        if target is None or target == self._failed:
+            return self._report
+        if self._report is None or (self._report.path, self._report.identity) != target:
+            loading = self._load(target)
+            if self._report is None:
+                await asyncio.shield(loading)
+        return self._report
+
+    def close(self):
+        if self._report is not None:
+            self._report.close()
+            self._report = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "report": self._report.path.name if self._report else None,
+            "findings": len(self._report) if self._report else 0,
+            "loads": self.loads,
+            "scans": self.scans
+        }
@@ -0,0 +1,61 @@
+"""
+FAA.zone™ Canonical JSON
+Signing input and fast JSON responses for the scroll backend
+
+Scroll signatures cover ``json.dumps(scroll_data, sort_keys=True)``:
+ASCII-escaped, ``", "`` / ``": "`` separators, Python float repr. That
+exact byte string is the contract with every signature already issued,
+so ``canonical_bytes`` keeps producing it with the standard library,
+through one module-level encoder instead of a fresh ``JSONEncoder`` per
+call. orjson cannot emit those separators or escapes, so it is only used
+for HTTP responses, where byte layout does not matter.
+
+``benchmarks.canonical_compat`` checks that the two canonical forms are
+byte-identical and that signatures made the old way still verify.
+"""
+
+from typing import Any
+import json
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def canonical_json(data: Any) -> str:
+    """Canonical scroll JSON (identical to ``json.dumps(data, sort_keys=True)``)"""
+    return _CANONICAL_ENCODER.encode(data)
+
+
+def canonical_bytes(data: Any) -> bytes:
+    """Canonical scroll JSON as the bytes that get signed"""
+    return _CANONICAL_ENCODER.encode(data).encode()
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _orjson_default(value: Any) -> Any:
+        return str(value)
+
+    def json_line(data: Any) -> str:
+        """One NDJSON line (with trailing newline) for streamed responses"""
+        return orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE).decode()
+
+    class FastJSONResponse(JSONResponse):
+        """JSONResponse rendered by orjson (compact, UTF-8, native datetimes)"""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+else:
+    def json_line(data: Any) -> str:
+        """One NDJSON line (with trailing newline) for streamed responses"""
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+
+    class FastJSONResponse(JSONResponse):
+        """JSONResponse (orjson is not installed; standard-library rendering)"""
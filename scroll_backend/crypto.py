@@ -0,0 +1,87 @@
+"""
+FAA.zone™ Scroll Cryptography
+RSA-PSS scroll signing and JWT issuing for TreatySync and ClaimRoot
+"""
+
+from typing import List, Optional, Tuple
+
+from .canonical import canonical_bytes
+from .keystore import ScrollKeyStore
+from .license_tokens import TokenKeyRing, issue_license_token
+from .metrics import stage_timer
+from .signers import SIGNERS, DEFAULT_ALGORITHM
+
+# Signature envelopes are "<alg>:<kid>:<hex>". Older scrolls carry
+# "<kid>:<hex>" (RSA-PSS keys) or bare hex (pre-key-store, active key).
+SIGNATURE_SEPARATOR = ":"
+
+
+def split_signature(signature: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Split a scroll signature envelope into (alg, kid, hex signature)"""
+    parts = signature.split(SIGNATURE_SEPARATOR)
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2]
+    if len(parts) == 2:
+        return DEFAULT_ALGORITHM, parts[0], parts[1]
+    return None, None, signature
+
+
+# Cryptographic utilities for scroll signing
+class ScrollCrypto:
+    def __init__(self, key_store: Optional[ScrollKeyStore] = None, token_keys: Optional[TokenKeyRing] = None):
+        # Keys load lazily on first sign/verify, not at import
+        self.key_store = key_store or ScrollKeyStore()
+        self.token_keys = token_keys or TokenKeyRing(self.key_store.key_dir)
+    
+    @property
+    def private_key(self):
+        return self.key_store.private_key()
+    
+    @property
+    def public_key(self):
+        return self.key_store.public_key()
+    
+    def sign_scroll(self, scroll_data: dict) -> str:
+        """Generate cryptographic signature for scroll data, tagged with algorithm and key ID"""
+        kid = self.key_store.active_kid
+        signer = self.key_store.signer(kid)
+        with stage_timer("canonical_json"):
+            message = canonical_bytes(scroll_data)
+        with stage_timer("scroll_sign"):
+            signature = signer.sign(self.key_store.private_key(kid), message)
+        return SIGNATURE_SEPARATOR.join((signer.alg, kid, signature.hex()))
+    
+    def verify_scroll_signature(self, scroll_data: dict, signature: str) -> bool:
+        """Verify scroll signature against the key and algorithm named in its envelope"""
+        with stage_timer("canonical_json"):
+            message = canonical_bytes(scroll_data)
+        return self.verify_message(message, signature)
+    
+    def verify_message(self, message: bytes, signature: str) -> bool:
+        """Verify a signature over an already canonicalized scroll message"""
+        try:
+            alg, kid, signature_hex = split_signature(signature)
+            signer = self.key_store.signer(kid)
+            # The envelope may not pick a different algorithm than the key's own
+            if alg is not None and SIGNERS.get(alg) is not signer:
+                return False
+            with stage_timer("scroll_verify"):
+                signer.verify(self.key_store.public_key(kid), bytes.fromhex(signature_hex), message)
+            return True
+        except Exception:
+            return False
+
+    def verify_messages(self, batch: List[Tuple[bytes, str]]) -> List[bool]:
+        """Verify a chunk of (canonical message, signature) pairs in one pass"""
+        return [self.verify_message(message, signature) for message, signature in batch]
+
+    def generate_jwt_token(self, payload: dict, expires_hours: int = 24) -> str:
+        """Generate JWT token for ClaimRoot licensing, signed with the active token key"""
+        return issue_license_token(self.token_keys, payload, expires_hours)
+
+    def issue_scrolls(self, batch: List[Tuple[dict, dict]]) -> List[Tuple[str, str]]:
+        """Sign a chunk of scrolls and mint their license tokens in one pass"""
+        return [
+            (self.sign_scroll(scroll_data), self.generate_jwt_token(token_payload))
+            for scroll_data, token_payload in batch
+        ]
@@ -0,0 +1,210 @@
+"""
+FAA.zone™ Crypto Executor
+Runs scroll signing and verification off the event loop with bounded backpressure
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+
+from .canonical import canonical_bytes
+from .crypto import ScrollCrypto, split_signature
+from .keystore import ScrollKeyStore
+from .verify_cache import VerifiedSignatureCache
+
+logger = logging.getLogger("faa_scroll_backend")
+
+POOL_MODES = ("thread", "process", "inline")
+
+
+class CryptoPoolSaturated(Exception):
+    """Raised when the crypto pool queue stays full past the queue timeout"""
+
+
+# Process pool workers open the same key directory as the API process, so
+# they sign with the same key IDs and follow rotations.
+_worker_crypto: Optional[ScrollCrypto] = None
+
+
+def _init_process_worker(key_dir: str):
+    global _worker_crypto
+    _worker_crypto = ScrollCrypto(ScrollKeyStore(key_dir))
+
+
+def _sign_in_worker(scroll_data: dict) -> str:
+    return _worker_crypto.sign_scroll(scroll_data)
+
+
+def _verify_in_worker(message: bytes, signature: str) -> bool:
+    return _worker_crypto.verify_message(message, signature)
+
+
+def _verify_batch_in_worker(batch: List[Tuple[bytes, str]]) -> List[bool]:
+    return _worker_crypto.verify_messages(batch)
+
+
+def _issue_in_worker(batch: List[Tuple[dict, dict]]) -> List[Tuple[str, str]]:
+    return _worker_crypto.issue_scrolls(batch)
+
+
+class CryptoExecutor:
+    """Offloads ScrollCrypto operations to a thread or process pool.
+
+    At most ``max_queue`` operations may be submitted or running at once.
+    Callers beyond that wait up to ``queue_timeout`` seconds for a slot and
+    then get ``CryptoPoolSaturated`` so the API can shed load with a 503.
+    ``inline`` mode runs on the event loop and exists for baselines only.
+    """
+
+    def __init__(
+        self,
+        crypto: ScrollCrypto,
+        mode: Optional[str] = None,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        verify_cache: Optional[VerifiedSignatureCache] = None
+    ):
+        self.crypto = crypto
+        self.verify_cache = verify_cache or VerifiedSignatureCache()
+        crypto.key_store.on_rotation(self.verify_cache.clear)
+        self.mode = (mode or os.getenv("SCROLL_CRYPTO_POOL", "thread")).lower()
+        if self.mode not in POOL_MODES:
+            raise ValueError(f"Unknown crypto pool mode: {self.mode}")
+        self.workers = workers or int(os.getenv("SCROLL_CRYPTO_WORKERS", os.cpu_count() or 2))
+        self.max_queue = max_queue or int(os.getenv("SCROLL_CRYPTO_MAX_QUEUE", "256"))
+        self.queue_timeout = (
+            queue_timeout if queue_timeout is not None
+            else float(os.getenv("SCROLL_CRYPTO_QUEUE_TIMEOUT", "0.5"))
+        )
+        self._pool = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def start(self):
+        """Create the worker pool (idempotent)"""
+        if self._pool is not None or self.mode == "inline":
+            return
+        if self.mode == "process":
+            # Only process mode needs multiprocessing; keep it off the import path
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=(str(self.crypto.key_store.key_dir.resolve()),)
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="scroll-crypto"
+            )
+        logger.info(f"🔐 Crypto executor started: {self.mode} pool, {self.workers} workers, queue {self.max_queue}")
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        if self._pool is not None:
+            # Process workers must be joined or they outlive the API process
+            self._pool.shutdown(wait=self.mode == "process", cancel_futures=True)
+            self._pool = None
+
+    async def _run(self, thread_fn: Callable, process_fn: Callable, *args, wait: bool = False) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_queue)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=None if wait else self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise CryptoPoolSaturated(
+                f"Crypto pool saturated ({self.in_flight}/{self.max_queue} in flight)"
+            )
+
+        self.in_flight += 1
+        try:
+            if self.mode == "inline":
+                return thread_fn(*args)
+            self.start()
+            fn = process_fn if self.mode == "process" else thread_fn
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._slots.release()
+
+    async def sign_scroll(self, scroll_data: dict) -> str:
+        """Sign scroll data on the crypto pool"""
+        return await self._run(self.crypto.sign_scroll, _sign_in_worker, scroll_data)
+
+    def _verify_cache_key(self, message: bytes, signature: str) -> bytes:
+        _, kid, _ = split_signature(signature)
+        # Bare-hex signatures verify against whichever key is active, so the
+        # active kid goes into their cache key (and triggers rotation checks)
+        return self.verify_cache.cache_key(message, signature, kid or self.crypto.key_store.active_kid)
+
+    async def verify_scroll_signature(self, scroll_data: dict, signature: str) -> bool:
+        """Verify a scroll signature, answering repeats from the verified-signature cache"""
+        message = canonical_bytes(scroll_data)
+        cache_key = self._verify_cache_key(message, signature)
+        cached = self.verify_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        is_valid = await self._run(self.crypto.verify_message, _verify_in_worker, message, signature)
+        self.verify_cache.put(cache_key, is_valid)
+        return is_valid
+
+    async def verify_scroll_batch(self, items: List[Tuple[dict, str]], chunk_size: int = 64) -> List[bool]:
+        """Verify many scroll signatures, fanning cache misses out across the pool in chunks"""
+        results: List[Optional[bool]] = [None] * len(items)
+        misses = []
+        for index, (scroll_data, signature) in enumerate(items):
+            message = canonical_bytes(scroll_data)
+            cache_key = self._verify_cache_key(message, signature)
+            cached = self.verify_cache.get(cache_key)
+            if cached is None:
+                misses.append((index, message, signature, cache_key))
+            else:
+                results[index] = cached
+
+        # At most one chunk per worker in flight, so single verifies still get slots
+        fan_out = asyncio.Semaphore(max(1, self.workers))
+
+        async def verify_chunk(chunk):
+            async with fan_out:
+                return await self._run(
+                    self.crypto.verify_messages, _verify_batch_in_worker,
+                    [(message, signature) for _, message, signature, _ in chunk],
+                    wait=True
+                )
+
+        chunks = [misses[start:start + chunk_size] for start in range(0, len(misses), chunk_size)]
+        outcomes = await asyncio.gather(*(verify_chunk(chunk) for chunk in chunks))
+        for chunk, chunk_results in zip(chunks, outcomes):
+            for (index, _, _, cache_key), is_valid in zip(chunk, chunk_results):
+                self.verify_cache.put(cache_key, is_valid)
+                results[index] = is_valid
+        return results
+
+    async def issue_scrolls(self, batch: List[Tuple[dict, dict]]) -> List[Tuple[str, str]]:
+        """Sign and tokenize a chunk of scrolls as a single pool task.
+
+        Batch callers already bound their own fan-out, so they queue for a
+        slot instead of being shed after ``queue_timeout``.
+        """
+        return await self._run(self.crypto.issue_scrolls, _issue_in_worker, batch, wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "verify_cache": self.verify_cache.stats()
+        }
@@ -0,0 +1,132 @@
+"""
+FAA.zone™ DNS Health Monitor
+Async, cached and coalesced DNS checks for Cloudflare sync status
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import asyncio
+import logging
+import os
+import time
+
+from .metrics import stage_timer
+
+if TYPE_CHECKING:
+    import dns.asyncresolver
+
+logger = logging.getLogger("faa_scroll_backend")
+
+
+class DNSHealthMonitor:
+    """Keeps the last DNS check in memory and refreshes it in the background.
+
+    ``status`` never waits on the network once a first result exists: a
+    fresh result is returned as-is and a stale one is returned while a
+    refresh runs. Concurrent callers share a single in-flight lookup.
+    Healthy results live for the record TTL clamped to
+    ``[min_ttl, max_ttl]``; failures are retried after ``failure_ttl``.
+    """
+
+    def __init__(
+        self,
+        hostname: Optional[str] = None,
+        nameservers: Optional[List[str]] = None,
+        port: Optional[int] = None,
+        timeout: float = 2.0,
+        min_ttl: float = 5.0,
+        max_ttl: float = 300.0,
+        failure_ttl: float = 10.0
+    ):
+        self.hostname = hostname or os.getenv("SCROLL_DNS_HOST", "faa.zone")
+        env_nameservers = os.getenv("SCROLL_DNS_NAMESERVERS")
+        self.nameservers = nameservers or (env_nameservers.split(",") if env_nameservers else None)
+        self.port = port or int(os.getenv("SCROLL_DNS_PORT", "53"))
+        self.timeout = timeout
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.failure_ttl = failure_ttl
+        self._result: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._dns_resolver: Optional["dns.asyncresolver.Resolver"] = None
+        self.lookups = 0
+        self.coalesced = 0
+
+    def _resolver(self) -> "dns.asyncresolver.Resolver":
+        """Built on the first lookup and reused: configure=True re-reads /etc/resolv.conf"""
+        if self._dns_resolver is not None:
+            return self._dns_resolver
+        import dns.asyncresolver  # deferred until the first lookup
+        resolver = dns.asyncresolver.Resolver(configure=self.nameservers is None)
+        if self.nameservers:
+            resolver.nameservers = self.nameservers
+        resolver.port = self.port
+        resolver.timeout = self.timeout
+        resolver.lifetime = self.timeout
+        self._dns_resolver = resolver
+        return resolver
+
+    async def _lookup(self) -> Dict[str, Any]:
+        self.lookups += 1
+        try:
+            with stage_timer("dns_check"):
+                answers = await self._resolver().resolve(self.hostname, "A")
+            dns_healthy = len(answers) > 0
+            ttl = min(self.max_ttl, max(self.min_ttl, answers.rrset.ttl)) if dns_healthy else self.failure_ttl
+        except Exception as e:
+            logger.warning(f"DNS check failed: {e}")
+            dns_healthy = False
+            ttl = self.failure_ttl
+
+        self._result = {
+            "dns_status": "SYNCHRONIZED" if dns_healthy else "DEGRADED",
+            "resolver_health": dns_healthy,
+            "last_check": datetime.utcnow().isoformat(),
+            "ttl_seconds": ttl
+        }
+        self._expires_at = time.monotonic() + ttl
+        return self._result
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Run a lookup, joining the one already in flight if there is one"""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._lookup())
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(self._inflight)
+
+    async def status(self) -> Dict[str, Any]:
+        """Latest DNS status, served from memory whenever one is known"""
+        if self._result is None:
+            return await self.refresh()
+        if time.monotonic() >= self._expires_at and (self._inflight is None or self._inflight.done()):
+            self._inflight = asyncio.create_task(self._lookup())
+        return self._result
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ DNS refresher failed: {e}")
+            await asyncio.sleep(max(self.min_ttl, self._expires_at - time.monotonic()))
+
+    def start(self):
+        """Start the background refresher (idempotent)"""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop())
+
+    def stop(self):
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hostname": self.hostname,
+            "lookups": self.lookups,
+            "coalesced": self.coalesced,
+            "expires_in": round(max(0.0, self._expires_at - time.monotonic()), 1)
+        }
@@ -0,0 +1,96 @@
+"""
+FAA.zone™ Idempotency Cache
+Replays completed responses for repeated Idempotency-Key requests
+
+A key is scoped to one endpoint and bound to a fingerprint of the request
+that first used it. Duplicates that arrive while the first request is
+still running await the same task instead of computing again; duplicates
+that arrive afterwards get the stored response until it expires. Failed
+computations are not stored, so a client may retry them with the same key.
+The cache is per process.
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import hashlib
+import os
+import time
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyKeyReused(Exception):
+    """Raised when a key is presented again with a different request"""
+
+
+def request_fingerprint(payload: str) -> str:
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IdempotencyCache:
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries or int(os.getenv("SCROLL_IDEMPOTENCY_CACHE_SIZE", "10000"))
+        self.ttl = ttl if ttl is not None else float(os.getenv("SCROLL_IDEMPOTENCY_TTL", "3600"))
+        # (scope, key) -> (fingerprint, expires_at, response), oldest first
+        self._completed: "OrderedDict[Tuple[str, str], Tuple[str, float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str], Tuple[str, asyncio.Task]] = {}
+        self.metrics = {"hits": 0, "misses": 0, "collapsed": 0, "conflicts": 0}
+
+    def _expire(self, now: float):
+        while self._completed:
+            _, (_, expires_at, _) = next(iter(self._completed.items()))
+            if expires_at > now:
+                break
+            self._completed.popitem(last=False)
+
+    def _check(self, fingerprint: str, stored: str):
+        if fingerprint != stored:
+            self.metrics["conflicts"] += 1
+            raise IdempotencyKeyReused("Idempotency-Key was already used with a different request")
+
+    async def run(
+        self, scope: str, key: str, fingerprint: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Result of ``compute`` for this key, and whether it was replayed rather than computed"""
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValueError(f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+        cache_key = (scope, key)
+        self._expire(time.monotonic())
+
+        completed = self._completed.get(cache_key)
+        if completed is not None:
+            self._check(fingerprint, completed[0])
+            self.metrics["hits"] += 1
+            return completed[2], True
+
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None:
+            self._check(fingerprint, in_flight[0])
+            self.metrics["collapsed"] += 1
+            return await asyncio.shield(in_flight[1]), True
+
+        self.metrics["misses"] += 1
+        # A task, not a bare await: duplicates keep waiting on it even if
+        # the first caller disconnects
+        task = asyncio.ensure_future(compute())
+        self._in_flight[cache_key] = (fingerprint, task)
+        task.add_done_callback(lambda done: self._settle(cache_key, fingerprint, done))
+        return await asyncio.shield(task), False
+
+    def _settle(self, cache_key: Tuple[str, str], fingerprint: str, task: asyncio.Task):
+        self._in_flight.pop(cache_key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._completed[cache_key] = (fingerprint, time.monotonic() + self.ttl, task.result())
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.metrics["hits"] + self.metrics["collapsed"] + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "hit_rate": round((self.metrics["hits"] + self.metrics["collapsed"]) / lookups, 4) if lookups else 0.0,
+            "entries": len(self._completed),
+            "in_flight": len(self._in_flight)
+        }
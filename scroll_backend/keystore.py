@@ -0,0 +1,190 @@
+"""
+FAA.zone™ Scroll Key Store
+Persistent, lazily loaded scroll signing keys shared by every worker
+
+Layout of ``SCROLL_KEY_DIR`` (default ``.scroll-keys/``):
+
+    <kid>.pem   PKCS8 private key (RSA, Ed25519 or P-256), never deleted on rotation
+    ACTIVE      key ID currently used for new signatures
+    .lock       flock target serialising first-time generation and rotation
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import fcntl
+import logging
+import os
+import re
+import threading
+import uuid
+
+from .signers import ScrollSigner, configured_algorithm, get_signer, signer_for_key
+
+logger = logging.getLogger("faa_scroll_backend")
+
+ACTIVE_FILE = "ACTIVE"
+LOCK_FILE = ".lock"
+# <YYYYMMDD>-<8 hex>, as generated by new_key_id()
+KEY_ID_PATTERN = re.compile(r"\d{8}-[0-9a-f]{8}")
+
+
+def new_key_id() -> str:
+    return f"{datetime.utcnow().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}"
+
+
+def is_key_id(kid: Optional[str]) -> bool:
+    """Whether ``kid`` has the generated shape; checked before any kid becomes a path"""
+    return isinstance(kid, str) and KEY_ID_PATTERN.fullmatch(kid) is not None
+
+
+class UnknownKeyId(KeyError):
+    """Raised when a signature references a key ID that is not on disk"""
+
+
+class ScrollKeyStore:
+    def __init__(self, key_dir: Optional[str] = None):
+        self.key_dir = Path(key_dir or os.getenv("SCROLL_KEY_DIR", ".scroll-keys"))
+        self._keys: Dict[str, object] = {}
+        self._active_kid: Optional[str] = None
+        self._active_mtime = 0.0
+        self._lock = threading.Lock()
+        self._rotation_listeners = []
+
+    # -- internal helpers -------------------------------------------------
+
+    def _exclusive(self):
+        self.key_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.key_dir / LOCK_FILE, "a")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def _load_key(self, kid: str):
+        from cryptography.hazmat.primitives import serialization
+        if not is_key_id(kid):
+            # Key IDs come from signature envelopes; never let one name another file
+            raise UnknownKeyId(kid)
+        key_path = self.key_dir / f"{kid}.pem"
+        try:
+            pem = key_path.read_bytes()
+        except FileNotFoundError:
+            raise UnknownKeyId(kid)
+        # Keys are written by this store, so the expensive RSA consistency
+        # check on load is skipped; it dominates load time for 2048-bit keys.
+        # The flag is ignored for Ed25519 and P-256 keys.
+        return serialization.load_pem_private_key(
+            pem, password=None, unsafe_skip_rsa_key_validation=True
+        )
+
+    def _write_key(self, kid: str, private_key):
+        from cryptography.hazmat.primitives import serialization
+        pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        key_path = self.key_dir / f"{kid}.pem"
+        tmp_path = key_path.with_suffix(".pem.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pem)
+        os.replace(tmp_path, key_path)
+
+    def _set_active(self, kid: str):
+        tmp_path = self.key_dir / f"{ACTIVE_FILE}.tmp"
+        tmp_path.write_text(kid)
+        os.replace(tmp_path, self.key_dir / ACTIVE_FILE)
+
+    def _generate(self, alg: Optional[str] = None) -> str:
+        kid = new_key_id()
+        private_key = get_signer(alg or configured_algorithm()).generate_key()
+        self._write_key(kid, private_key)
+        self._keys[kid] = private_key
+        return kid
+
+    def _refresh_active(self):
+        active_path = self.key_dir / ACTIVE_FILE
+        try:
+            mtime = active_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime is not None and mtime == self._active_mtime and self._active_kid:
+            return
+
+        with self._lock:
+            if mtime is None:
+                # First start anywhere: one process generates, the rest wait and load
+                with self._exclusive():
+                    if not active_path.exists():
+                        kid = self._generate()
+                        self._set_active(kid)
+                        logger.info(f"🔐 Scroll signing key generated: {kid}")
+                    mtime = active_path.stat().st_mtime
+            previous_kid = self._active_kid
+            self._active_kid = active_path.read_text().strip()
+            self._active_mtime = mtime
+
+        if previous_kid and previous_kid != self._active_kid:
+            logger.info(f"🔐 Scroll signing key rotated: {previous_kid} → {self._active_kid}")
+            for listener in self._rotation_listeners:
+                listener(self._active_kid)
+
+    # -- public API -------------------------------------------------------
+
+    @property
+    def active_kid(self) -> str:
+        """Key ID used for new signatures (loads or generates on first use)"""
+        self._refresh_active()
+        return self._active_kid
+
+    def private_key(self, kid: Optional[str] = None):
+        kid = kid or self.active_kid
+        key = self._keys.get(kid)
+        if key is None:
+            with self._lock:
+                key = self._keys.get(kid)
+                if key is None:
+                    key = self._keys[kid] = self._load_key(kid)
+        return key
+
+    def public_key(self, kid: Optional[str] = None):
+        return self.private_key(kid).public_key()
+
+    def signer(self, kid: Optional[str] = None) -> ScrollSigner:
+        """Signature algorithm of a key, derived from its key type"""
+        return signer_for_key(self.private_key(kid))
+
+    def key_ids(self) -> List[str]:
+        return sorted(path.stem for path in self.key_dir.glob("*.pem"))
+
+    def rotate(self, alg: Optional[str] = None) -> str:
+        """Generate a new signing key and make it active; old keys stay verifiable"""
+        with self._lock, self._exclusive():
+            kid = self._generate(alg)
+            self._set_active(kid)
+        self._refresh_active()
+        return kid
+
+    def on_rotation(self, listener):
+        """Register a callback invoked with the new key ID after a rotation is seen"""
+        self._rotation_listeners.append(listener)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage scroll signing keys")
+    parser.add_argument("command", choices=["show", "rotate"])
+    parser.add_argument("--key-dir", help="Key directory (default: $SCROLL_KEY_DIR or .scroll-keys)")
+    parser.add_argument("--alg", help="Algorithm for the new key (default: $SCROLL_SIGNING_ALG or rsa-pss)")
+    args = parser.parse_args()
+
+    store = ScrollKeyStore(args.key_dir)
+    if args.command == "rotate":
+        kid = store.rotate(args.alg)
+        print(f"✅ Active signing key: {kid} ({store.signer(kid).alg})")
+    else:
+        active = store.active_kid
+        for kid in store.key_ids():
+            print(f"{'*' if kid == active else ' '} {kid} ({store.signer(kid).alg})")
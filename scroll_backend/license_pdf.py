@@ -0,0 +1,185 @@
+"""
+FAA.zone™ ClaimRoot License PDF
+Streaming single-page license PDF renderer with a content-addressed disk cache
+
+The renderer writes a minimal PDF 1.4 document (built-in Helvetica, no
+external dependencies) object by object, so bytes reach the client as
+they are produced. The cache key is a SHA-256 over the license fields and
+the renderer version: identical licenses share one file, the key doubles
+as the HTTP ETag, and any change to a license or the layout gets a new key.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+
+from .store import LICENSE_COLUMNS
+
+logger = logging.getLogger("faa_scroll_backend")
+
+RENDERER_VERSION = 1
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+
+
+def license_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    """The ClaimRootLicense fields of a stored license row, normalized"""
+    fields = {column: record[column] for column in LICENSE_COLUMNS}
+    fields["scroll_bound"] = bool(fields["scroll_bound"])
+    fields["generated_at"] = str(fields["generated_at"])
+    fields["expires_at"] = str(fields["expires_at"])
+    return fields
+
+
+def license_fingerprint(record: Dict[str, Any]) -> str:
+    canonical = json.dumps(
+        {"renderer": RENDERER_VERSION, **license_fields(record)}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _pdf_text(value: str) -> bytes:
+    encoded = value.encode("cp1252", errors="replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _page_content(fields: Dict[str, Any]) -> bytes:
+    lines = [
+        (22, "FAA.zone™ ClaimRoot License"),
+        (11, "Scroll-bound license issued under VOORWAARD MARS treaty sync"),
+        (11, ""),
+        (12, f"License ID:       {fields['license_id']}"),
+        (12, f"Application:      {fields['app_id']}"),
+        (12, f"Licensee:         {fields['licensee_id']}"),
+        (12, f"Treaty position:  #{fields['treaty_position']}"),
+        (12, f"Scroll bound:     {'YES' if fields['scroll_bound'] else 'NO'}"),
+        (12, f"Issued (UTC):     {fields['generated_at']}"),
+        (12, f"Expires (UTC):    {fields['expires_at']}"),
+        (11, ""),
+        (9, f"Verify at {fields['pdf_url']}"),
+    ]
+    ops: List[bytes] = [b"BT", b"72 %d Td" % (PAGE_HEIGHT - 96)]
+    for size, text in lines:
+        ops.append(b"/F1 %d Tf" % size)
+        ops.append(_pdf_text(text) + b" Tj")
+        ops.append(b"0 -%d Td" % int(size * 1.8))
+    ops.append(b"ET")
+    return b"\n".join(ops)
+
+
+def render_license_pdf(record: Dict[str, Any]) -> Iterator[bytes]:
+    """Yield a license PDF one object at a time"""
+    content = _page_content(license_fields(record))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>" % (PAGE_WIDTH, PAGE_HEIGHT),
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+
+    header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    offset = len(header)
+    yield header
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        chunk = b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        offsets.append(offset)
+        offset += len(chunk)
+        yield chunk
+
+    xref = [b"xref", b"0 %d" % (len(objects) + 1), b"0000000000 65535 f "]
+    xref += [b"%010d 00000 n " % position for position in offsets]
+    yield b"\n".join(xref) + b"\ntrailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, offset
+    )
+
+
+class PDFRenderCache:
+    """Size-bounded, content-addressed store of rendered license PDFs.
+
+    Files live at ``<cache_dir>/<key[:2]>/<key>.pdf``. A hit refreshes the
+    file's mtime; once the cache outgrows ``max_bytes`` the least recently
+    used files are removed.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or os.getenv("SCROLL_PDF_CACHE_DIR", ".scroll-pdf-cache"))
+        self.max_bytes = max_bytes or int(float(os.getenv("SCROLL_PDF_CACHE_MB", "256")) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pdf"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.metrics["misses"] += 1
+            return None
+        self.metrics["hits"] += 1
+        return path
+
+    def stream(self, key: str, record: Dict[str, Any]) -> Iterator[bytes]:
+        """Render to the caller while writing the same bytes into the cache"""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f".{key}.{uuid.uuid4().hex[:8]}.part")
+        written = 0
+        try:
+            with open(partial, "wb") as handle:
+                for chunk in render_license_pdf(record):
+                    handle.write(chunk)
+                    written += len(chunk)
+                    yield chunk
+            os.replace(partial, path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+        self._account(written)
+
+    def render(self, key: str, record: Dict[str, Any]) -> Path:
+        """Render fully into the cache (for range requests on a miss)"""
+        for _ in self.stream(key, record):
+            pass
+        return self.path_for(key)
+
+    def _scan(self) -> List[os.DirEntry]:
+        entries = []
+        if self.cache_dir.exists():
+            for shard in os.scandir(self.cache_dir):
+                if shard.is_dir():
+                    entries.extend(entry for entry in os.scandir(shard.path) if entry.name.endswith(".pdf"))
+        return entries
+
+    def _account(self, added: int):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self._scan())
+            else:
+                self._size += added
+            if self._size <= self.max_bytes:
+                return
+            entries = sorted(self._scan(), key=lambda entry: entry.stat().st_mtime)
+            self._size = sum(entry.stat().st_size for entry in entries)
+            for entry in entries:
+                if self._size <= self.max_bytes:
+                    break
+                try:
+                    size = entry.stat().st_size
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+                self._size -= size
+                self.metrics["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"cache_dir": str(self.cache_dir), "bytes": self._size, "max_bytes": self.max_bytes, **self.metrics}
@@ -0,0 +1,271 @@
+"""
+FAA.zone™ ClaimRoot License Tokens
+HS256 key ring, token verification, decoded-claims cache and revocation set
+
+Token secrets live next to the scroll signing keys so every worker (and
+every crypto pool process) signs and verifies with the same ring:
+
+    <key_dir>/jwt/<kid>.secret   256-bit HMAC secret (hex), never deleted on rotation
+    <key_dir>/jwt/ACTIVE         key ID used for new tokens
+
+Deployments spanning hosts can set ``SCROLL_JWT_SECRETS="kid:secret,..."``
+instead; the first entry signs, all of them verify.
+"""
+
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import fcntl
+import hashlib
+import logging
+import os
+import secrets
+import threading
+import time
+import uuid
+
+from .keystore import is_key_id, new_key_id
+from .metrics import stage_timer
+
+logger = logging.getLogger("faa_scroll_backend")
+
+TOKEN_ALGORITHM = "HS256"
+TOKEN_ISSUER = "faa.zone.scroll.backend"
+REVOCABLE_CLAIMS = ("jti", "license_id", "claim_root_license")
+
+
+class InvalidLicenseToken(Exception):
+    """Token is malformed, signed by an unknown key, expired or otherwise invalid"""
+
+
+class RevokedLicenseToken(InvalidLicenseToken):
+    """Token is valid but it, or the license it grants, has been revoked"""
+
+
+class TokenKeyRing:
+    def __init__(self, key_dir: Optional[str] = None):
+        base_dir = Path(key_dir or os.getenv("SCROLL_KEY_DIR", ".scroll-keys"))
+        self.key_dir = base_dir / "jwt"
+        self._secrets: Dict[str, bytes] = {}
+        self._active_kid: Optional[str] = None
+        self._active_mtime = 0.0
+        self._lock = threading.Lock()
+        self._pinned = False
+
+        configured = os.getenv("SCROLL_JWT_SECRETS", "")
+        for entry in filter(None, (part.strip() for part in configured.split(","))):
+            kid, _, secret = entry.partition(":")
+            if not secret:
+                raise ValueError("SCROLL_JWT_SECRETS entries must be kid:secret")
+            self._secrets[kid] = secret.encode()
+            self._active_kid = self._active_kid or kid
+            self._pinned = True
+
+    def _exclusive(self):
+        self.key_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.key_dir / ".lock", "a")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def _generate(self) -> str:
+        kid = new_key_id()
+        secret_path = self.key_dir / f"{kid}.secret"
+        tmp_path = secret_path.with_suffix(".secret.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(secrets.token_hex(32))
+        os.replace(tmp_path, secret_path)
+        return kid
+
+    def _set_active(self, kid: str):
+        tmp_path = self.key_dir / "ACTIVE.tmp"
+        tmp_path.write_text(kid)
+        os.replace(tmp_path, self.key_dir / "ACTIVE")
+
+    def _refresh_active(self):
+        if self._pinned:
+            return
+        active_path = self.key_dir / "ACTIVE"
+        try:
+            mtime = active_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and mtime == self._active_mtime and self._active_kid:
+            return
+
+        with self._lock:
+            if mtime is None:
+                with self._exclusive():
+                    if not active_path.exists():
+                        kid = self._generate()
+                        self._set_active(kid)
+                        logger.info(f"🔐 License token key generated: {kid}")
+                    mtime = active_path.stat().st_mtime
+            self._active_kid = active_path.read_text().strip()
+            self._active_mtime = mtime
+
+    @property
+    def active_kid(self) -> str:
+        self._refresh_active()
+        return self._active_kid
+
+    def secret(self, kid: Optional[str] = None) -> bytes:
+        kid = kid or self.active_kid
+        secret = self._secrets.get(kid)
+        if secret is None:
+            if self._pinned or not is_key_id(kid):
+                raise KeyError(kid)
+            try:
+                secret = (self.key_dir / f"{kid}.secret").read_text().strip().encode()
+            except FileNotFoundError:
+                raise KeyError(kid)
+            self._secrets[kid] = secret
+        return secret
+
+    def key_ids(self) -> List[str]:
+        if self._pinned:
+            return sorted(self._secrets)
+        return sorted(path.stem for path in self.key_dir.glob("*.secret"))
+
+    def rotate(self) -> str:
+        """Generate a new token secret and make it active; old tokens stay verifiable"""
+        if self._pinned:
+            raise RuntimeError("Token keys are pinned by SCROLL_JWT_SECRETS")
+        with self._lock, self._exclusive():
+            kid = self._generate()
+            self._set_active(kid)
+        self._refresh_active()
+        return kid
+
+    def encode(self, payload: dict) -> str:
+        import jwt  # deferred: PyJWT pulls in cryptography
+        kid = self.active_kid
+        return jwt.encode(payload, self.secret(kid), algorithm=TOKEN_ALGORITHM, headers={"kid": kid})
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        import jwt
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            return jwt.decode(
+                token,
+                self.secret(kid),
+                algorithms=[TOKEN_ALGORITHM],
+                issuer=TOKEN_ISSUER,
+                options={"require": ["exp", "iat", "iss"]}
+            )
+        except KeyError:
+            raise InvalidLicenseToken("Token signed by an unknown key")
+        except jwt.ExpiredSignatureError:
+            raise InvalidLicenseToken("Token expired")
+        except jwt.InvalidTokenError as e:
+            raise InvalidLicenseToken(f"Invalid token: {e}")
+
+
+def issue_license_token(key_ring: TokenKeyRing, payload: dict, expires_hours: int = 24) -> str:
+    """Sign ClaimRoot claims with the active key (adds exp, iat, iss and jti)"""
+    now = datetime.utcnow()
+    payload.update({
+        'exp': now + timedelta(hours=expires_hours),
+        'iat': now,
+        'iss': TOKEN_ISSUER,
+        'jti': uuid.uuid4().hex
+    })
+    with stage_timer("jwt_encode"):
+        return key_ring.encode(payload)
+
+
+class LicenseTokenVerifier:
+    """Verifies ClaimRoot license tokens on the request hot path.
+
+    Decoded claims are cached by SHA-256 token digest until the token's own
+    ``exp``, so repeat presentations skip HMAC and JSON work. Revocation is
+    checked on every call, cached or not, against an in-memory set of
+    revoked jti / license_id / claim_root_license values.
+    """
+
+    def __init__(self, key_ring: TokenKeyRing, max_entries: Optional[int] = None):
+        self.key_ring = key_ring
+        self.max_entries = max_entries or int(os.getenv("SCROLL_TOKEN_CACHE_SIZE", "50000"))
+        self._claims: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.revoked: set = set()
+        self._latency = {"cached": deque(maxlen=2048), "decoded": deque(maxlen=2048)}
+        self.metrics = {"verified": 0, "cache_hits": 0, "rejected": 0, "revoked": 0}
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Decoded claims of a valid, unrevoked token"""
+        started = time.perf_counter()
+        digest = hashlib.sha256(token.encode()).digest()
+        with self._lock:
+            claims = self._claims.get(digest)
+            if claims is not None:
+                self._claims.move_to_end(digest)
+
+        path = "cached"
+        if claims is not None and claims["exp"] <= time.time():
+            with self._lock:
+                self._claims.pop(digest, None)
+            claims = None
+        if claims is None:
+            path = "decoded"
+            try:
+                claims = self.key_ring.decode(token)
+            except InvalidLicenseToken:
+                self.metrics["rejected"] += 1
+                raise
+            with self._lock:
+                self._claims[digest] = claims
+                if len(self._claims) > self.max_entries:
+                    self._claims.popitem(last=False)
+        else:
+            self.metrics["cache_hits"] += 1
+
+        if self.is_revoked(claims):
+            self.metrics["revoked"] += 1
+            raise RevokedLicenseToken("Token has been revoked")
+        self.metrics["verified"] += 1
+        self._latency[path].append(time.perf_counter() - started)
+        return claims
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        return any(claims.get(claim) in self.revoked for claim in REVOCABLE_CLAIMS)
+
+    def revoke(self, identifiers: Iterable[str]):
+        self.revoked.update(identifiers)
+
+    @staticmethod
+    def _latency_summary(samples) -> Dict[str, Optional[float]]:
+        if not samples:
+            return {"p50_us": None, "p99_us": None, "max_us": None}
+        ordered = sorted(samples)
+        return {
+            "p50_us": round(ordered[len(ordered) // 2] * 1e6, 1),
+            "p99_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6, 1),
+            "max_us": round(ordered[-1] * 1e6, 1)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            "cached_claims": len(self._claims),
+            "revocations": len(self.revoked),
+            "latency": {path: self._latency_summary(samples) for path, samples in self._latency.items()}
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage ClaimRoot license token keys")
+    parser.add_argument("command", choices=["show", "rotate"])
+    parser.add_argument("--key-dir", help="Key directory (default: $SCROLL_KEY_DIR or .scroll-keys)")
+    args = parser.parse_args()
+
+    ring = TokenKeyRing(args.key_dir)
+    if args.command == "rotate":
+        print(f"✅ Active token key: {ring.rotate()}")
+    else:
+        active = ring.active_kid
+        for kid in ring.key_ids():
+            print(f"{'*' if kid == active else ' '} {kid}")
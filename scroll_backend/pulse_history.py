@@ -0,0 +1,159 @@
+"""
+FAA.zone™ Scroll Pulse History
+Fixed-capacity, array-backed ring buffer of pulse samples with range queries
+
+Each sample takes 11 bytes: a uint32 epoch second, uint16 nodes_active,
+uint32 scrolls_active and uint8 network_health. The default capacity of
+one week of 9-second pulses (67,200 samples) is about 720 KiB.
+
+Binary export layout (little-endian)::
+
+    header   4s magic b"PLSH", uint8 version, uint8 mode, uint32 rows
+    mode 0   raw: uint32 t[rows], uint16 nodes[rows], uint32 scrolls[rows], uint8 health[rows]
+    mode 1   buckets: uint32 t[rows], then float32 min/max/avg[rows] for
+             nodes_active, scrolls_active and network_health in that order
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import struct
+import sys
+
+METRICS = ("nodes_active", "scrolls_active", "network_health")
+METRIC_TYPECODES = {"nodes_active": "H", "scrolls_active": "I", "network_health": "B"}
+METRIC_LIMITS = {"nodes_active": 0xFFFF, "scrolls_active": 0xFFFFFFFF, "network_health": 0xFF}
+
+BINARY_MAGIC = b"PLSH"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBBI")
+
+WEEK_OF_PULSES = 7 * 24 * 3600 // 9
+
+
+class _RingView:
+    """Read-only sequence over one ring column in chronological order (for bisect)"""
+
+    def __init__(self, column: array, start: int, length: int):
+        self._column = column
+        self._start = start
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int):
+        return self._column[(self._start + index) % len(self._column)]
+
+
+class PulseHistory:
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity or int(os.getenv("SCROLL_PULSE_HISTORY_CAPACITY", str(WEEK_OF_PULSES)))
+        self._timestamps = array("I", bytes(4 * self.capacity))
+        self._columns = {
+            metric: array(code, bytes(array(code).itemsize * self.capacity))
+            for metric, code in METRIC_TYPECODES.items()
+        }
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column) for column in (self._timestamps, *self._columns.values()))
+
+    def append(self, timestamp: float, nodes_active: int, scrolls_active: int, network_health: int):
+        """Record one pulse, overwriting the oldest sample once full"""
+        slot = self._next
+        self._timestamps[slot] = int(timestamp)
+        for metric, value in zip(METRICS, (nodes_active, scrolls_active, network_health)):
+            self._columns[metric][slot] = min(max(int(value), 0), METRIC_LIMITS[metric])
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _start(self) -> int:
+        return (self._next - self._count) % self.capacity
+
+    def _range(self, from_ts: Optional[float], to_ts: Optional[float]) -> Tuple[int, int]:
+        """Logical [lo, hi) sample indices whose timestamps fall within [from_ts, to_ts]"""
+        timestamps = _RingView(self._timestamps, self._start(), self._count)
+        lo = 0 if from_ts is None else bisect_left(timestamps, from_ts)
+        hi = self._count if to_ts is None else bisect_right(timestamps, to_ts)
+        return lo, max(lo, hi)
+
+    def _column_slice(self, column: array, lo: int, hi: int) -> array:
+        start = (self._start() + lo) % self.capacity
+        end = start + (hi - lo)
+        if end <= self.capacity:
+            return column[start:end]
+        return column[start:] + column[:end - self.capacity]
+
+    def query(self, from_ts: Optional[float] = None, to_ts: Optional[float] = None) -> Dict[str, array]:
+        """Raw samples in range as typed columns"""
+        lo, hi = self._range(from_ts, to_ts)
+        result = {"t": self._column_slice(self._timestamps, lo, hi)}
+        for metric in METRICS:
+            result[metric] = self._column_slice(self._columns[metric], lo, hi)
+        return result
+
+    def downsample(
+        self, from_ts: Optional[float] = None, to_ts: Optional[float] = None, buckets: int = 100
+    ) -> Dict[str, Any]:
+        """Aggregate samples in range into equal-width time buckets with min/max/avg"""
+        raw = self.query(from_ts, to_ts)
+        timestamps = raw["t"]
+        if not timestamps:
+            return {"t": [], "bucket_seconds": 0, **{metric: {"min": [], "max": [], "avg": []} for metric in METRICS}}
+
+        first = int(from_ts) if from_ts is not None else timestamps[0]
+        last = int(to_ts) if to_ts is not None else timestamps[-1]
+        width = max(1, -(-(last - first + 1) // buckets))
+
+        bucket_starts: List[int] = []
+        stats = {metric: {"min": [], "max": [], "avg": []} for metric in METRICS}
+        index = 0
+        total = len(timestamps)
+        while index < total:
+            bucket = (timestamps[index] - first) // width
+            end = index
+            while end < total and (timestamps[end] - first) // width == bucket:
+                end += 1
+            bucket_starts.append(first + bucket * width)
+            for metric in METRICS:
+                values = raw[metric][index:end]
+                stats[metric]["min"].append(min(values))
+                stats[metric]["max"].append(max(values))
+                stats[metric]["avg"].append(round(sum(values) / len(values), 2))
+            index = end
+
+        return {"t": bucket_starts, "bucket_seconds": width, **stats}
+
+    @staticmethod
+    def _le_bytes(values: array) -> bytes:
+        if sys.byteorder != "little":
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+
+    def to_binary(
+        self, from_ts: Optional[float] = None, to_ts: Optional[float] = None, buckets: Optional[int] = None
+    ) -> bytes:
+        """Pack raw samples or downsampled buckets in the layout described above"""
+        if buckets:
+            data = self.downsample(from_ts, to_ts, buckets)
+            parts = [BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 1, len(data["t"]))]
+            parts.append(self._le_bytes(array("I", data["t"])))
+            for metric in METRICS:
+                for stat in ("min", "max", "avg"):
+                    parts.append(self._le_bytes(array("f", data[metric][stat])))
+            return b"".join(parts)
+
+        raw = self.query(from_ts, to_ts)
+        parts = [BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(raw["t"]))]
+        parts.append(self._le_bytes(raw["t"]))
+        for metric in METRICS:
+            parts.append(self._le_bytes(raw[metric]))
+        return b"".join(parts)
@@ -0,0 +1,76 @@
+"""
+FAA.zone™ Scroll Pulse Hub
+In-memory broadcast of scroll pulses to SSE and WebSocket subscribers
+"""
+
+from collections import deque
+from typing import Any, Dict, Optional, Set
+import asyncio
+import json
+import os
+
+
+class PulseSubscription:
+    """One subscriber's bounded pulse buffer.
+
+    A slow consumer never blocks the publisher: once ``maxsize`` pulses are
+    waiting, the oldest is dropped and counted. Idle subscribers park on an
+    ``asyncio.Event`` and cost nothing between pulses.
+    """
+
+    def __init__(self, hub: "PulseHub", maxsize: int):
+        self._hub = hub
+        self._buffer: deque = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def push(self, message: str):
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(message)
+        self._ready.set()
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Wait for the next serialized pulse; ``None`` if ``timeout`` passes first"""
+        while not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._buffer.popleft()
+
+    def close(self):
+        self._hub.unsubscribe(self)
+
+
+class PulseHub:
+    """Fans each pulse out to every subscriber, serializing it only once"""
+
+    def __init__(self, buffer_size: Optional[int] = None):
+        self.buffer_size = buffer_size or int(os.getenv("SCROLL_PULSE_BUFFER", "16"))
+        self._subscribers: Set[PulseSubscription] = set()
+        self.latest: Optional[str] = None
+        self.published = 0
+
+    def subscribe(self) -> PulseSubscription:
+        subscription = PulseSubscription(self, self.buffer_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: PulseSubscription):
+        self._subscribers.discard(subscription)
+
+    def publish(self, pulse: Dict[str, Any]):
+        message = json.dumps(pulse)
+        self.latest = message
+        self.published += 1
+        for subscription in self._subscribers:
+            subscription.push(message)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "dropped": sum(subscription.dropped for subscription in self._subscribers)
+        }
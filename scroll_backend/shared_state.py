@@ -0,0 +1,176 @@
+"""
+FAA.zone™ Shared Worker State
+Cross-process counters and pulse leader election for multi-worker deployments
+
+Layout of ``SCROLL_SHARED_DIR`` (default ``.scroll-shared/``):
+
+    counters.mmap   8-byte header, then one little-endian int64 slot per counter
+    pulse.leader    flock held by the worker that emits scroll pulses (holds its PID)
+
+Every uvicorn worker maps ``counters.mmap``. Single reads are plain
+aligned 8-byte loads. Updates and multi-slot snapshots take a short
+flock on the file, plus a thread lock, because flock does not exclude
+threads that share a descriptor. Read-modify-write across workers
+therefore never loses an increment.
+
+Leadership is a non-blocking exclusive flock that the kernel drops when
+the holder exits. A follower that keeps calling ``try_acquire`` takes
+over the pulse within one poll of the leader dying.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import threading
+
+logger = logging.getLogger("faa_scroll_backend")
+
+MAGIC = b"SCSH"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+SLOT = struct.Struct("<q")
+
+COUNTERS_FILE = "counters.mmap"
+LEADER_FILE = "pulse.leader"
+
+
+def shared_dir(path: Optional[str] = None) -> Path:
+    return Path(path or os.getenv("SCROLL_SHARED_DIR", ".scroll-shared"))
+
+
+class SharedCounters:
+    """Named int64 counters in a file-backed mmap segment shared by every worker.
+
+    ``defaults`` fixes the slot layout (in insertion order) and seeds a new
+    segment. A segment whose header does not match that layout is reseeded.
+    The file is mapped lazily on first use.
+    """
+
+    def __init__(self, defaults: Dict[str, int], path: Optional[str] = None):
+        self.path = Path(path) if path else shared_dir() / COUNTERS_FILE
+        self.defaults = dict(defaults)
+        self._offsets = {name: HEADER.size + index * SLOT.size for index, name in enumerate(self.defaults)}
+        self._size = HEADER.size + len(self.defaults) * SLOT.size
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def _segment(self) -> mmap.mmap:
+        if self._map is None:
+            with self._lock:
+                if self._map is None:
+                    self._open()
+        return self._map
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.path, "a+b")
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            handle.seek(0)
+            header = handle.read(HEADER.size)
+            if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION, len(self.defaults)) \
+                    or os.fstat(handle.fileno()).st_size != self._size:
+                self._seed(handle)
+            segment = mmap.mmap(handle.fileno(), self._size)
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+        self._file, self._map = handle, segment
+
+    def _seed(self, handle):
+        handle.truncate(0)
+        handle.write(HEADER.pack(MAGIC, VERSION, len(self.defaults)))
+        for value in self.defaults.values():
+            handle.write(SLOT.pack(value))
+        handle.flush()
+
+    @contextmanager
+    def _locked(self, operation: int = fcntl.LOCK_EX) -> Iterator[mmap.mmap]:
+        segment = self._segment()
+        with self._lock:
+            fcntl.flock(self._file, operation)
+            try:
+                yield segment
+            finally:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def get(self, name: str) -> int:
+        return SLOT.unpack_from(self._segment(), self._offsets[name])[0]
+
+    def add(self, name: str, delta: int = 1) -> int:
+        """Atomically add ``delta`` across workers, returning the new value"""
+        offset = self._offsets[name]
+        with self._locked() as segment:
+            value = SLOT.unpack_from(segment, offset)[0] + delta
+            SLOT.pack_into(segment, offset, value)
+        return value
+
+    def update(self, values: Dict[str, int]):
+        """Set several counters in one critical section"""
+        with self._locked() as segment:
+            for name, value in values.items():
+                SLOT.pack_into(segment, self._offsets[name], int(value))
+
+    def snapshot(self, names: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Consistent view of several counters (all by default)"""
+        with self._locked(fcntl.LOCK_SH) as segment:
+            return {name: SLOT.unpack_from(segment, self._offsets[name])[0] for name in (names or self._offsets)}
+
+    def reset(self):
+        """Reseed every counter from ``defaults`` (the launcher does this once per deployment)"""
+        self.update(self.defaults)
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._file.close()
+                self._map = self._file = None
+
+
+class LeaderLease:
+    """Exclusive, crash-released role held by at most one worker"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else shared_dir() / LEADER_FILE
+        self._file = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        """Become leader if nobody holds the lease; cheap to call every poll"""
+        if self._file is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.path, "a+")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            handle.close()
+            return False
+        handle.truncate(0)
+        handle.write(str(os.getpid()))
+        handle.flush()
+        self._file = handle
+        logger.info(f"👑 Worker {os.getpid()} elected pulse leader")
+        return True
+
+    def holder(self) -> Optional[int]:
+        """PID of the current leader, if one has ever written it"""
+        try:
+            return int(self.path.read_text() or 0) or None
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
@@ -0,0 +1,192 @@
+"""
+FAA.zone™ Scroll Signature Algorithms
+RSA-PSS, Ed25519 and ECDSA-P256 behind one signer interface
+
+Run ``python -m scroll_backend.signers`` for a signs/verifies-per-second
+micro-benchmark of every algorithm on this host.
+
+``cryptography`` is imported on first use, not at import time, so
+processes that never sign (and worker spawns before the first request)
+do not pay for it.
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict
+import os
+import time
+
+DEFAULT_ALGORITHM = "rsa-pss"
+
+
+class UnknownAlgorithm(ValueError):
+    """Raised for an algorithm name no signer is registered for"""
+
+
+@lru_cache(maxsize=None)
+def _rsa_pss_scheme():
+    """PSS padding and hash for RSA signatures, built once"""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+    return padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH), hashes.SHA256()
+
+
+@lru_cache(maxsize=None)
+def _ecdsa_scheme():
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    return ec.ECDSA(hashes.SHA256())
+
+
+class ScrollSigner(ABC):
+    """Signs and verifies raw scroll messages for one key type"""
+    alg = ""
+
+    @property
+    @abstractmethod
+    def key_type(self):
+        """Private key class this signer handles"""
+
+    @abstractmethod
+    def generate_key(self):
+        """New private key of ``key_type``"""
+
+    @abstractmethod
+    def sign(self, private_key, message: bytes) -> bytes:
+        """Raw signature over ``message``"""
+
+    @abstractmethod
+    def verify(self, public_key, signature: bytes, message: bytes):
+        """Raise ``cryptography.exceptions.InvalidSignature`` on mismatch"""
+
+
+class RSAPSSSigner(ScrollSigner):
+    alg = "rsa-pss"
+
+    @property
+    def key_type(self):
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        return rsa.RSAPrivateKey
+
+    def generate_key(self):
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def sign(self, private_key, message: bytes) -> bytes:
+        return private_key.sign(message, *_rsa_pss_scheme())
+
+    def verify(self, public_key, signature: bytes, message: bytes):
+        public_key.verify(signature, message, *_rsa_pss_scheme())
+
+
+class Ed25519Signer(ScrollSigner):
+    alg = "ed25519"
+
+    @property
+    def key_type(self):
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+        return ed25519.Ed25519PrivateKey
+
+    def generate_key(self):
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+        return ed25519.Ed25519PrivateKey.generate()
+
+    def sign(self, private_key, message: bytes) -> bytes:
+        return private_key.sign(message)
+
+    def verify(self, public_key, signature: bytes, message: bytes):
+        public_key.verify(signature, message)
+
+
+class ECDSAP256Signer(ScrollSigner):
+    alg = "ecdsa-p256"
+
+    @property
+    def key_type(self):
+        from cryptography.hazmat.primitives.asymmetric import ec
+        return ec.EllipticCurvePrivateKey
+
+    def generate_key(self):
+        from cryptography.hazmat.primitives.asymmetric import ec
+        return ec.generate_private_key(ec.SECP256R1())
+
+    def sign(self, private_key, message: bytes) -> bytes:
+        return private_key.sign(message, _ecdsa_scheme())
+
+    def verify(self, public_key, signature: bytes, message: bytes):
+        public_key.verify(signature, message, _ecdsa_scheme())
+
+
+SIGNERS: Dict[str, ScrollSigner] = {
+    signer.alg: signer for signer in (RSAPSSSigner(), Ed25519Signer(), ECDSAP256Signer())
+}
+
+
+def get_signer(alg: str) -> ScrollSigner:
+    try:
+        return SIGNERS[alg]
+    except KeyError:
+        raise UnknownAlgorithm(f"Unknown scroll signature algorithm: {alg}")
+
+
+def signer_for_key(private_key) -> ScrollSigner:
+    """Pick the signer matching a loaded private key"""
+    for signer in SIGNERS.values():
+        if isinstance(private_key, signer.key_type):
+            return signer
+    raise UnknownAlgorithm(f"Unsupported scroll key type: {type(private_key).__name__}")
+
+
+def configured_algorithm() -> str:
+    """Algorithm for newly generated keys, from SCROLL_SIGNING_ALG"""
+    alg = os.getenv("SCROLL_SIGNING_ALG", DEFAULT_ALGORITHM).lower()
+    get_signer(alg)
+    return alg
+
+
+def benchmark_signers(duration: float = 1.0, message_size: int = 256) -> Dict[str, Dict[str, Any]]:
+    """Measure signs and verifies per second for every registered algorithm"""
+    message = os.urandom(message_size)
+    results = {}
+    for alg, signer in SIGNERS.items():
+        private_key = signer.generate_key()
+        public_key = private_key.public_key()
+
+        signs = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            signature = signer.sign(private_key, message)
+            signs += 1
+        sign_elapsed = time.perf_counter() - started
+
+        verifies = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            signer.verify(public_key, signature, message)
+            verifies += 1
+        verify_elapsed = time.perf_counter() - started
+
+        results[alg] = {
+            "signs_per_sec": round(signs / sign_elapsed),
+            "verifies_per_sec": round(verifies / verify_elapsed),
+            "signature_hex_chars": len(signature.hex())
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Scroll signature algorithm micro-benchmark")
+    parser.add_argument("--duration", type=float, default=1.0, help="Seconds per algorithm and operation")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    results = benchmark_signers(args.duration)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'algorithm':<12} {'signs/s':>10} {'verifies/s':>11} {'sig hex':>8}")
+        for alg, row in results.items():
+            print(f"{alg:<12} {row['signs_per_sec']:>10} {row['verifies_per_sec']:>11} {row['signature_hex_chars']:>8}")
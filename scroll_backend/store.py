@@ -0,0 +1,386 @@
+"""
+FAA.zone™ Scroll Store
+Durable, append-only SQLite (WAL) store for scrolls and ClaimRoot licenses
+
+All writes go through one writer thread that commits queued operations
+in groups: every operation waiting when a transaction starts shares its
+commit, each inside its own SAVEPOINT so one failure does not sink the
+group. Transactions use BEGIN IMMEDIATE, so the treaty position sequence
+stays monotonic across every process sharing the database file.
+
+License queries use keyset pagination: every secondary index implicitly
+ends in ``seq`` (the rowid), so "licensee X after seq N" and "expiring
+between A and B after (expires_at, seq)" are index range scans whose
+cost does not grow with page depth.
+"""
+
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+import asyncio
+import base64
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from .metrics import STAGE_SECONDS
+
+logger = logging.getLogger("faa_scroll_backend")
+
+TREATY_SEQUENCE = "treaty_position"
+TREATY_SEQUENCE_START = 247
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrolls (
+    seq INTEGER PRIMARY KEY,
+    scroll_id TEXT NOT NULL UNIQUE,
+    treaty_position INTEGER NOT NULL,
+    claim_root_license TEXT,
+    app_concept TEXT,
+    funding_amount REAL,
+    scroll_signature TEXT,
+    created_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scrolls_treaty_position ON scrolls (treaty_position);
+
+CREATE TABLE IF NOT EXISTS licenses (
+    seq INTEGER PRIMARY KEY,
+    license_id TEXT NOT NULL UNIQUE,
+    app_id TEXT NOT NULL,
+    licensee_id TEXT NOT NULL,
+    treaty_position INTEGER NOT NULL,
+    scroll_bound INTEGER NOT NULL,
+    generated_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL,
+    pdf_url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_licenses_licensee_id ON licenses (licensee_id);
+CREATE INDEX IF NOT EXISTS idx_licenses_treaty_position ON licenses (treaty_position);
+CREATE INDEX IF NOT EXISTS idx_licenses_app_id ON licenses (app_id);
+CREATE INDEX IF NOT EXISTS idx_licenses_expires_at ON licenses (expires_at);
+
+CREATE TABLE IF NOT EXISTS revocations (
+    seq INTEGER PRIMARY KEY,
+    identifier TEXT NOT NULL UNIQUE,
+    revoked_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+LICENSE_COLUMNS = (
+    "license_id", "app_id", "licensee_id", "treaty_position",
+    "scroll_bound", "generated_at", "expires_at", "pdf_url"
+)
+
+
+def _isoformat(value) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def encode_cursor(values: list) -> str:
+    """Opaque pagination cursor for the last row of a page"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """Sort-key values of a cursor; ValueError unless it holds ``length`` scalars"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("Malformed pagination cursor")
+    if not isinstance(values, list) or len(values) != length or not all(
+        isinstance(value, (str, int, float)) and not isinstance(value, bool) for value in values
+    ):
+        # Anything else would reach sqlite parameter binding
+        raise ValueError("Malformed pagination cursor")
+    return values
+
+
+class ScrollStore:
+    def __init__(self, path: Optional[str] = None, group_commit_max: Optional[int] = None):
+        self.path = Path(path or os.getenv("SCROLL_STORE_PATH", ".scroll-store/scrolls.db"))
+        self.group_commit_max = group_commit_max or int(os.getenv("SCROLL_STORE_GROUP_COMMIT", "512"))
+        self._ops: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._readers = threading.local()
+        self.metrics = {"writes": 0, "commits": 0, "largest_group": 0}
+
+    # -- connections and lifecycle ----------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def start(self):
+        """Open the database, apply the schema and start the writer (idempotent)"""
+        with self._start_lock:
+            if self._writer is not None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            conn.executescript(SCHEMA)
+            conn.execute(
+                "INSERT OR IGNORE INTO sequences (name, value) VALUES (?, ?)",
+                (TREATY_SEQUENCE, TREATY_SEQUENCE_START)
+            )
+            self._writer = threading.Thread(
+                target=self._write_loop, args=(conn,), name="scroll-store-writer", daemon=True
+            )
+            self._writer.start()
+            logger.info(f"📜 Scroll store opened: {self.path}")
+
+    def close(self):
+        """Flush queued writes and stop the writer thread"""
+        if self._writer is not None:
+            self._ops.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            self.start()
+            conn = self._readers.conn = self._connect()
+        return conn
+
+    # -- group commit writer ---------------------------------------------
+
+    def _write_loop(self, conn: sqlite3.Connection):
+        stopping = False
+        while not stopping:
+            op = self._ops.get()
+            if op is None:
+                break
+            group = [op]
+            while len(group) < self.group_commit_max:
+                try:
+                    op = self._ops.get_nowait()
+                except queue.Empty:
+                    break
+                if op is None:
+                    stopping = True
+                    break
+                group.append(op)
+            self._commit_group(conn, group)
+        conn.close()
+
+    def _commit_group(self, conn: sqlite3.Connection, group: List[tuple]):
+        outcomes = []
+        started = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, _ in group:
+                conn.execute("SAVEPOINT op")
+                try:
+                    outcomes.append((True, fn(conn)))
+                    conn.execute("RELEASE op")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO op")
+                    conn.execute("RELEASE op")
+                    outcomes.append((False, e))
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"❌ Scroll store commit failed: {e}")
+            outcomes = [(False, e)] * len(group)
+
+        STAGE_SECONDS.observe(time.perf_counter() - started, ("store_commit",))
+        self.metrics["writes"] += len(group)
+        self.metrics["commits"] += 1
+        self.metrics["largest_group"] = max(self.metrics["largest_group"], len(group))
+        for (_, future), (ok, value) in zip(group, outcomes):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def submit(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        """Queue a write for the next group commit"""
+        self.start()
+        future: Future = Future()
+        self._ops.put((fn, future))
+        return future
+
+    async def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        return await asyncio.wrap_future(self.submit(fn))
+
+    # -- writes -----------------------------------------------------------
+
+    async def allocate_treaty_positions(self, count: int = 1) -> int:
+        """Reserve ``count`` contiguous treaty positions, returning the first"""
+        def allocate(conn):
+            conn.execute("UPDATE sequences SET value = value + ? WHERE name = ?", (count, TREATY_SEQUENCE))
+            last = conn.execute("SELECT value FROM sequences WHERE name = ?", (TREATY_SEQUENCE,)).fetchone()[0]
+            return last - count + 1
+        return await self._write(allocate)
+
+    async def append_scrolls(self, scrolls: List[Dict[str, Any]]):
+        """Persist signed scroll records (``scroll_data`` plus claim_root_license)"""
+        rows = [
+            (
+                scroll["scroll_id"], scroll["treaty_position"], scroll.get("claim_root_license"),
+                scroll.get("app_concept"), scroll.get("funding_amount"), scroll.get("scroll_signature"),
+                scroll.get("timestamp") or datetime.utcnow().isoformat(), json.dumps(scroll, default=str)
+            )
+            for scroll in scrolls
+        ]
+
+        def insert(conn):
+            conn.executemany(
+                "INSERT INTO scrolls (scroll_id, treaty_position, claim_root_license, app_concept, "
+                "funding_amount, scroll_signature, created_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        await self._write(insert)
+
+    async def append_scroll(self, scroll: Dict[str, Any]):
+        await self.append_scrolls([scroll])
+
+    async def append_license(self, license_record: Dict[str, Any]):
+        """Persist a ClaimRootLicense (as a dict)"""
+        row = tuple(
+            _isoformat(license_record[column]) if column.endswith("_at") else license_record[column]
+            for column in LICENSE_COLUMNS
+        )
+
+        def insert(conn):
+            conn.execute(
+                f"INSERT INTO licenses ({', '.join(LICENSE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(LICENSE_COLUMNS))})",
+                row
+            )
+        await self._write(insert)
+
+    async def append_revocations(self, identifiers: List[str]):
+        """Record revoked token jti / license_id / claim_root_license values"""
+        revoked_at = datetime.utcnow().isoformat()
+
+        def insert(conn):
+            conn.executemany(
+                "INSERT OR IGNORE INTO revocations (identifier, revoked_at) VALUES (?, ?)",
+                [(identifier, revoked_at) for identifier in identifiers]
+            )
+        await self._write(insert)
+
+    # -- reads ------------------------------------------------------------
+
+    def _revocations_since(self, after_seq: int) -> Tuple[List[str], int]:
+        rows = self._reader().execute(
+            "SELECT seq, identifier FROM revocations WHERE seq > ? ORDER BY seq", (after_seq,)
+        ).fetchall()
+        return [row["identifier"] for row in rows], (rows[-1]["seq"] if rows else after_seq)
+
+    async def revocations_since(self, after_seq: int = 0) -> Tuple[List[str], int]:
+        """Revocations recorded after ``after_seq`` (by any process) and the new high-water mark"""
+        return await asyncio.to_thread(self._revocations_since, after_seq)
+
+    def _fetch_one(self, sql: str, params: tuple) -> Optional[Dict[str, Any]]:
+        row = self._reader().execute(sql, params).fetchone()
+        return dict(row) if row else None
+
+    async def get_scroll(self, scroll_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._fetch_one, "SELECT * FROM scrolls WHERE scroll_id = ?", (scroll_id,))
+
+    async def get_scroll_by_position(self, treaty_position: int) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(
+            self._fetch_one, "SELECT * FROM scrolls WHERE treaty_position = ?", (treaty_position,)
+        )
+
+    async def get_license(self, license_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(
+            self._fetch_one, "SELECT * FROM licenses WHERE license_id = ?", (license_id,)
+        )
+
+    def _query_licenses(
+        self,
+        licensee_id: Optional[str],
+        app_id: Optional[str],
+        expires_from: Optional[str],
+        expires_to: Optional[str],
+        cursor: Optional[str],
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        clauses, params = [], []
+        if licensee_id is not None:
+            clauses.append("licensee_id = ?")
+            params.append(licensee_id)
+        if app_id is not None:
+            clauses.append("app_id = ?")
+            params.append(app_id)
+        by_expiry = expires_from is not None or expires_to is not None
+        if expires_from is not None:
+            clauses.append("expires_at >= ?")
+            params.append(expires_from)
+        if expires_to is not None:
+            clauses.append("expires_at < ?")
+            params.append(expires_to)
+        if cursor:
+            position = decode_cursor(cursor, 2 if by_expiry else 1)
+            if by_expiry:
+                # The plain bound lets the index seek straight to the cursor
+                clauses.append("expires_at >= ? AND (expires_at, seq) > (?, ?)")
+                position = [position[0], *position]
+            else:
+                clauses.append("seq > ?")
+            params.extend(position)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "expires_at, seq" if by_expiry else "seq"
+        rows = self._reader().execute(
+            f"SELECT seq, {', '.join(LICENSE_COLUMNS)} FROM licenses {where} ORDER BY {order} LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+
+        licenses = []
+        for row in rows:
+            record = dict(row)
+            record.pop("seq")
+            record["scroll_bound"] = bool(record["scroll_bound"])
+            licenses.append(record)
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = encode_cursor([last["expires_at"], last["seq"]] if by_expiry else [last["seq"]])
+        return licenses, next_cursor
+
+    async def query_licenses(
+        self,
+        licensee_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        expires_from: Optional[str] = None,
+        expires_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """One page of licenses matching the filters, plus the cursor for the next page"""
+        return await asyncio.to_thread(
+            self._query_licenses, licensee_id, app_id, expires_from, expires_to, cursor, limit
+        )
+
+    async def iter_licenses(self, page_size: int = 1000, **filters) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Walk every matching license page by page (for streamed responses)"""
+        cursor = filters.pop("cursor", None)
+        while True:
+            licenses, cursor = await self.query_licenses(cursor=cursor, limit=page_size, **filters)
+            if licenses:
+                yield licenses
+            if cursor is None:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": str(self.path), "queued": self._ops.qsize(), **self.metrics}
@@ -0,0 +1,263 @@
+"""
+FAA.zone™ VaultMesh Sync Engine
+Queued, batched VaultMesh synchronization with retries and a dead-letter spill
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+
+from .metrics import stage_timer
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger("faa_scroll_backend")
+
+
+class VaultMeshRejected(Exception):
+    """VaultMesh refused a batch with a non-retryable status"""
+
+
+class VaultMeshSyncEngine:
+    """Buffers scroll payloads and ships them to VaultMesh in batches.
+
+    Payloads are queued in-process and flushed once ``batch_size`` items
+    are waiting or ``flush_interval`` seconds after the first item of a
+    batch arrived. Each batch is POSTed as ``{"scrolls": [...]}`` over a
+    pooled aiohttp session. Timeouts, connection errors, 429 and 5xx are
+    retried with jittered exponential backoff. Batches that still fail,
+    or payloads that arrive while the queue is full, are appended to the
+    dead-letter NDJSON file. Spill file I/O runs in worker threads, never
+    on the event loop.
+
+    Without ``VAULTMESH_SYNC_URL`` the engine keeps the original simulated
+    sync: one 100 ms delay per batch instead of per scroll.
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        dead_letter_path: Optional[str] = None,
+        on_synced: Optional[Callable[[int], None]] = None
+    ):
+        self.endpoint = endpoint or os.getenv("VAULTMESH_SYNC_URL")
+        self.batch_size = batch_size or int(os.getenv("VAULTMESH_SYNC_BATCH_SIZE", "100"))
+        self.flush_interval = flush_interval or float(os.getenv("VAULTMESH_SYNC_FLUSH_INTERVAL", "0.25"))
+        self.max_queue = max_queue or int(os.getenv("VAULTMESH_SYNC_MAX_QUEUE", "10000"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("VAULTMESH_SYNC_MAX_RETRIES", "5"))
+        self.backoff_base = backoff_base or float(os.getenv("VAULTMESH_SYNC_BACKOFF", "0.2"))
+        self.request_timeout = request_timeout or float(os.getenv("VAULTMESH_SYNC_TIMEOUT", "5"))
+        self.concurrency = concurrency or int(os.getenv("VAULTMESH_SYNC_CONCURRENCY", "2"))
+        self.dead_letter_path = dead_letter_path or os.getenv(
+            "VAULTMESH_DEAD_LETTER_PATH", ".vaultmesh-deadletter.ndjson"
+        )
+        self.on_synced = on_synced
+        self._queue: Optional[asyncio.Queue] = None
+        self._flushers: List[asyncio.Task] = []
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Spill writes from worker threads are serialised so NDJSON lines never interleave
+        self._spill_lock = threading.Lock()
+        self._spills: set = set()
+        # aiohttp is only imported once there is a real endpoint to talk to
+        self._retryable = (asyncio.TimeoutError,)
+        self.metrics = {
+            "enqueued": 0,
+            "synced": 0,
+            "batches_sent": 0,
+            "retries": 0,
+            "failed_batches": 0,
+            "dead_lettered": 0
+        }
+
+    # -- lifecycle --------------------------------------------------------
+
+    def _ensure_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        return self._queue
+
+    def start(self):
+        """Start the flusher tasks (idempotent)"""
+        self._ensure_queue()
+        if self._flushers:
+            return
+        if self.endpoint:
+            import aiohttp
+            self._retryable = (aiohttp.ClientError, asyncio.TimeoutError)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency * 2, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+        self._flushers = [asyncio.create_task(self._flush_loop()) for _ in range(self.concurrency)]
+        target = self.endpoint or "simulated VaultMesh"
+        logger.info(f"🧬 VaultMesh sync engine started → {target} (batch {self.batch_size}, {self.flush_interval}s)")
+
+    async def stop(self, drain_timeout: float = 5.0):
+        """Flush what is queued, then spill anything left to the dead-letter file"""
+        if self._queue is not None and self._flushers:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ VaultMesh sync drain timed out")
+        for flusher in self._flushers:
+            flusher.cancel()
+        await asyncio.gather(*self._flushers, return_exceptions=True)
+        self._flushers = []
+
+        leftovers = []
+        while self._queue is not None and not self._queue.empty():
+            leftovers.append(self._queue.get_nowait())
+            self._queue.task_done()
+        await self._dead_letter(leftovers, "shutdown")
+        await asyncio.gather(*self._spills, return_exceptions=True)
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # -- producer side ----------------------------------------------------
+
+    def enqueue(self, payload: dict) -> bool:
+        """Queue one scroll payload; returns False if it had to be spilled"""
+        try:
+            self._ensure_queue().put_nowait(payload)
+        except asyncio.QueueFull:
+            self._spill_soon([payload], "queue_full")
+            return False
+        self.metrics["enqueued"] += 1
+        return True
+
+    def enqueue_many(self, payloads: List[dict]) -> int:
+        return sum(self.enqueue(payload) for payload in payloads)
+
+    # -- consumer side ----------------------------------------------------
+
+    async def _next_batch(self) -> List[dict]:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            remaining = deadline - loop.time()
+            if len(batch) >= self.batch_size or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flush_loop(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                logger.error(f"❌ VaultMesh sync failed for {len(batch)} scrolls: {e}")
+                self.metrics["failed_batches"] += 1
+                await self._dead_letter(batch, str(e))
+            else:
+                self.metrics["synced"] += len(batch)
+                if self.on_synced:
+                    self.on_synced(len(batch))
+                logger.info(f"🧬 VaultMesh sync complete for {len(batch)} scrolls")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _post(self, batch: List[dict]):
+        if self._session is None:
+            # Simulate VaultMesh sync (no VAULTMESH_SYNC_URL configured)
+            await asyncio.sleep(0.1)
+            return
+        import aiohttp
+        async with self._session.post(self.endpoint, json={"scrolls": batch}) as response:
+            if response.status == 429 or response.status >= 500:
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history,
+                    status=response.status, message=response.reason or ""
+                )
+            if response.status >= 400:
+                raise VaultMeshRejected(f"VaultMesh rejected batch: HTTP {response.status}")
+
+    async def _deliver(self, batch: List[dict]):
+        attempt = 0
+        while True:
+            self.metrics["batches_sent"] += 1
+            try:
+                with stage_timer("vaultmesh_sync"):
+                    await self._post(batch)
+                return
+            except VaultMeshRejected:
+                raise
+            except self._retryable as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_base * (2 ** attempt) * (0.5 + random.random())
+                attempt += 1
+                self.metrics["retries"] += 1
+                logger.warning(f"⚠️ VaultMesh sync retry {attempt}/{self.max_retries} in {delay:.2f}s: {e}")
+                await asyncio.sleep(delay)
+
+    # -- dead letters -----------------------------------------------------
+
+    def _write_dead_letters(self, payloads: List[dict], reason: str):
+        lines = "".join(json.dumps({"reason": reason, "scroll": payload}, default=str) + "\n" for payload in payloads)
+        with self._spill_lock, open(self.dead_letter_path, "a") as f:
+            f.write(lines)
+
+    async def _dead_letter(self, payloads: List[dict], reason: str):
+        if not payloads:
+            return
+        await asyncio.to_thread(self._write_dead_letters, payloads, reason)
+        self.metrics["dead_lettered"] += len(payloads)
+
+    def _spill_soon(self, payloads: List[dict], reason: str):
+        """Dead-letter from synchronous code: a tracked task when a loop runs, inline otherwise"""
+        try:
+            task = asyncio.get_running_loop().create_task(self._dead_letter(payloads, reason))
+        except RuntimeError:
+            self._write_dead_letters(payloads, reason)
+            self.metrics["dead_lettered"] += len(payloads)
+            return
+        self._spills.add(task)
+        task.add_done_callback(self._spills.discard)
+
+    def _take_dead_letters(self) -> List[dict]:
+        # Renamed under the lock first, so spills written meanwhile start a new file
+        claimed = f"{self.dead_letter_path}.replay"
+        with self._spill_lock:
+            try:
+                os.replace(self.dead_letter_path, claimed)
+            except FileNotFoundError:
+                return []
+        with open(claimed) as f:
+            scrolls = [json.loads(line)["scroll"] for line in f if line.strip()]
+        os.remove(claimed)
+        return scrolls
+
+    async def replay_dead_letters(self) -> int:
+        """Re-queue every dead-lettered scroll and truncate the spill file"""
+        return self.enqueue_many(await asyncio.to_thread(self._take_dead_letters))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint or "simulated",
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self.max_queue,
+            **self.metrics
+        }
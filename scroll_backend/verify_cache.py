@@ -0,0 +1,75 @@
+"""
+FAA.zone™ Verified Signature Cache
+Bounded LRU/TTL memo of scroll signature verification results
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import hashlib
+import os
+import threading
+import time
+
+
+class VerifiedSignatureCache:
+    """Remembers verify results keyed by digest(canonical message, signature, kid).
+
+    Both valid and invalid outcomes are cached: for a fixed key they are
+    deterministic. Entries expire after ``ttl`` seconds, the least recently
+    used entry is evicted past ``max_entries``, and ``clear`` is wired to
+    key rotation by the crypto executor.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries or int(os.getenv("SCROLL_VERIFY_CACHE_SIZE", "10000"))
+        self.ttl = ttl if ttl is not None else float(os.getenv("SCROLL_VERIFY_CACHE_TTL", "300"))
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def cache_key(message: bytes, signature: str, kid: str) -> bytes:
+        digest = hashlib.sha256(message)
+        digest.update(b"\x00")
+        digest.update(signature.encode())
+        digest.update(b"\x00")
+        digest.update(kid.encode())
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: bytes, valid: bool):
+        with self._lock:
+            self._entries[key] = (valid, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self, *_):
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
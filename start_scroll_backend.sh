@@ -1,5 +1,14 @@
 #!/bin/bash
 # FAA.zone™ SCROLL BACKEND STARTUP SCRIPT
+#
+# Usage: ./start_scroll_backend.sh [dev|prod]
+#   dev   (default) one process with autoreload
+#   prod  SCROLL_WORKERS uvicorn workers (default: one per core). Keys, the
+#         scroll store and VaultMesh counters are shared on disk, and one
+#         worker is elected to emit the scroll pulse. Each worker pre-warms
+#         before /ready turns 200; /health stays a pure liveness check.
+
+MODE="${1:-${SCROLL_MODE:-dev}}"
 
 echo "🚀 Starting FAA.zone™ Python Scroll Backend..."
 echo "🧬 VaultMesh integration with cryptographic validation"
@@ -8,17 +17,27 @@ echo "📜 ClaimRoot licensing and TreatySync processing"
 # Kill any existing Python backend processes
 pkill -f "python3 main.py"
 
+if [ "$MODE" = "prod" ]; then
+    export SCROLL_WORKERS="${SCROLL_WORKERS:-$(nproc 2>/dev/null || echo 2)}"
+    export SCROLL_RELOAD=0
+    # Warm keys, crypto pool, token ring and DNS before /ready reports 200
+    export SCROLL_PREWARM="${SCROLL_PREWARM:-1}"
+    echo "🏭 Production mode: $SCROLL_WORKERS workers, pulse leader elected via ${SCROLL_SHARED_DIR:-.scroll-shared}/pulse.leader"
+else
+    export SCROLL_WORKERS=1
+fi
+
 # Start Python FastAPI backend on port 3000
 python3 main.py &
 PYTHON_PID=$!
 
-echo "✅ Python Scroll Backend started on port 3000 (PID: $PYTHON_PID)"
+echo "✅ Python Scroll Backend started on port ${SCROLL_PORT:-3000} (PID: $PYTHON_PID)"
 echo "🌍 VOORWAARD MARS planetary motion protocol active"
 echo "🔗 Backend endpoints:"
-echo "   - http://localhost:3000/api/treaty-sync/intake"
-echo "   - http://localhost:3000/api/claimroot/generate"
-echo "   - http://localhost:3000/api/vaultmesh/status"
-echo "   - http://localhost:3000/api/scroll/pulse"
+echo "   - http://localhost:${SCROLL_PORT:-3000}/api/treaty-sync/intake"
+echo "   - http://localhost:${SCROLL_PORT:-3000}/api/claimroot/generate"
+echo "   - http://localhost:${SCROLL_PORT:-3000}/api/vaultmesh/status"
+echo "   - http://localhost:${SCROLL_PORT:-3000}/api/scroll/pulse"
 
 # Keep script running
-wait $PYTHON_PID
\ No newline at end of file
+wait $PYTHON_PID